@@ -3,16 +3,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .component_api import ComponentApi
-from .const import DOMAIN, LOGGER
-from .hass_util import check_supress_config_update_listener
+from .component_state import ComponentState
+from .const import (
+    CONF_IS_ON_LEGACY,
+    CONF_READ_GLOBAL,
+    CONF_READ_REGIONAL,
+    CONF_UPDATED_AT_GLOBAL,
+    CONF_UPDATED_AT_REGIONAL,
+    DOMAIN,
+    DOMAIN_NAME,
+    HOT_APPLY_OPTIONS,
+    IssueType,
+)
+from .issues_hub import IssuesHub, async_get_issues_hub
 
 
 # ------------------------------------------------------------------
@@ -33,30 +45,29 @@ type CommonConfigEntry = ConfigEntry[CommonData]
 async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
     """Set up Hiper driftsstatus DK from a config entry."""
 
-    coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
-        hass,
-        LOGGER,
-        name=DOMAIN,
-    )
+    hub: IssuesHub = async_get_issues_hub(hass, IssuesHub.ISSUES_URL)
 
     component_api: ComponentApi = ComponentApi(
         hass,
-        coordinator,
+        hub,
         entry,
-        async_get_clientsession(hass),
     )
+    await component_api.state.async_load()
 
     entry.async_on_unload(entry.add_update_listener(config_update_listener))
+    entry.async_on_unload(component_api.cancel_pulses)
     entry.runtime_data = CommonData(
         component_api=component_api,
-        coordinator=coordinator,
+        coordinator=hub.coordinator,
     )
 
     await hass.config_entries.async_forward_entry_setups(
         entry, [Platform.BINARY_SENSOR]
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Restores the last known issues, the first refresh runs in the background
+    await hub.async_start()
+    await hub.async_subscribe(component_api)
 
     return True
 
@@ -64,10 +75,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
 # ------------------------------------------------------------------
 async def async_unload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(
+    unload_ok: bool = await hass.config_entries.async_unload_platforms(
         entry, [Platform.BINARY_SENSOR]
     )
 
+    if unload_ok:
+        component_api: ComponentApi = entry.runtime_data.component_api
+        await component_api.hub.async_unsubscribe(entry.entry_id)
+
+        # The next setup reads the store, so a delayed save can't be left
+        # pending in this instance
+        await component_api.state.async_flush()
+
+    return unload_ok
+
+
+# ------------------------------------------------------------------
+async def async_remove_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
+    """Remove the persisted state of a removed config entry.
+
+    The entry is unloaded first, which flushed and cancelled its delayed
+    save, so nothing writes the store again after it is removed.
+    """
+    await ComponentState(hass, entry.entry_id).async_remove_settings()
+
 
 # ------------------------------------------------------------------
 async def async_reload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
@@ -77,18 +108,82 @@ async def async_reload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> N
 
 
 # ------------------------------------------------------------------
-@check_supress_config_update_listener()
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate config entry.
+
+    1.1 -> 1.2: Entities and device are keyed by config entry, so several
+    entries can be loaded at the same time.
+    1.2 -> 1.3: Seen/read state is moved from the config entry to its own
+    store.
+    """
+
+    if entry.version == 1 and entry.minor_version < 2:
+        # ------------------------------------------------------------------
+        @callback
+        def migrate_unique_id(entity_entry: er.RegistryEntry) -> dict[str, Any] | None:
+            if entity_entry.unique_id in (IssueType.GENEREL, IssueType.REGIONAL):
+                return {"new_unique_id": f"{entry.entry_id}_{entity_entry.unique_id}"}
+            return None
+
+        await er.async_migrate_entries(hass, entry.entry_id, migrate_unique_id)
+
+        device_registry: dr.DeviceRegistry = dr.async_get(hass)
+
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, DOMAIN_NAME)}
+        ):
+            device_registry.async_update_device(
+                device.id, new_identifiers={(DOMAIN, entry.entry_id)}
+            )
+
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+
+    if entry.version == 1 and entry.minor_version < 3:
+        state: ComponentState = ComponentState(hass, entry.entry_id)
+        state.updated_at_regional = entry.options.get(CONF_UPDATED_AT_REGIONAL, "")
+        state.read_regional = entry.options.get(CONF_READ_REGIONAL, False)
+        state.updated_at_global = entry.options.get(CONF_UPDATED_AT_GLOBAL, "")
+        state.read_global = entry.options.get(CONF_READ_GLOBAL, False)
+        await state.async_write_settings()
+
+        tmp_options: dict[str, Any] = {
+            key: value
+            for key, value in entry.options.items()
+            if key
+            not in (
+                CONF_UPDATED_AT_REGIONAL,
+                CONF_READ_REGIONAL,
+                CONF_UPDATED_AT_GLOBAL,
+                CONF_READ_GLOBAL,
+                CONF_IS_ON_LEGACY,
+            )
+        }
+        hass.config_entries.async_update_entry(
+            entry, data=tmp_options, options=tmp_options, minor_version=3
+        )
+
+    return True
+
+
+# ------------------------------------------------------------------
 async def config_update_listener(
     hass: HomeAssistant,
     config_entry: CommonConfigEntry,
 ) -> None:
-    """Reload on config entry update."""
+    """Apply options on config entry update.
+
+    Region, filter and poll interval changes are applied in place, anything
+    else reloads the config entry.
+    """
+
+    component_api: ComponentApi = config_entry.runtime_data.component_api
+    changed_options: set[str] = component_api.changed_options(config_entry.options)
+
+    if len(changed_options) == 0:
+        return
 
-    # hmm: bool = hasattr(config_entry.runtime_data, "component_api")
-    # dd = getattr(config_entry.runtime_data, "component_api")
-    # hmm: bool = hasattr(dd, "_supress_update_listener")
+    if changed_options <= HOT_APPLY_OPTIONS:
+        await component_api.async_hot_apply_options(config_entry.options)
+        return
 
-    # if config_entry.runtime_data.component_api._supress_update_listener:
-    #     config_entry.runtime_data.component_api._supress_update_listener = False
-    #     return
     await hass.config_entries.async_reload(config_entry.entry_id)
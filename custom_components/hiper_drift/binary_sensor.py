@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import partial
+from typing import Any
+
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant
@@ -9,9 +13,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import CommonConfigEntry
 from .component_api import ComponentApi, IssueItem
-from .const import TRANSLATION_KEY, IssueType
+from .const import CONF_ISSUE_ENTITIES, TRANSLATION_KEY, IssueType
 from .entity import ComponentEntity
-from .hass_util import object_to_state_attr_dict
+from .issue_entities import (
+    IssueEntityManager,
+    async_purge_issue_entities,
+    issue_unique_id_prefix,
+)
 
 
 # ------------------------------------------------------
@@ -29,6 +37,20 @@ async def async_setup_entry(
 
     async_add_entities(sensors)
 
+    component_api: ComponentApi = entry.runtime_data.component_api
+
+    if entry.options.get(CONF_ISSUE_ENTITIES, False):
+        component_api.issue_entities = IssueEntityManager(
+            hass,
+            entry,
+            component_api,
+            async_add_entities,
+            partial(HiperActiveIssueBinarySensor, hass, entry),
+        )
+        entry.async_on_unload(component_api.issue_entities.async_shutdown)
+    else:
+        async_purge_issue_entities(hass, entry)
+
 
 # ------------------------------------------------------
 # ------------------------------------------------------
@@ -48,8 +70,6 @@ class HiperIssueBinarySensor(ComponentEntity, BinarySensorEntity):
         super().__init__(entry.runtime_data.coordinator, entry)
         self.hass: HomeAssistant = hass
 
-        self.component_api: ComponentApi = entry.runtime_data.component_api
-
         if issue_type == IssueType.REGIONAL:
             self.component_api.async_write_ha_state_regional = self.async_write_ha_state
         else:
@@ -57,10 +77,9 @@ class HiperIssueBinarySensor(ComponentEntity, BinarySensorEntity):
 
         self.issue_type: IssueType = issue_type
         self._name = str(issue_type)
-        self._unique_id = str(issue_type)
+        self._unique_id = f"{entry.entry_id}_{issue_type}"
 
         self.translation_key = TRANSLATION_KEY
-        self.dummy_attr = object_to_state_attr_dict(IssueItem())
 
     # ------------------------------------------------------
     @property
@@ -78,40 +97,43 @@ class HiperIssueBinarySensor(ComponentEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         """Get the state."""
 
+        if self.issue_type in self.component_api.pulse_off:
+            return False
+
         if self.issue_type == IssueType.REGIONAL:
             if (
                 self.component_api.latest_issue_regional is None
-                or self.component_api.read_regional
+                or self.component_api.state.read_regional
             ):
                 return False
-            return self.component_api.is_on_regional
+            return self.component_api.state.is_on_regional
 
         if (
             self.component_api.latest_issue_general is None
-            or self.component_api.read_global
+            or self.component_api.state.read_global
         ):
             return False
-        return self.component_api.is_on_general
+        return self.component_api.state.is_on_general
 
     # ------------------------------------------------------
     @property
-    def extra_state_attributes(self) -> dict:
-        """Extra state attributes.
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Extra state attributes, cached per issue version.
 
         Returns:
-            dict: Extra state attributes
+            Mapping[str, Any]: Extra state attributes
 
         """
 
         if self.issue_type == IssueType.REGIONAL:
-            if not self.component_api.is_on_regional:
-                return self.dummy_attr
-            return object_to_state_attr_dict(self.component_api.latest_issue_regional)
+            if not self.component_api.state.is_on_regional:
+                return self.EMPTY_ATTRIBUTES
+            return self.issue_attributes(self.component_api.latest_issue_regional)
 
-        if not self.component_api.is_on_general:
-            return self.dummy_attr
+        if not self.component_api.state.is_on_general:
+            return self.EMPTY_ATTRIBUTES
 
-        return object_to_state_attr_dict(self.component_api.latest_issue_general)
+        return self.issue_attributes(self.component_api.latest_issue_general)
 
     # ------------------------------------------------------
     @property
@@ -141,9 +163,71 @@ class HiperIssueBinarySensor(ComponentEntity, BinarySensorEntity):
         """Update the entity. Only used by the generic entity update service."""
         await self.coordinator.async_request_refresh()
 
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class HiperActiveIssueBinarySensor(ComponentEntity, BinarySensorEntity):
+    """Binary sensor of one active issue.
+
+    Created and removed by IssueEntityManager. On while the issue is
+    active, off once resolved until the entity is removed.
+    """
+
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
     # ------------------------------------------------------
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+        issue_type: IssueType,
+        slug: str,
+        issue: IssueItem,
+    ) -> None:
+        """Hiper active issue sensor."""
+        super().__init__(entry.runtime_data.coordinator, entry)
+        self.hass: HomeAssistant = hass
+
+        self.issue_type: IssueType = issue_type
+        self.issue: IssueItem = issue
+        self.active: bool = True
+        self._unique_id = f"{issue_unique_id_prefix(entry)}{slug}"
+
+        self.translation_key = TRANSLATION_KEY
+
+    # ------------------------------------------------------
+    def set_issue(self, issue: IssueItem, active: bool) -> None:
+        """Set the issue, written on the next coordinator update."""
+
+        self.issue = issue
+        self.active = active
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name."""
+        return self.issue.subject or str(self.issue_type)
+
+    # ------------------------------------------------------
+    @property
+    def is_on(self) -> bool:
+        """Get the state."""
+        return self.active
+
+    # ------------------------------------------------------
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Extra state attributes, cached per issue version."""
+        return self.issue_attributes(self.issue)
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id."""
+        return self._unique_id
+
+    # ------------------------------------------------------
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success
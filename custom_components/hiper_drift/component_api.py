@@ -1,39 +1,45 @@
 """Component api for Hiper drift."""
 
-from asyncio import sleep as asyncio_sleep, timeout
-from dataclasses import dataclass
-from datetime import timedelta
-from enum import IntEnum
-from re import IGNORECASE, Pattern, compile, escape
-from typing import Any
+from __future__ import annotations
 
-from aiohttp.client import ClientSession
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from enum import IntEnum
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
-    CONF_IS_ON_GENERAL,
-    CONF_IS_ON_REGIONAL,
     CONF_MATCH_CASE,
+    CONF_MATCH_EXPRESSION,
     CONF_MATCH_LIST,
     CONF_MATCH_WORD,
-    CONF_READ_GLOBAL,
-    CONF_READ_REGIONAL,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_POLL_INTERVAL_MIN,
+    CONF_PULSE_LENGTH,
     CONF_REGION,
-    CONF_UPDATED_AT_GLOBAL,
-    CONF_UPDATED_AT_REGIONAL,
-    DOMAIN,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEFAULT_PULSE_LENGTH,
     LOGGER,
     IssueType,
 )
-from .hass_util import (
-    DictToObject,
-    JsonExt,
-    handle_retries,
-    set_supress_config_update_listener,
-)
+from .component_state import ComponentState
+from .hass_util import DataclassDecoder, JsonExt
+from .match_expression import MatchExpression
+from .text_normalize import NormalizedText
+from .word_matcher import WordMatcher
+
+if TYPE_CHECKING:
+    from .entity import ComponentEntity
+    from .issue_entities import IssueEntityManager
+    from .issues_diff import IssueChangeSet
+    from .issues_hub import IssuesHub
 
 
 # ------------------------------------------------------------------
@@ -59,49 +65,98 @@ class RegionWebAdresse(IntEnum):
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class MessageItem:
     """message item."""
 
-    def __init__(self) -> None:
-        """Init."""
-        self.created_at: str | None = ""
-        self.message: str | None = ""
+    created_at: str | datetime | None = ""
+    message: str | None = ""
 
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class IssueItem:
     """Issue item."""
 
-    def __init__(self) -> None:
-        """Init."""
-        self.subject: str | None = ""
-        self.created_dtm: str | None = ""
-        self.area: str | None = ""
-        self.eta: str | None = ""
-        self.region: str | None = ""
-        self.region_id: int | None = 0
-        self.is_unfolded: bool | None = False
-        self.is_pinned: bool | None = False
-        self.updated_at: str | None = ""
-        self.finished_at: str | None = ""
-        self.status: str | None = ""
-        self.messages: list[MessageItem] | None = []
-
-        self.text: str | None = ""
-        self.markdown: str | None = ""
-
-
-class HiperIssues(JsonExt, DictToObject):
+    subject: str | None = ""
+    created_dtm: str | datetime | None = ""
+    area: str | None = ""
+    eta: str | datetime | None = ""
+    region: str | None = ""
+    region_id: int | None = 0
+    is_unfolded: bool | None = False
+    is_pinned: bool | None = False
+    updated_at: str | datetime | None = ""
+    finished_at: str | datetime | None = ""
+    status: str | None = ""
+    messages: list[MessageItem] | None = field(default_factory=list)
+    id: int | str | None = None
+
+    text: str | None = ""
+    markdown: str | None = ""
+
+
+# ------------------------------------------------------------------
+def issue_match_text(issue: IssueItem) -> str:
+    """Return the text the match list and expression are matched against."""
+    return f"{issue.subject or ''} {issue.area or ''}"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class IndexedIssue:
+    """Issue with its precomputed match text."""
+
+    issue: IssueItem
+    match_text: str
+    normalized: NormalizedText
+    normalized_cased: NormalizedText | None = None
+
+    # ------------------------------------------------------------------
+    def get_normalized(self, case_sensitive: bool) -> NormalizedText:
+        """Return the normalized match text.
+
+        The case folded one is precomputed, the case sensitive one is only
+        created if a subscriber matches case.
+        """
+
+        if not case_sensitive:
+            return self.normalized
+
+        if self.normalized_cased is None:
+            self.normalized_cased = NormalizedText.create(self.match_text, True)
+
+        return self.normalized_cased
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class HiperIssues(JsonExt):
     """Hiper issues."""
 
-    def __init__(self, tmp_json: str | None = None) -> None:
+    DATETIME_FIELDS: ClassVar[set[str]] = {
+        "created_dtm",
+        "created_at",
+        "updated_at",
+        "finished_at",
+        "eta",
+    }
+    # Feed fields of an issue, without the derived text and markdown
+    SNAPSHOT_FIELDS: ClassVar[tuple[str, ...]] = tuple(
+        tmp_field.name
+        for tmp_field in fields(IssueItem)
+        if tmp_field.name not in ("text", "markdown")
+    )
+
+    def __init__(self, tmp_json: str | bytes | bytearray | None = None) -> None:
         """Init."""
         self.globals: list[IssueItem] = []
         self.regionals: list[IssueItem] = []
         self.finisheds: list[IssueItem] = []
+
+        self.regionals_by_region: dict[int, list[IndexedIssue]] = {}
         super().__init__()
 
         if tmp_json is None:
@@ -109,153 +164,303 @@ class HiperIssues(JsonExt, DictToObject):
 
         self.reload(tmp_json)
 
-    def reload(self, tmp_json: str) -> None:
-        """Reload."""
+    def reload(self, tmp_json: str | bytes | bytearray) -> bool:
+        """Reload.
+
+        Returns False, and keeps the previous issues, if the payload can't be
+        parsed.
+        """
         try:
-            self.dict_to_object(
-                self.json_str_to_dict(
-                    tmp_json,
-                    {
-                        "global": "globals",
-                        "regional": "regionals",
-                        "finished": "finisheds",
-                    },
-                )
+            tmp_dict: dict = self.json_str_to_dict(
+                tmp_json, datetime_fields=self.DATETIME_FIELDS
             )
+        except ValueError as exp:
+            LOGGER.error("Error reloading Hiper issues: %s", exp)
+            return False
+
+        return self.load_records(tmp_dict)
+
+    # ------------------------------------------------------------------
+    def restore(self, records: dict[str, list[dict[str, Any]]]) -> bool:
+        """Restore the issues from snapshot_records, stored as json."""
+
+        self.decode_datetimes(records, self.DATETIME_FIELDS)
+        return self.load_records(records)
+
+    # ------------------------------------------------------------------
+    def load_records(self, tmp_dict: dict) -> bool:
+        """Decode the feed records, with datetimes already converted.
+
+        Returns False, and keeps the previous issues, if they can't be decoded.
+        """
+        try:
+            decoder: DataclassDecoder = DataclassDecoder.get(IssueItem)
+
+            globals_: list[IssueItem] = decoder.decode_list(tmp_dict.get("global"))
+            regionals: list[IssueItem] = decoder.decode_list(tmp_dict.get("regional"))
+            finisheds: list[IssueItem] = decoder.decode_list(tmp_dict.get("finished"))
         except Exception as exp:  # noqa: BLE001
             LOGGER.error("Error reloading Hiper issues: %s", exp)
+            return False
+
+        self.globals = globals_
+        self.regionals = regionals
+        self.finisheds = finisheds
+        self.build_indexes()
+        return True
+
+    # ------------------------------------------------------------------
+    def snapshot_records(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the active issues as records for IssuesSnapshot.
+
+        Finished issues are left out. They are only used to report how an
+        issue resolved, and come with the next changed payload.
+        """
+
+        return {
+            "global": [self._snapshot_record(issue) for issue in self.globals],
+            "regional": [self._snapshot_record(issue) for issue in self.regionals],
+        }
+
+    # ------------------------------------------------------------------
+    def _snapshot_record(self, issue: IssueItem) -> dict[str, Any]:
+        """Return the feed fields of an issue."""
+        return {name: getattr(issue, name) for name in self.SNAPSHOT_FIELDS}
+
+    # ------------------------------------------------------------------
+    def build_indexes(self) -> None:
+        """Build the region index, once per reload.
+
+        Regional issues are the only ones looked up by key. Nothing looks
+        issues up by recency or by pinned/unfolded status, and the sensors
+        read the first match in feed order, so no index is kept for those.
+        """
+
+        self.regionals_by_region = {}
+
+        for issue in self.regionals:
+            match_text: str = issue_match_text(issue)
+            self.regionals_by_region.setdefault(issue.region_id, []).append(
+                IndexedIssue(issue, match_text, NormalizedText.create(match_text))
+            )
+
+    # ------------------------------------------------------------------
+    def region_issues(self, region_id: int) -> list[IndexedIssue]:
+        """Return regional issues of a region in feed order."""
+        return self.regionals_by_region.get(region_id, [])
 
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
 class ComponentApi:
-    """Hiper interface."""
+    """Hiper interface.
 
-    ISSUES_URL: str = "https://drift-api.hiper.dk/issues"
+    One per config entry, subscribed to the shared IssuesHub.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
-        coordinator: DataUpdateCoordinator,
+        hub: IssuesHub,
         entry: ConfigEntry,
-        session: ClientSession | None,
     ) -> None:
         """Hiper api."""
 
         self.hass: HomeAssistant = hass
-        self.coordinator: DataUpdateCoordinator = coordinator
+        self.hub: IssuesHub = hub
+        self.coordinator: DataUpdateCoordinator = hub.coordinator
         self.entry: ConfigEntry = entry
-        self.session: ClientSession | None = session
 
-        self.issues: HiperIssues = HiperIssues()
+        self.state: ComponentState = ComponentState(hass, entry.entry_id)
+
         self.latest_issue_general: IssueItem = IssueItem()
-        self.is_on_general: bool = entry.options.get(CONF_IS_ON_GENERAL, False)
         self.latest_issue_regional: IssueItem = IssueItem()
-        self.is_on_regional: bool = entry.options.get(CONF_IS_ON_REGIONAL, False)
 
-        self.region: str = entry.options[CONF_REGION]
-        self.region_num: int = int(self.region[-1])
-        self.region_url: str = RegionWebAdresse(self.region_num).url()
+        self.async_write_ha_state_general = None
+        self.async_write_ha_state_regional = None
 
-        self.updated_at_regional: str = entry.options.get(CONF_UPDATED_AT_REGIONAL, "")
-        self.read_regional: bool = entry.options.get(CONF_READ_REGIONAL, False)
-        self.updated_at_global: str = entry.options.get(CONF_UPDATED_AT_GLOBAL, "")
-        self.read_global: bool = entry.options.get(CONF_READ_GLOBAL, False)
+        # Sensors shown off while a re-trigger pulse is running
+        self.pulse_off: set[IssueType] = set()
+        self._unsub_pulse: dict[IssueType, CALLBACK_TYPE] = {}
 
-        self.request_timeout: int = 5
-        self.close_session: bool = False
+        self.matched_words_regional: list[str] = []
+        # Entities by unique id, while added to hass
+        self.entities: dict[str, ComponentEntity] = {}
+        # Set by the binary sensor platform if per issue entities are on
+        self.issue_entities: IssueEntityManager | None = None
+        self.apply_options(entry.options)
 
-        self.coordinator.update_interval = timedelta(minutes=15)
-        self.coordinator.update_method = self.async_update
-        self.async_write_ha_state_general = None
-        self.async_write_ha_state_regional = None
+    # ------------------------------------------------------------------
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply region, filter and poll interval options."""
 
-        """Setup the actions for the Hiper integration."""
-        hass.services.async_register(DOMAIN, "update", self.async_update_service)
-        hass.services.async_register(
-            DOMAIN, "markasread", self.async_mark_as_read_service
+        self.options: dict[str, Any] = dict(options)
+
+        self.region: str = options[CONF_REGION]
+        self.region_num: int = int(self.region[-1])
+        self.region_url: str = RegionWebAdresse(self.region_num).url()
+
+        self.poll_interval_min: timedelta = timedelta(
+            minutes=options.get(CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN)
+        )
+        self.poll_interval_max: timedelta = timedelta(
+            minutes=options.get(CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX)
         )
 
-        self.regex_comp: Pattern | None = self.compile_all_words_regex(
-            entry.options.get(CONF_MATCH_LIST),
-            entry.options.get(CONF_MATCH_WORD, False),
-            entry.options.get(CONF_MATCH_CASE, False),
+        self.pulse_length: float = options.get(CONF_PULSE_LENGTH, DEFAULT_PULSE_LENGTH)
+
+        self.match_case: bool = options.get(CONF_MATCH_CASE, False)
+        self.word_matcher: WordMatcher | None = WordMatcher.compile(
+            options.get(CONF_MATCH_LIST),
+            options.get(CONF_MATCH_WORD, False),
+            self.match_case,
+        )
+        # Validated by the config flow
+        self.match_expression: MatchExpression | None = MatchExpression.compile(
+            options.get(CONF_MATCH_EXPRESSION),
+            options.get(CONF_MATCH_WORD, False),
+            self.match_case,
         )
 
     # ------------------------------------------------------------------
-    def compile_all_words_regex(
-        self,
-        words: list[str],
-        use_word_boundaries: bool = True,
-        case_sensitive: bool = False,
-    ) -> Pattern[str] | None:
-        r"""Return a compiled regex pattern that matches if ALL words in the list are present in a text.
+    def changed_options(self, options: Mapping[str, Any]) -> set[str]:
+        """Return the keys of options that differ from the applied options."""
 
-        - words: A list of words to match.
-        - use_word_boundaries: If True, only matches whole words.
-        - case_sensitive: If False, matches regardless of letter case.
-        regex : ^(?=.*\btest\b)(?=.*\bregex\b)(?=.*\bstrenge\b).*
+        return {
+            key
+            for key in self.options.keys() | options.keys()
+            if self.options.get(key) != options.get(key)
+        }
 
+    # ------------------------------------------------------------------
+    async def async_hot_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options in place.
+
+        The matchers are recompiled and the already parsed issues are
+        evaluated again, without a reload or a network fetch.
         """
 
-        if len(words) == 0:
-            return None
+        self.apply_options(options)
+        self.hub.update_poll_bounds()
 
-        lookaheads: list[str] = []
+        if self.hub.issues_loaded:
+            await self.async_check_regional(self.hub.issues)
+            self.state.delay_save()
 
-        for word in words:
-            if word.strip() != "":
-                if use_word_boundaries:
-                    pattern = rf"(?=.*\b{escape(word)}\b)"
-                else:
-                    pattern = rf"(?=.*{escape(word)})"
-                lookaheads.append(pattern)
-        combined_pattern: str = "^" + "".join(lookaheads) + ".*"
-        flags: int = 0 if case_sensitive else IGNORECASE
-        return compile(combined_pattern, flags)
+            if self.issue_entities is not None:
+                self.issue_entities.reconcile(self.hub.issues)
+
+        self.coordinator.async_update_listeners()
 
     # ------------------------------------------------------------------
-    async def async_mark_as_read_service(self, call: ServiceCall) -> None:
-        """Hiper service interface."""
-        self.read_global = True
-        self.read_regional = True
+    def is_match(self, text: str | NormalizedText) -> bool:
+        """Return True if text matches both the match list and expression."""
 
-        await self.async_update_config()
-        await self.coordinator.async_request_refresh()
+        return (self.word_matcher is None or self.word_matcher.match(text)) and (
+            self.match_expression is None or self.match_expression.evaluate(text)
+        )
 
     # ------------------------------------------------------------------
-    async def async_update_service(self, call: ServiceCall) -> None:
-        """Hiper service interface."""
-        self.updated_at_global = ""
-        self.read_global = False
-        self.updated_at_regional = ""
-        self.read_regional = False
+    def is_relevant(self, issue_type: IssueType, issue: IssueItem) -> bool:
+        """Return True if an issue is shown by this entry.
 
-        await self.async_update_config()
+        General issues always are, regional issues if they are in the region
+        and match the filters.
+        """
+
+        if issue_type == IssueType.GENEREL:
+            return True
 
-        await self.async_update()
-        await self.coordinator.async_request_refresh()
+        return issue.region_id == self.region_num and self.is_match(
+            NormalizedText.create(issue_match_text(issue), self.match_case)
+        )
 
     # ------------------------------------------------------------------
-    async def async_update(self) -> None:
-        """Hiper interface."""
+    def find_matched_words(self, text: str | NormalizedText) -> list[str]:
+        """Return the match list words and expression terms found in text."""
 
-        if self.session is None:
-            self.session = ClientSession()
-            self.close_session = True
+        matched_words: list[str] = []
 
-        await self.async_check_hiper()
+        if self.word_matcher is not None:
+            matched_words.extend(self.word_matcher.find(text))
 
-        if self.session and self.close_session:
-            await self.session.close()
+        if self.match_expression is not None:
+            matched_words.extend(self.match_expression.find(text))
 
-    # ------------------------------------------------------
-    @handle_retries(retries=5, retry_delay=5)
-    async def _async_get_issues(self) -> str:
-        async with timeout(self.request_timeout):
-            response = await self.session.get(self.ISSUES_URL)
+        return matched_words
 
-        return await response.text()
+    # ------------------------------------------------------------------
+    @callback
+    def write_ha_state(self, issue_type: IssueType) -> None:
+        """Write the state of the sensor of an issue type, if it is added."""
+
+        write_ha_state = (
+            self.async_write_ha_state_general
+            if issue_type == IssueType.GENEREL
+            else self.async_write_ha_state_regional
+        )
+
+        if write_ha_state is not None:
+            write_ha_state()
+
+    # ------------------------------------------------------------------
+    @callback
+    def start_pulse(self, issue_type: IssueType) -> None:
+        """Show an on sensor as off for pulse_length seconds.
+
+        Lets automations triggering on off to on see an updated issue. The
+        pulse runs as a timed callback, so the update is not held up.
+        """
+
+        if self.pulse_length <= 0:
+            return
+
+        if (unsub := self._unsub_pulse.pop(issue_type, None)) is not None:
+            unsub()
+
+        self.pulse_off.add(issue_type)
+        self.write_ha_state(issue_type)
+        self._unsub_pulse[issue_type] = async_call_later(
+            self.hass, self.pulse_length, partial(self._async_end_pulse, issue_type)
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_end_pulse(self, issue_type: IssueType, _now: datetime) -> None:
+        """End a pulse, the sensor shows its state again."""
+
+        self._unsub_pulse.pop(issue_type, None)
+        self.pulse_off.discard(issue_type)
+        self.write_ha_state(issue_type)
+
+    # ------------------------------------------------------------------
+    @callback
+    def cancel_pulses(self) -> None:
+        """Cancel running pulses."""
+
+        for unsub in self._unsub_pulse.values():
+            unsub()
+
+        self._unsub_pulse.clear()
+        self.pulse_off.clear()
+
+    # ------------------------------------------------------------------
+    async def async_mark_as_read(self) -> None:
+        """Mark issues as read."""
+        self.state.read_global = True
+        self.state.read_regional = True
+
+        self.state.delay_save()
+
+    # ------------------------------------------------------------------
+    async def async_reset(self) -> None:
+        """Forget seen issues, so they are handled again on next update."""
+        self.state.updated_at_global = ""
+        self.state.read_global = False
+        self.state.updated_at_regional = ""
+        self.state.read_regional = False
+
+        self.state.delay_save()
 
     # ------------------------------------------------------
     async def async_create_issue_text(
@@ -327,70 +532,84 @@ class ComponentApi:
         )
 
     # ------------------------------------------------------
-    async def async_check_hiper(self) -> None:
-        """Check if Hiper drift."""
+    async def async_check_hiper(
+        self, issues: HiperIssues, change_set: IssueChangeSet | None = None
+    ) -> bool:
+        """Check if Hiper drift.
+
+        Only the sensors touched by the change set are checked, all of them
+        if there is no change set. Returns True if a new or updated issue was found.
+        """
+
+        issues_changed: bool = False
+
+        if change_set is None or change_set.general_changed:
+            issues_changed |= await self.async_check_general(issues)
+
+        if change_set is None or self.region_num in change_set.regions_changed:
+            issues_changed |= await self.async_check_regional(issues)
+
+        if self.issue_entities is not None:
+            self.issue_entities.reconcile(issues, change_set)
+
+        self.state.delay_save()
+        return issues_changed
+
+    # ------------------------------------------------------
+    async def async_check_general(self, issues: HiperIssues) -> bool:
+        """Check general issues."""
 
-        self.issues.reload(await self._async_get_issues())
+        issues_changed: bool = False
 
-        for item in self.issues.globals:
-            if item.updated_at != self.updated_at_global:
-                self.updated_at_global = item.updated_at
-                self.read_global = False
-                await self.async_update_config()
+        for item in issues.globals:
+            if item.updated_at != self.state.updated_at_global:
+                self.state.updated_at_global = item.updated_at
+                self.state.read_global = False
+                issues_changed = True
 
-                if self.is_on_general:
-                    self.is_on_general = False
-                    self.async_write_ha_state_general()
-                    await asyncio_sleep(5)
+                if self.state.is_on_general:
+                    self.start_pulse(IssueType.GENEREL)
 
-                self.is_on_general = True
+                self.state.is_on_general = True
 
-            if not self.read_global:
+            if not self.state.read_global:
                 await self.async_handle_general_issue(item)
 
             break
         else:
-            self.is_on_general = False
-
-        for item in self.issues.regionals:
-            if item.region_id == self.region_num and (
-                self.regex_comp is None
-                or self.regex_comp.match(item.subject + item.area)
-            ):
-                if item.updated_at != self.updated_at_regional:
-                    self.updated_at_regional = item.updated_at
-                    self.read_regional = False
-                    await self.async_update_config()
-
-                    if self.is_on_regional:
-                        self.is_on_regional = False
-                        self.async_write_ha_state_regional()
-                        await asyncio_sleep(5)
-
-                self.is_on_regional = True
-
-                if not self.read_regional:
-                    await self.async_handle_regional_issue(item)
+            self.state.is_on_general = False
 
-                break
-        else:
-            self.is_on_regional = False
+        return issues_changed
 
-    # ------------------------------------------------------------------
-    @set_supress_config_update_listener()
-    async def async_update_config(self) -> None:
-        """Update config."""
+    # ------------------------------------------------------
+    async def async_check_regional(self, issues: HiperIssues) -> bool:
+        """Check regional issues."""
 
-        tmp_options: dict[str, Any] = self.entry.options.copy()
+        issues_changed: bool = False
 
-        tmp_options[CONF_UPDATED_AT_REGIONAL] = self.updated_at_regional
-        tmp_options[CONF_READ_REGIONAL] = self.read_regional
-        tmp_options[CONF_UPDATED_AT_GLOBAL] = self.updated_at_global
-        tmp_options[CONF_READ_GLOBAL] = self.read_global
+        for indexed_issue in issues.region_issues(self.region_num):
+            normalized: NormalizedText = indexed_issue.get_normalized(self.match_case)
 
-        tmp_options[CONF_IS_ON_REGIONAL] = self.is_on_regional
-        tmp_options[CONF_IS_ON_GENERAL] = self.is_on_general
+            if self.is_match(normalized):
+                item: IssueItem = indexed_issue.issue
+                self.matched_words_regional = self.find_matched_words(normalized)
 
-        self.hass.config_entries.async_update_entry(
-            self.entry, data=tmp_options, options=tmp_options
-        )
+                if item.updated_at != self.state.updated_at_regional:
+                    self.state.updated_at_regional = item.updated_at
+                    self.state.read_regional = False
+                    issues_changed = True
+
+                    if self.state.is_on_regional:
+                        self.start_pulse(IssueType.REGIONAL)
+
+                self.state.is_on_regional = True
+
+                if not self.state.read_regional:
+                    await self.async_handle_regional_issue(item)
+
+                break
+        else:
+            self.state.is_on_regional = False
+            self.matched_words_regional = []
+
+        return issues_changed
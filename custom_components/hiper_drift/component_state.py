@@ -0,0 +1,126 @@
+"""Persisted component state for Hiper drift."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, ClassVar
+
+import orjson
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .hass_util import OrjsonCodec, StorageJson
+
+_CODEC: OrjsonCodec = OrjsonCodec()
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(init=False, eq=False)
+class ComponentState(StorageJson):
+    """Volatile state per config entry.
+
+    Kept in its own store instead of the config entry, so seen/read state
+    changes never rewrite the config entries or trigger the config entry
+    update listener. Saves are delayed and coalesced, and flushed when the
+    config entry is unloaded.
+
+    The fields below are the stored schema, written with the orjson codec.
+    """
+
+    SAVE_DELAY: ClassVar[int] = 10
+    STORAGE_VERSION: ClassVar[int] = 2
+
+    updated_at_regional: str | datetime | None = ""
+    read_regional: bool = False
+    is_on_regional: bool = False
+    updated_at_global: str | datetime | None = ""
+    read_global: bool = False
+    is_on_general: bool = False
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Init."""
+
+        super().__init__(
+            hass,
+            f"{DOMAIN}.{entry_id}",
+            version=self.STORAGE_VERSION,
+            async_migrate_func=self._migrate,
+            codec=_CODEC,
+        )
+
+        self.updated_at_regional = ""
+        self.read_regional = False
+        self.is_on_regional = False
+        self.updated_at_global = ""
+        self.read_global = False
+        self.is_on_general = False
+
+        self.saved_values___: tuple[Any, ...] | None = None
+        self.save_pending___: bool = False
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _migrate(old_major_version: int, old_minor_version: int, old_data: Any) -> Any:
+        """Migrate the version 1 jsonpickle layout to the orjson layout.
+
+        All persisted values are plain json in the jsonpickle string, so no
+        jsonpickle is needed. Other values get their default.
+        """
+
+        if old_major_version > 1 or not isinstance(old_data, dict):
+            return old_data
+
+        try:
+            pickled: Any = orjson.loads(old_data.pop("jsonpickle", "{}"))
+        except orjson.JSONDecodeError:
+            pickled = {}
+
+        if not isinstance(pickled, dict):
+            pickled = {}
+
+        # StorageJson.__getstate__ makes jsonpickle nest the values
+        if isinstance(pickled.get("py/state"), dict):
+            pickled = pickled["py/state"]
+
+        old_data[_CODEC.DICT_KEY] = {
+            name: pickled[name]
+            for name in _CODEC.field_names(ComponentState)
+            if name in pickled and not isinstance(pickled[name], dict | list)
+        }
+        return old_data
+
+    # ------------------------------------------------------------------
+    def _values(self) -> tuple[Any, ...]:
+        """Return the persisted values."""
+        return tuple(getattr(self, name) for name in _CODEC.field_names(ComponentState))
+
+    # ------------------------------------------------------------------
+    async def async_load(self) -> None:
+        """Load state."""
+
+        await self.async_read_settings()
+        self.saved_values___ = self._values()
+
+    # ------------------------------------------------------------------
+    def delay_save(self) -> None:
+        """Save state after SAVE_DELAY, if it has changed since last save."""
+
+        if (values := self._values()) == self.saved_values___:
+            return
+
+        self.saved_values___ = values
+        self.save_pending___ = True
+        self.delay_write_settings(self.SAVE_DELAY)
+
+    # ------------------------------------------------------------------
+    async def async_flush(self) -> None:
+        """Write a delayed save now, which also cancels the delayed write."""
+
+        if not self.save_pending___:
+            return
+
+        self.save_pending___ = False
+        await self.async_write_settings()
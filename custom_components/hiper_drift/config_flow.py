@@ -8,14 +8,16 @@ from typing import Any, cast
 import voluptuous as vol
 
 #  from homeassistant import config_entries
-from homeassistant.core import callback
 from homeassistant.helpers.schema_config_entry_flow import (
     SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
-    # SchemaFlowError,
+    SchemaFlowError,
     SchemaFlowFormStep,
 )
 from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
@@ -25,20 +27,26 @@ from homeassistant.helpers.selector import (
 
 from .const import (
     CONF_FYN_REGION_2,
+    CONF_ISSUE_ENTITIES,
     CONF_JYL_REGION_3,
     CONF_MATCH_CASE,
+    CONF_MATCH_EXPRESSION,
     CONF_MATCH_LIST,
     CONF_MATCH_WORD,
-    CONF_READ_GLOBAL,
-    CONF_READ_REGIONAL,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_POLL_INTERVAL_MIN,
+    CONF_PULSE_LENGTH,
     CONF_REGION,
     CONF_SJ_BH_REGION_1,
-    CONF_UPDATED_AT_GLOBAL,
-    CONF_UPDATED_AT_REGIONAL,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEFAULT_PULSE_LENGTH,
     DOMAIN,
     DOMAIN_NAME,
+    REGION_NAMES,
     TRANSLATION_KEY_REGION,
 )
+from .match_expression import MatchExpression, MatchExpressionException
 
 
 # ------------------------------------------------------------------
@@ -59,6 +67,16 @@ async def _validate_input(
     # if user_input[CONF_STREET_CHECK] and user_input[CONF_STREET].strip() == "":
     #     raise SchemaFlowError("missing_street")
 
+    if user_input.get(
+        CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN
+    ) > user_input.get(CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX):
+        raise SchemaFlowError("poll_interval_min_max")
+
+    try:
+        MatchExpression.compile(user_input.get(CONF_MATCH_EXPRESSION))
+    except MatchExpressionException as err:
+        raise SchemaFlowError("invalid_match_expression") from err
+
     return user_input
 
 
@@ -75,8 +93,41 @@ CONFIG_OPTIONS_SCHEMA = vol.Schema(
         vol.Optional(CONF_MATCH_LIST, default=[]): TextSelector(
             TextSelectorConfig(multiple=True)
         ),
+        vol.Optional(CONF_MATCH_EXPRESSION, default=""): TextSelector(),
         vol.Optional(CONF_MATCH_CASE, default=False): bool,
         vol.Optional(CONF_MATCH_WORD, default=False): bool,
+        vol.Optional(
+            CONF_POLL_INTERVAL_MIN, default=DEFAULT_POLL_INTERVAL_MIN
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=1,
+                max=60,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="min",
+            )
+        ),
+        vol.Optional(
+            CONF_POLL_INTERVAL_MAX, default=DEFAULT_POLL_INTERVAL_MAX
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=1,
+                max=240,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="min",
+            )
+        ),
+        vol.Optional(CONF_PULSE_LENGTH, default=DEFAULT_PULSE_LENGTH): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=60,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            )
+        ),
+        vol.Optional(CONF_ISSUE_ENTITIES, default=False): bool,
     }
 )
 
@@ -100,23 +151,24 @@ OPTIONS_FLOW = {
 class ConfigFlowHandler(SchemaConfigFlowHandler, domain=DOMAIN):
     """Handle a config or options flow."""
 
+    MINOR_VERSION = 3
+
     config_flow = CONFIG_FLOW
     options_flow = OPTIONS_FLOW
 
     def async_config_entry_title(self, options: Mapping[str, Any]) -> str:
         """Return config entry title."""
 
-        return cast(str, DOMAIN_NAME)
+        title: str = f"{DOMAIN_NAME} {REGION_NAMES.get(options[CONF_REGION], '')}"
+
+        match_list: list[str] = [
+            word for word in options.get(CONF_MATCH_LIST, []) if word.strip() != ""
+        ]
+
+        if options.get(CONF_MATCH_EXPRESSION, "").strip() != "":
+            match_list.append(options[CONF_MATCH_EXPRESSION].strip())
 
-    # ------------------------------------------------------------------
-    @callback
-    def async_config_flow_finished(self, options: Mapping[str, Any]) -> None:
-        """Take necessary actions after the config flow is finished, if needed.
+        if match_list:
+            title += f" ({', '.join(match_list)})"
 
-        The options parameter contains config entry options, which is the union of user
-        input from the config flow steps.
-        """
-        options[CONF_UPDATED_AT_REGIONAL] = ""
-        options[CONF_READ_REGIONAL] = False
-        options[CONF_UPDATED_AT_GLOBAL] = ""
-        options[CONF_READ_GLOBAL] = False
+        return cast(str, title.strip())
@@ -10,20 +10,54 @@ LOGGER: Logger = getLogger(__name__)
 CONF_MATCH_CASE = "match_case"
 CONF_MATCH_WORD = "match_word"
 CONF_MATCH_LIST = "match_list"
+CONF_MATCH_EXPRESSION = "match_expression"
+
+CONF_POLL_INTERVAL_MIN = "poll_interval_min"
+CONF_POLL_INTERVAL_MAX = "poll_interval_max"
+DEFAULT_POLL_INTERVAL_MIN = 2
+DEFAULT_POLL_INTERVAL_MAX = 30
+
+CONF_ISSUE_ENTITIES = "issue_entities"
+
+CONF_PULSE_LENGTH = "pulse_length"
+DEFAULT_PULSE_LENGTH = 5
 
 CONF_REGION = "region"
+
+# Options applied without reloading the config entry
+HOT_APPLY_OPTIONS: frozenset[str] = frozenset(
+    {
+        CONF_REGION,
+        CONF_MATCH_CASE,
+        CONF_MATCH_WORD,
+        CONF_MATCH_LIST,
+        CONF_MATCH_EXPRESSION,
+        CONF_POLL_INTERVAL_MIN,
+        CONF_POLL_INTERVAL_MAX,
+        CONF_PULSE_LENGTH,
+    }
+)
+
+# Legacy, state kept in the config entry before version 1.3
 CONF_UPDATED_AT_REGIONAL = "updated_at_regional"
 CONF_READ_REGIONAL = "read_regional"
-CONF_IS_ON_REGIONAL = False
 CONF_UPDATED_AT_GLOBAL = "updated_at_global"
 CONF_READ_GLOBAL = "read_global"
-CONF_IS_ON_GENERAL = False
+# The is_on state was saved under the key False, stored as "false"
+CONF_IS_ON_LEGACY = "false"
+
+EVENT_ISSUE_CHANGED = f"{DOMAIN}_issue_changed"
 
 TRANSLATION_KEY = DOMAIN
 TRANSLATION_KEY_REGION = "region"
 CONF_SJ_BH_REGION_1 = "sj_bh_1"
 CONF_FYN_REGION_2 = "fyn_2"
 CONF_JYL_REGION_3 = "jylland_3"
+REGION_NAMES: dict[str, str] = {
+    CONF_SJ_BH_REGION_1: "Sjælland og Bornholm",
+    CONF_FYN_REGION_2: "Fyn",
+    CONF_JYL_REGION_3: "Jylland",
+}
 
 
 class IssueType(StrEnum):
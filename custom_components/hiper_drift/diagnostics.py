@@ -0,0 +1,42 @@
+"""Diagnostics support for Hiper drift."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import CommonConfigEntry
+
+
+# ------------------------------------------------------------------
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: CommonConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    component_api = entry.runtime_data.component_api
+    hub = component_api.hub
+
+    return {
+        "options": dict(entry.options),
+        "matched_words_regional": component_api.matched_words_regional,
+        "match_expression": (
+            component_api.match_expression.diagnostics()
+            if component_api.match_expression is not None
+            else None
+        ),
+        "fetch": hub.fetch_diagnostics(),
+        "connection": hub.fetch_session.diagnostics(),
+        "poll_scheduler": hub.poll_scheduler.diagnostics(),
+        "circuit_breaker": hub.CIRCUIT_BREAKER.diagnostics(),
+        "issue_entities": (
+            component_api.issue_entities.diagnostics()
+            if component_api.issue_entities is not None
+            else None
+        ),
+        "entity_writes": {
+            unique_id: entity.write_diagnostics()
+            for unique_id, entity in component_api.entities.items()
+        },
+    }
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.update_coordinator import (
@@ -10,14 +15,31 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN, DOMAIN_NAME
+from .component_api import IssueItem
+from .const import DOMAIN
+from .hass_util import object_to_state_attr_dict
+
+if TYPE_CHECKING:
+    from .component_api import ComponentApi
+
+NATIVE_VALUE_MAX_LENGTH: int = 255
 
 
 class ComponentEntity(CoordinatorEntity[DataUpdateCoordinator], Entity):
-    """Defines a Hiper driftsstatus entity."""
+    """Defines a Hiper driftsstatus entity.
+
+    The attributes and the truncated value of an issue are built once per
+    issue version, and handed out as an immutable mapping. Coordinator
+    updates only write the state when state, attributes or availability
+    have changed.
+    """
 
     _attr_has_entity_name = True
 
+    EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType(
+        object_to_state_attr_dict(IssueItem())
+    )
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -27,9 +49,106 @@ class ComponentEntity(CoordinatorEntity[DataUpdateCoordinator], Entity):
         super().__init__(coordinator=coordinator)
         self._attr_device_info = DeviceInfo(
             entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, DOMAIN_NAME)},
+            identifiers={(DOMAIN, entry.entry_id)},
             manufacturer="KGN",
             suggested_area="",
             sw_version="1.1",
-            name=DOMAIN_NAME,
+            name=entry.title,
+        )
+        self.component_api: ComponentApi = entry.runtime_data.component_api
+
+        self._memo_issue: IssueItem | None = None
+        self._memo_version: tuple[Any, ...] = ()
+        self._memo_attributes: Mapping[str, Any] = self.EMPTY_ATTRIBUTES
+        self._memo_value: str | None = None
+
+        self._written_state: tuple[Any, ...] | None = None
+        self.performed_writes: int = 0
+        self.skipped_writes: int = 0
+
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+
+        await super().async_added_to_hass()
+        self.component_api.entities[self.unique_id] = self
+        self.async_on_remove(
+            lambda: self.component_api.entities.pop(self.unique_id, None)
+        )
+
+    # ------------------------------------------------------
+    def _memoize_issue(self, issue: IssueItem) -> None:
+        """Build attributes and value, if the issue or its version changed.
+
+        The text and markdown are set on the issue after it is first
+        handled, so they are part of the version.
+        """
+
+        version: tuple[Any, ...] = (issue.updated_at, issue.text, issue.markdown)
+
+        if issue is self._memo_issue and version == self._memo_version:
+            return
+
+        self._memo_issue = issue
+        self._memo_version = version
+        self._memo_attributes = MappingProxyType(object_to_state_attr_dict(issue))
+        self._memo_value = (
+            issue.text[:NATIVE_VALUE_MAX_LENGTH] if issue.text is not None else None
         )
+
+    # ------------------------------------------------------
+    def issue_attributes(self, issue: IssueItem | None) -> Mapping[str, Any]:
+        """Return the cached state attributes of an issue."""
+
+        if issue is None:
+            return self.EMPTY_ATTRIBUTES
+
+        self._memoize_issue(issue)
+        return self._memo_attributes
+
+    # ------------------------------------------------------
+    def issue_value(self, issue: IssueItem | None) -> str | None:
+        """Return the cached truncated text of an issue."""
+
+        if issue is None:
+            return None
+
+        self._memoize_issue(issue)
+        return self._memo_value
+
+    # ------------------------------------------------------
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return what a state write would write.
+
+        The attributes are cached mappings, so unchanged attributes compare
+        by identity.
+        """
+        return (self.available, self.state, self.extra_state_attributes)
+
+    # ------------------------------------------------------
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state."""
+
+        self._written_state = self._state_fingerprint()
+        self.performed_writes += 1
+        super().async_write_ha_state()
+
+    # ------------------------------------------------------
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, unless nothing has changed since the last write."""
+
+        if self._state_fingerprint() == self._written_state:
+            self.skipped_writes += 1
+            return
+
+        self.async_write_ha_state()
+
+    # ------------------------------------------------------
+    def write_diagnostics(self) -> dict[str, int]:
+        """Return state write counters."""
+        return {
+            "performed_writes": self.performed_writes,
+            "skipped_writes": self.skipped_writes,
+        }
@@ -0,0 +1,235 @@
+"""Pooled http session for Hiper drift."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsCacheHitParams,
+    TraceDnsResolveHostEndParams,
+    TraceDnsResolveHostStartParams,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+)
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.util.ssl import client_context
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class FetchSession:
+    """Long-lived, pooled http session.
+
+    Owns one connector per integration instance, so keep-alive connections
+    and resolved host names are reused between polls. Connect and
+    time-to-first-byte timings are recorded per request. The session is
+    closed when Home Assistant stops.
+    """
+
+    DNS_CACHE_TTL: int = 30 * 60
+    KEEPALIVE_TIMEOUT: float = 120.0
+    LIMIT_PER_HOST: int = 2
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self._session: ClientSession | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+        self.requests: int = 0
+        self.request_errors: int = 0
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.dns_resolves: int = 0
+        self.dns_cache_hits: int = 0
+        self.last_timings: dict[str, Any] = {}
+
+    # ------------------------------------------------------------------
+    @property
+    def session(self) -> ClientSession:
+        """Return the session, creating it on first use."""
+
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+
+            if self._unsub_stop is None:
+                self._unsub_stop = self.hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_STOP, self._async_close_on_stop
+                )
+
+        return self._session
+
+    # ------------------------------------------------------------------
+    def _create_session(self) -> ClientSession:
+        """Create session."""
+
+        connector: TCPConnector = TCPConnector(
+            ssl=client_context(),
+            use_dns_cache=True,
+            ttl_dns_cache=self.DNS_CACHE_TTL,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            limit_per_host=self.LIMIT_PER_HOST,
+        )
+
+        return ClientSession(
+            connector=connector,
+            trace_configs=[self._create_trace_config()],
+        )
+
+    # ------------------------------------------------------------------
+    async def async_close(self) -> None:
+        """Close session and its connector."""
+
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+
+    # ------------------------------------------------------------------
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        """Close session when Home Assistant stops."""
+
+        # A listen_once listener is removed when it fires
+        self._unsub_stop = None
+        await self.async_close()
+
+    # ------------------------------------------------------------------
+    def _create_trace_config(self) -> TraceConfig:
+        """Create trace config recording timings per request."""
+
+        trace_config: TraceConfig = TraceConfig()
+        loop = self.hass.loop
+
+        # ------------------------------------------------------------------
+        async def on_request_start(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceRequestStartParams,
+        ) -> None:
+            ctx.start = loop.time()
+            ctx.timings = {
+                "url": str(params.url),
+                "dns_ms": None,
+                "dns_cached": False,
+                "connect_ms": None,
+                "connection_reused": False,
+                "ttfb_ms": None,
+                "status": None,
+            }
+
+        # ------------------------------------------------------------------
+        async def on_dns_resolvehost_start(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceDnsResolveHostStartParams,
+        ) -> None:
+            ctx.dns_start = loop.time()
+
+        # ------------------------------------------------------------------
+        async def on_dns_resolvehost_end(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceDnsResolveHostEndParams,
+        ) -> None:
+            self.dns_resolves += 1
+            ctx.timings["dns_ms"] = round((loop.time() - ctx.dns_start) * 1000, 1)
+
+        # ------------------------------------------------------------------
+        async def on_dns_cache_hit(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceDnsCacheHitParams,
+        ) -> None:
+            self.dns_cache_hits += 1
+            ctx.timings["dns_cached"] = True
+
+        # ------------------------------------------------------------------
+        async def on_connection_create_start(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceConnectionCreateStartParams,
+        ) -> None:
+            ctx.connect_start = loop.time()
+
+        # ------------------------------------------------------------------
+        async def on_connection_create_end(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceConnectionCreateEndParams,
+        ) -> None:
+            # Includes the TLS handshake, aiohttp does not trace it separately
+            self.connections_created += 1
+            ctx.timings["connect_ms"] = round(
+                (loop.time() - ctx.connect_start) * 1000, 1
+            )
+
+        # ------------------------------------------------------------------
+        async def on_connection_reuseconn(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceConnectionReuseconnParams,
+        ) -> None:
+            self.connections_reused += 1
+            ctx.timings["connection_reused"] = True
+
+        # ------------------------------------------------------------------
+        async def on_request_end(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceRequestEndParams,
+        ) -> None:
+            self.requests += 1
+            ctx.timings["ttfb_ms"] = round((loop.time() - ctx.start) * 1000, 1)
+            ctx.timings["status"] = params.response.status
+            self.last_timings = ctx.timings
+
+        # ------------------------------------------------------------------
+        async def on_request_exception(
+            session: ClientSession,
+            ctx: SimpleNamespace,
+            params: TraceRequestExceptionParams,
+        ) -> None:
+            self.requests += 1
+            self.request_errors += 1
+            ctx.timings["status"] = type(params.exception).__name__
+            self.last_timings = ctx.timings
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+
+        return trace_config
+
+    # ------------------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Return connection diagnostics."""
+        return {
+            "requests": self.requests,
+            "request_errors": self.request_errors,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "dns_resolves": self.dns_resolves,
+            "dns_cache_hits": self.dns_cache_hits,
+            "last_timings": self.last_timings,
+        }
@@ -5,7 +5,10 @@ It includes functions for handling retries, managing timers, and translating tex
 
 External imports:
     handle_retries: None
-    storage_json: jsonpickle
+    json_ext: orjson
+    state_attr: None
+    storage_codec: orjson, jsonpickle (optional)
+    storage_json: orjson, jsonpickle (optional)
     timer_trigger: None
     translate: aiofiles, orjson
 """
@@ -16,6 +19,9 @@ from .config_update import (
 )
 from .enum_ext import EnumExt
 from .handle_retries import (
+    CircuitBreaker,
+    CircuitBreakerState,
+    CircuitOpenException,
     HandleRetries,
     HandleRetriesException,
     RetryStopException,
@@ -26,9 +32,10 @@ from .hass_util import (
     AsyncException,
     async_get_user_language,
     async_hass_add_executor_job,
-    object_to_state_attr_dict,
 )
-from .json_ext import DictToObject, JsonExt
+from .json_ext import DataclassDecoder, DictToObject, JsonExt
+from .storage_codec import JsonPickleCodec, OrjsonCodec, StorageCodec
+from .state_attr import StateAttrConverter, object_to_state_attr_dict
 from .storage_json import StorageJson, StoreMigrate
 from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum
 from .translate import NumberSelectorConfigTranslate, Translate
@@ -36,13 +43,21 @@ from .translate import NumberSelectorConfigTranslate, Translate
 __all__ = [
     "ArgumentException",
     "AsyncException",
+    "CircuitBreaker",
+    "CircuitBreakerState",
+    "CircuitOpenException",
+    "DataclassDecoder",
     "DictToObject",
     "EnumExt",
     "HandleRetries",
     "HandleRetriesException",
     "JsonExt",
+    "JsonPickleCodec",
     "NumberSelectorConfigTranslate",
+    "OrjsonCodec",
     "RetryStopException",
+    "StateAttrConverter",
+    "StorageCodec",
     "StorageJson",
     "StoreMigrate",
     "TimerTrigger",
@@ -2,6 +2,8 @@
 
 This decorator allows you to specify the number of retries and the delay between retries.
 It can be used with both synchronous and asynchronous functions.
+The delay can grow exponentially with full jitter, the retries can be bounded by an
+overall deadline, and a shared circuit breaker can skip calls while the target is down.
 
 External imports: None
 """
@@ -9,11 +11,16 @@ External imports: None
 # ruff: noqa: C901
 
 from asyncio import sleep as asyncio_sleep
+from collections import deque
 from collections.abc import Callable
+from datetime import UTC, datetime
+from enum import StrEnum
 from functools import partial, wraps
 from inspect import iscoroutinefunction
-from time import sleep
+from random import uniform
+from time import monotonic, sleep
 from types import FunctionType
+from typing import Any
 
 
 # ------------------------------------------------------
@@ -38,6 +45,119 @@ class HandleRetriesException(Exception):
     """
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+class CircuitOpenException(Exception):
+    """Exception raised when the circuit breaker is open.
+
+    Args:
+        Exception (_type_): _description_
+
+    """
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class CircuitBreakerState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class CircuitBreaker:
+    """Circuit breaker.
+
+    Opens after failure_threshold consecutive failed calls and rejects calls
+    until reset_timeout seconds have passed. A call that fails after all its
+    retries counts as one failure. It then goes half-open, where the next
+    success closes it again and the next failure re-opens it.
+    A breaker instance can be shared by several decorated functions.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 300.0,
+        max_transitions: int = 20,
+    ) -> None:
+        """Init."""
+        self.failure_threshold: int = failure_threshold if failure_threshold > 0 else 1
+        self.reset_timeout: float = reset_timeout if reset_timeout > 0 else 0.0
+
+        self.state: CircuitBreakerState = CircuitBreakerState.CLOSED
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self.transitions: deque[dict[str, Any]] = deque(maxlen=max_transitions)
+
+    # ------------------------------------------------------
+    def _set_state(self, state: CircuitBreakerState) -> None:
+        """Set state and record the transition."""
+
+        if state == self.state:
+            return
+
+        self.transitions.append(
+            {
+                "time": datetime.now(UTC).isoformat(),
+                "from": str(self.state),
+                "to": str(state),
+                "failures": self.failures,
+            }
+        )
+        self.state = state
+
+    # ------------------------------------------------------
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted."""
+
+        if (
+            self.state == CircuitBreakerState.OPEN
+            and monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            self._set_state(CircuitBreakerState.HALF_OPEN)
+
+        return self.state != CircuitBreakerState.OPEN
+
+    # ------------------------------------------------------
+    @property
+    def is_open(self) -> bool:
+        """Return True if calls are currently rejected."""
+        return self.state == CircuitBreakerState.OPEN
+
+    # ------------------------------------------------------
+    def record_success(self) -> None:
+        """Record a successful call."""
+        self.failures = 0
+        self._set_state(CircuitBreakerState.CLOSED)
+
+    # ------------------------------------------------------
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self.failures += 1
+
+        if (
+            self.state == CircuitBreakerState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            self.opened_at = monotonic()
+            self._set_state(CircuitBreakerState.OPEN)
+
+    # ------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics."""
+        return {
+            "state": str(self.state),
+            "failures": self.failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout": self.reset_timeout,
+            "transitions": list(self.transitions),
+        }
+
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 class HandleRetries:
@@ -56,6 +176,11 @@ class HandleRetries:
         raise_original_exception: bool = True,
         retry_on_exceptions: list | None = None,
         stop_on_exceptions: list | None = None,
+        backoff_factor: float = 1.0,
+        max_retry_delay: float | None = None,
+        jitter: bool = False,
+        deadline: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         """Init.
 
@@ -66,6 +191,11 @@ class HandleRetries:
             raise_original_exception (bool, optional): _description_. Defaults to True.
             retry_on_exceptions (list | Exception | None, optional): _description_. Defaults to None.
             stop_on_exceptions (list | Exception | None, optional): _description_. Defaults to None.
+            backoff_factor (float, optional): Delay multiplier per attempt. Defaults to 1.0.
+            max_retry_delay (float | None, optional): Upper bound of the delay. Defaults to None.
+            jitter (bool, optional): Full jitter, random delay between 0 and the delay. Defaults to False.
+            deadline (float | None, optional): Overall time limit in seconds. Defaults to None.
+            circuit_breaker (CircuitBreaker | None, optional): Shared circuit breaker. Defaults to None.
 
         """
         self.retries: int = retries if retries > 0 else 1
@@ -74,9 +204,28 @@ class HandleRetries:
         self.raise_original_exception: bool = raise_original_exception
         self.retry_on_exceptions: list | None = retry_on_exceptions
         self.stop_on_exceptions: list | None = stop_on_exceptions
+        self.backoff_factor: float = backoff_factor if backoff_factor > 1 else 1.0
+        self.max_retry_delay: float | None = max_retry_delay
+        self.jitter: bool = jitter
+        self.deadline: float | None = deadline
+        self.circuit_breaker: CircuitBreaker | None = circuit_breaker
 
         self.func_self = None
 
+    # ------------------------------------------------------
+    def get_retry_delay(self, attempt: int) -> float:
+        """Return the delay before the next attempt."""
+
+        tmp_delay: float = self.retry_delay * (self.backoff_factor**attempt)
+
+        if self.max_retry_delay is not None:
+            tmp_delay = min(tmp_delay, self.max_retry_delay)
+
+        if self.jitter:
+            return uniform(0, tmp_delay)
+
+        return tmp_delay
+
     # ------------------------------------------------------
     def __call__(self, func):
         """__call__.
@@ -118,22 +267,65 @@ class HandleRetries:
                 return False
 
             # -------------------------
-            def check_exceptions(exp: Exception, attempt: int) -> None:
-                """Check exceptions."""
+            def check_circuit_breaker() -> None:
+                """Check if the circuit breaker allows a call."""
+
+                if (
+                    self.circuit_breaker is not None
+                    and not self.circuit_breaker.allow_request()
+                ):
+                    raise CircuitOpenException(f"Circuit open for {func.__name__}")
+
+            # -------------------------
+            def check_exceptions(
+                exp: Exception, attempt: int, start_time: float
+            ) -> float | None:
+                """Check exceptions.
+
+                Returns the delay before the next attempt, or None if retrying should stop.
+                """
 
                 if exp.__class__ == RetryStopException:
                     raise exp
+
+                retry: bool = check_retry_on_exceptions(
+                    exp
+                ) and not check_stop_on_exceptions(exp)
+
+                tmp_delay: float = self.get_retry_delay(attempt)
+
                 if (
-                    not check_retry_on_exceptions(exp)
-                    or check_stop_on_exceptions(exp)
+                    not retry
                     or attempt == self.retries - 1
+                    or (
+                        self.deadline is not None
+                        and monotonic() - start_time + tmp_delay > self.deadline
+                    )
+                    or (
+                        self.circuit_breaker is not None
+                        and self.circuit_breaker.is_open
+                    )
                 ):
+                    # One failure per failed call, not per attempt
+                    if retry and self.circuit_breaker is not None:
+                        self.circuit_breaker.record_failure()
+
                     if self.raise_last_exception:
                         if self.raise_original_exception:
                             raise exp
                         raise HandleRetriesException(
                             f"Retry {attempt} failed for {func.__name__}"
                         ) from exp
+                    return None
+
+                return tmp_delay
+
+            # -------------------------
+            def record_success() -> None:
+                """Record success in the circuit breaker."""
+
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
 
             # -------------------------
             def set_parms_dyn(parm_dict: dict) -> None:
@@ -153,6 +345,16 @@ class HandleRetries:
                     self.retry_on_exceptions = parm_dict["retry_on_exceptions"]
                 if "stop_on_exceptions" in parm_dict:
                     self.stop_on_exceptions = parm_dict["stop_on_exceptions"]
+                if "backoff_factor" in parm_dict:
+                    self.backoff_factor = parm_dict["backoff_factor"]
+                if "max_retry_delay" in parm_dict:
+                    self.max_retry_delay = parm_dict["max_retry_delay"]
+                if "jitter" in parm_dict:
+                    self.jitter = parm_dict["jitter"]
+                if "deadline" in parm_dict:
+                    self.deadline = parm_dict["deadline"]
+                if "circuit_breaker" in parm_dict:
+                    self.circuit_breaker = parm_dict["circuit_breaker"]
 
             # -------------------------
             def check_for_dyn_parms(func) -> None:
@@ -201,32 +403,53 @@ class HandleRetries:
             @wraps(func)
             def wrapper(*args, **kwargs):
                 check_for_dyn_parms(self.func_self)
+                start_time: float = monotonic()
 
                 for attempt in range(self.retries):
+                    check_circuit_breaker()
+
                     try:
                         if self.func_self is None:
-                            return func(*args, **kwargs)
-                        return func(self.func_self, *args, **kwargs)
+                            tmp_return = func(*args, **kwargs)
+                        else:
+                            tmp_return = func(self.func_self, *args, **kwargs)
                     except Exception as err:  # noqa: BLE001
-                        check_exceptions(err, attempt)
+                        tmp_delay = check_exceptions(err, attempt, start_time)
+
+                        if tmp_delay is None:
+                            return None
+                    else:
+                        record_success()
+                        return tmp_return
 
-                    sleep(self.retry_delay)
+                    sleep(tmp_delay)
                 return None
 
             # -------------------------
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 await async_check_for_dyn_parms(self.func_self)
+                start_time: float = monotonic()
 
                 for attempt in range(self.retries):
+                    check_circuit_breaker()
+
                     try:
                         if self.func_self is None:
-                            return await func(*args, **kwargs)
-                        return await func(self.func_self, *args, **kwargs)
+                            tmp_return = await func(*args, **kwargs)
+                        else:
+                            tmp_return = await func(self.func_self, *args, **kwargs)
 
                     except Exception as err:  # noqa: BLE001
-                        check_exceptions(err, attempt)
-                    await asyncio_sleep(self.retry_delay)
+                        tmp_delay = check_exceptions(err, attempt, start_time)
+
+                        if tmp_delay is None:
+                            return None
+                    else:
+                        record_success()
+                        return tmp_return
+
+                    await asyncio_sleep(tmp_delay)
                 return None
 
             # Check if the function is a coroutine function
@@ -278,6 +501,11 @@ def handle_retries(
     raise_original_exception: bool = True,
     retry_on_exceptions: list | None = None,
     stop_on_exceptions: list | None = None,
+    backoff_factor: float = 1.0,
+    max_retry_delay: float | None = None,
+    jitter: bool = False,
+    deadline: float | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
 ):
     """Decorator to handle retries.
 
@@ -295,6 +523,11 @@ def handle_retries(
             raise_original_exception=raise_original_exception,
             retry_on_exceptions=retry_on_exceptions,
             stop_on_exceptions=stop_on_exceptions,
+            backoff_factor=backoff_factor,
+            max_retry_delay=max_retry_delay,
+            jitter=jitter,
+            deadline=deadline,
+            circuit_breaker=circuit_breaker,
         )
 
     # -------------------------
@@ -309,6 +542,11 @@ def handle_retries(
                 raise_original_exception=raise_original_exception,
                 retry_on_exceptions=retry_on_exceptions,
                 stop_on_exceptions=stop_on_exceptions,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
+                jitter=jitter,
+                deadline=deadline,
+                circuit_breaker=circuit_breaker,
             ).execute(func_self, func, *args, **kwargs)
 
         # -------------------------
@@ -321,6 +559,11 @@ def handle_retries(
                 raise_original_exception=raise_original_exception,
                 retry_on_exceptions=retry_on_exceptions,
                 stop_on_exceptions=stop_on_exceptions,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
+                jitter=jitter,
+                deadline=deadline,
+                circuit_breaker=circuit_breaker,
             ).async_execute(func_self, func, *args, **kwargs)
 
         # -------------------------
@@ -333,6 +576,11 @@ def handle_retries(
                 raise_original_exception=raise_original_exception,
                 retry_on_exceptions=retry_on_exceptions,
                 stop_on_exceptions=stop_on_exceptions,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
+                jitter=jitter,
+                deadline=deadline,
+                circuit_breaker=circuit_breaker,
             ).execute(None, func, *args, **kwargs)
 
         # -------------------------
@@ -345,6 +593,11 @@ def handle_retries(
                 raise_original_exception=raise_original_exception,
                 retry_on_exceptions=retry_on_exceptions,
                 stop_on_exceptions=stop_on_exceptions,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
+                jitter=jitter,
+                deadline=deadline,
+                circuit_breaker=circuit_breaker,
             ).async_execute(None, func, *args, **kwargs)
 
         if "<locals>" in func.__qualname__ or isinstance(func, FunctionType):
@@ -1,9 +1,85 @@
-"""Json extended."""
+"""Json extended.
 
-from contextlib import suppress
+External imports: orjson
+"""
+
+from collections.abc import Callable
+from dataclasses import MISSING, Field, fields, is_dataclass
 from datetime import datetime
-from json import loads
 from re import compile
+from types import UnionType
+from typing import Any, ClassVar, Union, get_args, get_origin, get_type_hints
+
+import orjson
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class KeyMapper:
+    """Compiled key map.
+
+    Keys are looked up in an exact-match table first, then in the ordered
+    wildcard patterns: "*text*" (infix), "*text" (prefix) and "text*" (suffix).
+    The result for each key is cached.
+    """
+
+    INFIX: int = 0
+    PREFIX: int = 1
+    SUFFIX: int = 2
+
+    def __init__(self, map_keys: dict) -> None:
+        """Init."""
+
+        self.exact: dict[str, str] = dict(map_keys)
+        self.patterns: tuple[tuple[int, str, str], ...] = tuple(
+            self._compile_pattern(key, value)
+            for key, value in map_keys.items()
+            if key.startswith("*") or key.endswith("*")
+        )
+        self._cache: dict[str, str] = {}
+
+    # ------------------------------------------------------------------
+    def _compile_pattern(self, key: str, value: str) -> tuple[int, str, str]:
+        """Compile a wildcard pattern."""
+
+        if key.startswith("*") and key.endswith("*"):
+            return (self.INFIX, key[1:-1], value)
+        if key.startswith("*"):
+            return (self.PREFIX, key[1:], value)
+        return (self.SUFFIX, key[:-1], value)
+
+    # ------------------------------------------------------------------
+    def map_key(self, check_key: str) -> str:
+        """Map key."""
+
+        if (tmp_key := self._cache.get(check_key)) is not None:
+            return tmp_key
+
+        tmp_key = self._map_key(check_key)
+
+        if isinstance(check_key, str):
+            self._cache[check_key] = tmp_key
+
+        return tmp_key
+
+    # ------------------------------------------------------------------
+    def _map_key(self, check_key: str) -> str:
+        """Map key without cache."""
+
+        if check_key in self.exact:
+            return self.exact[check_key]
+
+        for kind, fragment, value in self.patterns:
+            if kind == self.INFIX:
+                if check_key.find(fragment) >= 0:
+                    return check_key.replace(fragment, value, 1)
+            elif kind == self.PREFIX:
+                if check_key.startswith(fragment):
+                    return check_key.replace(fragment, value, 1)
+            elif check_key.endswith(fragment):
+                return check_key.replace(fragment, value, 1)
+
+        return check_key
 
 
 # ------------------------------------------------------------------
@@ -15,28 +91,104 @@ class JsonExt:
         r"^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-(3[01]|0[1-9]|[12][0-9])T(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])?$"
     ).match
 
+    # Shortest string the regex can match: YYYY-MM-DDTHH:MM:SS
+    _ISO8601_MIN_LEN: int = 19
+    _ISO8601_LAST_CHARS: frozenset[str] = frozenset("0123456789Z")
+    _DATETIME_CACHE_SIZE: int = 4096
+    _datetime_cache: ClassVar[dict[str, datetime]] = {}
+
     def __init__(self) -> None:
         """Init."""
         self._global_map_keys: dict = {}
+        self._key_mappers: dict[tuple, KeyMapper] = {}
 
     # ------------------------------------------------------------------
     def validate_iso8601(self, str_val):
         """Validate if a String is a ISO8601 value or not."""
+        return (
+            isinstance(str_val, str)
+            and self._iso8601_shape(str_val)
+            and self._match_iso8601(str_val) is not None
+        )
+
+    # ------------------------------------------------------------------
+    def _iso8601_shape(self, str_val: str) -> bool:
+        """Cheap check on length and separator positions before the regex.
+
+        The first "T" from index 10 is the date/time separator in any string
+        the regex matches, the date part only holds digits and "-".
+        """
+
+        if (
+            len(str_val) < self._ISO8601_MIN_LEN
+            or str_val[-1] not in self._ISO8601_LAST_CHARS
+        ):
+            return False
+
+        pos_t: int = str_val.find("T", 10)
+
+        return (
+            pos_t > 0
+            and pos_t + 8 < len(str_val)
+            and str_val[pos_t - 3] == "-"
+            and str_val[pos_t - 6] == "-"
+            and str_val[pos_t + 3] == ":"
+            and str_val[pos_t + 6] == ":"
+        )
+
+    # ------------------------------------------------------------------
+    def _decode_datetime(self, str_val: str) -> datetime | None:
+        """Decode an ISO8601 string.
+
+        Memoized, the same timestamps are returned poll after poll.
+        """
+
+        if (tmp_datetime := self._datetime_cache.get(str_val)) is not None:
+            return tmp_datetime
+
+        if not self.validate_iso8601(str_val):
+            return None
+
         try:
-            if self._match_iso8601(str_val) is not None:
-                return True
-        except:  # noqa: E722
-            pass
-        return False
+            tmp_datetime = datetime.fromisoformat(str_val)
+        except (ValueError, AttributeError, TypeError):
+            return None
+
+        if len(self._datetime_cache) >= self._DATETIME_CACHE_SIZE:
+            self._datetime_cache.clear()
+
+        self._datetime_cache[str_val] = tmp_datetime
+        return tmp_datetime
 
     # ------------------------------------------------------------------
-    def _decoder(self, obj):
-        for key, value in obj.items():
-            if isinstance(value, str) and self.validate_iso8601(value):
-                with suppress(ValueError, AttributeError, TypeError):
-                    obj[key] = datetime.fromisoformat(value)
+    def decode_datetimes(self, data, datetime_fields: set[str] | None = None) -> None:
+        """Convert ISO8601 string values in all nested dicts to datetime, in place.
+
+        If datetime_fields is given, only values of those keys are checked.
+        """
+
+        stack: list = [data]
+        min_len: int = self._ISO8601_MIN_LEN
+
+        while stack:
+            obj = stack.pop()
+
+            if isinstance(obj, dict):
+                for key, value in obj.items():
+                    if isinstance(value, str):
+                        if (
+                            len(value) >= min_len
+                            and (datetime_fields is None or key in datetime_fields)
+                            and (tmp_datetime := self._decode_datetime(value))
+                            is not None
+                        ):
+                            obj[key] = tmp_datetime
+
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
 
-        return obj
+            elif isinstance(obj, list):
+                stack.extend(obj)
 
     # ------------------------------------------------------------------
     def set_global_map_keys(self, global_map_keys: dict = {}):
@@ -44,51 +196,110 @@ class JsonExt:
         self._global_map_keys = global_map_keys
 
     # ------------------------------------------------------------------
-    def change_nested_keys(self, data, map_keys: dict = {}):
-        """Change nested keys."""
+    def get_key_mapper(self, map_keys: dict) -> KeyMapper:
+        """Return a compiled key mapper, cached per map."""
 
-        # ----------------------------------------
-        def map_key(check_key: str):
-            if len(map_keys) == 0:
-                return check_key
-
-            if check_key in map_keys:
-                return map_keys[check_key]
-
-            for key, value in map_keys.items():
-                if (
-                    key.startswith("*")
-                    and key.endswith("*")
-                    and check_key.find(key[1:-1]) >= 0
-                ):
-                    return check_key.replace(key[1:-1], value, 1)
-                if key.startswith("*") and check_key.startswith(key[1:]):
-                    return check_key.replace(key[1:], value, 1)
-                if key.endswith("*") and check_key.endswith(key[:-1]):
-                    return check_key.replace(key[:-1], value, 1)
-            return check_key
+        cache_key: tuple = tuple(map_keys.items())
+
+        if (key_mapper := self._key_mappers.get(cache_key)) is None:
+            key_mapper = self._key_mappers[cache_key] = KeyMapper(map_keys)
+
+        return key_mapper
+
+    # ------------------------------------------------------------------
+    def change_nested_keys(
+        self,
+        data,
+        map_keys: dict = {},
+        max_depth: int | None = None,
+        in_place: bool = False,
+    ):
+        """Change nested keys.
+
+        Only dicts and lists containing a renamed key are copied, the rest of the
+        tree is shared with data. Keys deeper than max_depth (0 is the top level)
+        are left alone. With in_place, data itself is modified.
+        """
+
+        if len(map_keys) == 0:
+            return data
+
+        map_key: Callable[[str], str] = self.get_key_mapper(map_keys).map_key
 
         # ----------------------------------------
+        def change_keys(obj, depth: int):
+            if max_depth is not None and depth > max_depth:
+                return obj
+
+            if isinstance(obj, dict):
+                changes: dict | None = None
+
+                for key, value in obj.items():
+                    new_key = map_key(key)
+                    new_value = change_keys(value, depth + 1)
+
+                    if new_key != key or new_value is not value:
+                        if changes is None:
+                            changes = {}
+                        changes[key] = (new_key, new_value)
+
+                if changes is None:
+                    return obj
+
+                # Rebuilt from all pairs, so chained or swapped renames
+                # don't overwrite each other and the key order is kept
+                items: list[tuple] = [
+                    changes.get(key, (key, value)) for key, value in obj.items()
+                ]
+
+                if in_place:
+                    obj.clear()
+                    obj.update(items)
+                    return obj
 
-        if isinstance(data, dict):
-            new_dict = {}
+                return dict(items)
 
-            for key, value in data.items():
-                new_value = self.change_nested_keys(value, map_keys)
+            if isinstance(obj, list):
+                new_list: list | None = None
 
-                new_dict[map_key(key)] = new_value
-            return new_dict
+                for index, item in enumerate(obj):
+                    new_item = change_keys(item, depth)
 
-        if isinstance(data, list):
-            return [self.change_nested_keys(item, map_keys) for item in data]
-        return data
+                    if new_item is not item:
+                        if new_list is None:
+                            new_list = obj if in_place else list(obj)
+                        new_list[index] = new_item
+
+                return obj if new_list is None else new_list
+
+            return obj
+
+        # ----------------------------------------
+
+        return change_keys(data, 0)
 
     # ------------------------------------------------------------------
-    def json_str_to_dict(self, json_str: str, map_keys: dict = {}) -> dict:
-        """Json str to dict."""
-        tmp_dict = loads(json_str, object_hook=self._decoder)
+    def json_str_to_dict(
+        self,
+        json_str: str | bytes | bytearray,
+        map_keys: dict = {},
+        datetime_fields: set[str] | None = None,
+        max_depth: int | None = None,
+    ) -> dict:
+        """Json str to dict.
+
+        Parsed with orjson, datetimes are converted afterwards and keys are
+        renamed in place.
+        """
+        tmp_dict = orjson.loads(json_str)
+        self.decode_datetimes(tmp_dict, datetime_fields)
 
-        return self.change_nested_keys(tmp_dict, {**self._global_map_keys, **map_keys})
+        return self.change_nested_keys(
+            tmp_dict,
+            {**self._global_map_keys, **map_keys},
+            max_depth=max_depth,
+            in_place=True,
+        )
 
 
 # ------------------------------------------------------------------
@@ -119,3 +330,176 @@ class DictToObject:
                 )
             else:
                 setattr(self, key, value)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class DataclassDecoder:
+    """Schema-driven dict to dataclass decoder.
+
+    The fields of the dataclass (use slots=True for a compact record) are
+    compiled once per class into coercion functions. Missing keys get the
+    field default, unknown keys are ignored, values of the wrong type are
+    coerced to the first non-None type of the annotation and fall back to
+    the default if that fails. Iso strings are parsed if datetime is the first
+    type. Nested dataclasses and lists of dataclasses are decoded recursively.
+    """
+
+    _decoders: ClassVar[dict[type, "DataclassDecoder"]] = {}
+
+    def __init__(self, record_cls: type) -> None:
+        """Init."""
+
+        self.record_cls: type = record_cls
+        type_hints: dict[str, Any] = get_type_hints(record_cls)
+
+        self.fields: tuple[tuple[str, Callable[[Any], Any]], ...] = tuple(
+            (field.name, self._compile_coerce(type_hints[field.name], field))
+            for field in fields(record_cls)
+            if field.init
+        )
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def get(cls, record_cls: type) -> "DataclassDecoder":
+        """Return the cached decoder for a dataclass."""
+
+        if (decoder := cls._decoders.get(record_cls)) is None:
+            decoder = cls._decoders[record_cls] = DataclassDecoder(record_cls)
+
+        return decoder
+
+    # ------------------------------------------------------------------
+    def decode(self, data: dict) -> Any:
+        """Decode dict to dataclass instance."""
+        return self.record_cls(**self.decode_fields(data))
+
+    # ------------------------------------------------------------------
+    def decode_fields(self, data: dict) -> dict[str, Any]:
+        """Decode dict to coerced field values, missing fields are left out."""
+
+        return {
+            name: coerce(data[name]) for name, coerce in self.fields if name in data
+        }
+
+    # ------------------------------------------------------------------
+    def decode_list(self, data: list | None) -> list:
+        """Decode list of dicts to list of dataclass instances."""
+
+        if not isinstance(data, list):
+            return []
+
+        return [self.decode(item) for item in data if isinstance(item, dict)]
+
+    # ------------------------------------------------------------------
+    def _compile_coerce(self, type_hint: Any, field: Field) -> Callable[[Any], Any]:
+        """Compile coercion function for a field."""
+
+        # ----------------------------------------
+        def default() -> Any:
+            if field.default_factory is not MISSING:
+                return field.default_factory()
+            if field.default is not MISSING:
+                return field.default
+            return None
+
+        tmp_types: tuple = (
+            get_args(type_hint)
+            if get_origin(type_hint) in (Union, UnionType)
+            else (type_hint,)
+        )
+        allow_none: bool = type(None) in tmp_types
+        tmp_types = tuple(
+            tmp_type for tmp_type in tmp_types if tmp_type is not type(None)
+        )
+        target = tmp_types[0] if len(tmp_types) > 0 else Any
+
+        if get_origin(target) is list:
+            item_args = get_args(target)
+            item_type = item_args[0] if len(item_args) > 0 else Any
+
+            if is_dataclass(item_type):
+                item_decoder: DataclassDecoder = DataclassDecoder.get(item_type)
+
+                # ----------------------------------------
+                def coerce_dataclass_list(value: Any) -> Any:
+                    if value is None and allow_none:
+                        return None
+                    return item_decoder.decode_list(value)
+
+                return coerce_dataclass_list
+
+            # ----------------------------------------
+            def coerce_list(value: Any) -> Any:
+                if value is None and allow_none:
+                    return None
+                return list(value) if isinstance(value, list) else default()
+
+            return coerce_list
+
+        if is_dataclass(target):
+            decoder: DataclassDecoder = DataclassDecoder.get(target)
+
+            # ----------------------------------------
+            def coerce_dataclass(value: Any) -> Any:
+                if isinstance(value, dict):
+                    return decoder.decode(value)
+                return None if value is None and allow_none else default()
+
+            return coerce_dataclass
+
+        if target is Any:
+            return lambda value: value
+
+        if target is datetime:
+            allow_str: bool = str in tmp_types
+
+            # ----------------------------------------
+            def coerce_datetime(value: Any) -> Any:
+                if value is None and allow_none:
+                    return None
+
+                if isinstance(value, datetime):
+                    return value
+
+                if isinstance(value, str):
+                    try:
+                        return datetime.fromisoformat(value)
+                    except ValueError:
+                        if allow_str:
+                            return value
+
+                return default()
+
+            return coerce_datetime
+
+        check_types: tuple = tuple(
+            get_origin(tmp_type) or tmp_type for tmp_type in tmp_types
+        )
+        convert: Callable[[Any], Any] = self._str_to_bool if target is bool else target
+
+        # ----------------------------------------
+        def coerce(value: Any) -> Any:
+            if value is None:
+                return None if allow_none else default()
+
+            if isinstance(value, check_types) and not (
+                isinstance(value, bool) and bool not in check_types
+            ):
+                return value
+
+            try:
+                return convert(value)
+            except (TypeError, ValueError):
+                return default()
+
+        return coerce
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _str_to_bool(value: Any) -> bool:
+        """Convert to bool."""
+
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
@@ -0,0 +1,225 @@
+"""Object to Home Assistant state attribute conversion."""
+
+from __future__ import annotations
+
+from dataclasses import is_dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from itertools import islice
+from typing import Any, ClassVar
+
+
+# ------------------------------------------------------
+def _get_slots(cls: type) -> list[str]:
+    """Return slot names of a class and its bases."""
+
+    return [
+        slot
+        for tmp_cls in reversed(cls.__mro__)
+        for slot in getattr(tmp_cls, "__slots__", ())
+        if slot not in ("__dict__", "__weakref__")
+    ]
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class StateAttrConverter:
+    """Object to hass state attribute dict converter.
+
+    Compiled and cached per class, exclude set and underscore setting. The
+    display keys are computed once per attribute name. Objects with
+    __slots__ and slotted dataclasses, which have no __dict__, are read by
+    their precomputed slot names.
+
+    Nested objects, lists, tuples, sets and dicts are converted
+    recursively. Deeper than max_depth values are replaced by their str(),
+    and containers are cut at max_items.
+    """
+
+    _PLAIN: int = 0
+    _OBJECT: int = 1
+    _SEQUENCE: int = 2
+    _MAPPING: int = 3
+
+    _NO_EXCLUDES: frozenset[str] = frozenset()
+    _converters: ClassVar[
+        dict[tuple[type, frozenset[str], bool], StateAttrConverter]
+    ] = {}
+    _kinds: ClassVar[dict[type, int]] = {
+        str: _PLAIN,
+        int: _PLAIN,
+        float: _PLAIN,
+        bool: _PLAIN,
+        type(None): _PLAIN,
+        datetime: _PLAIN,
+        date: _PLAIN,
+        time: _PLAIN,
+        timedelta: _PLAIN,
+        list: _SEQUENCE,
+        tuple: _SEQUENCE,
+        set: _SEQUENCE,
+        frozenset: _SEQUENCE,
+        dict: _MAPPING,
+    }
+
+    def __init__(
+        self, cls: type, exclude: frozenset[str], exclude_underscore: bool
+    ) -> None:
+        """Init."""
+
+        self.exclude: frozenset[str] = exclude
+        self.exclude_underscore: bool = exclude_underscore
+        self.uses_dict: bool = cls.__dictoffset__ != 0
+
+        # Display key per attribute name, None if excluded
+        self.display_keys: dict[str, str | None] = {}
+        self.slots: tuple[tuple[str, str], ...] = ()
+
+        if not self.uses_dict:
+            self.slots = tuple(
+                (name, key)
+                for name in _get_slots(cls)
+                if (key := self.display_key(name)) is not None
+            )
+
+    # ------------------------------------------------------
+    @classmethod
+    def get(
+        cls, obj_cls: type, exclude_list: list | frozenset, exclude_underscore: bool
+    ) -> StateAttrConverter:
+        """Return the cached converter."""
+
+        exclude: frozenset[str] = (
+            frozenset(exclude_list) if exclude_list else cls._NO_EXCLUDES
+        )
+        cache_key: tuple[type, frozenset[str], bool] = (
+            obj_cls,
+            exclude,
+            exclude_underscore,
+        )
+
+        if (converter := cls._converters.get(cache_key)) is None:
+            converter = cls._converters[cache_key] = StateAttrConverter(
+                obj_cls, exclude, exclude_underscore
+            )
+
+        return converter
+
+    # ------------------------------------------------------
+    def display_key(self, name: str) -> str | None:
+        """Return the display key of an attribute name, None if excluded."""
+
+        if name in self.exclude or (self.exclude_underscore and name.startswith("_")):
+            return None
+
+        return name.lower().replace("_", " ")
+
+    # ------------------------------------------------------
+    @classmethod
+    def kind(cls, value_cls: type) -> int:
+        """Return the cached way to convert values of a class."""
+
+        if (kind := cls._kinds.get(value_cls)) is None:
+            if issubclass(value_cls, Enum):
+                kind = cls._PLAIN
+            elif issubclass(value_cls, (list, tuple, set, frozenset)):
+                kind = cls._SEQUENCE
+            elif issubclass(value_cls, dict):
+                kind = cls._MAPPING
+            elif (
+                is_dataclass(value_cls)
+                or value_cls.__dictoffset__ != 0
+                or len(_get_slots(value_cls)) > 0
+            ):
+                kind = cls._OBJECT
+            else:
+                kind = cls._PLAIN
+
+            cls._kinds[value_cls] = kind
+
+        return kind
+
+    # ------------------------------------------------------
+    def convert(self, obj: object, depth: int, max_depth: int, max_items: int) -> dict:
+        """Convert object to state attribute dict."""
+
+        state_attr_dict: dict = {}
+        kinds: dict[type, int] = self._kinds
+        plain: int = self._PLAIN
+
+        if self.uses_dict:
+            display_keys: dict[str, str | None] = self.display_keys
+
+            for name, value in obj.__dict__.items():
+                if name not in display_keys:
+                    display_keys[name] = self.display_key(name)
+
+                if (key := display_keys[name]) is None:
+                    continue
+
+                state_attr_dict[key] = (
+                    value
+                    if kinds.get(type(value)) == plain
+                    else self.convert_value(value, depth + 1, max_depth, max_items)
+                )
+        else:
+            for name, key in self.slots:
+                value = getattr(obj, name, None)
+                state_attr_dict[key] = (
+                    value
+                    if kinds.get(type(value)) == plain
+                    else self.convert_value(value, depth + 1, max_depth, max_items)
+                )
+
+        return state_attr_dict
+
+    # ------------------------------------------------------
+    def convert_value(
+        self, value: Any, depth: int, max_depth: int, max_items: int
+    ) -> Any:
+        """Convert a nested value."""
+
+        kind: int = self.kind(type(value))
+
+        if kind == self._PLAIN:
+            return value
+
+        if depth > max_depth:
+            return str(value)
+
+        if kind == self._SEQUENCE:
+            return [
+                self.convert_value(item, depth + 1, max_depth, max_items)
+                for item in islice(value, max_items)
+            ]
+
+        if kind == self._MAPPING:
+            return {
+                key: self.convert_value(item, depth + 1, max_depth, max_items)
+                for key, item in islice(value.items(), max_items)
+            }
+
+        return StateAttrConverter.get(
+            type(value), self.exclude, self.exclude_underscore
+        ).convert(value, depth, max_depth, max_items)
+
+
+# ------------------------------------------------------
+def object_to_state_attr_dict(
+    obj: object,
+    exclude_list: list = [],
+    exlude_underscore_attrs: bool = True,
+    max_depth: int = 3,
+    max_items: int = 100,
+) -> dict:
+    """Convert object to hass state attribute dict.
+
+    See StateAttrConverter.
+    """
+
+    if obj is None:
+        return {}
+
+    return StateAttrConverter.get(
+        type(obj), exclude_list, exlude_underscore_attrs
+    ).convert(obj, 0, max_depth, max_items)
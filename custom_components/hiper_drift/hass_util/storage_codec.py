@@ -0,0 +1,136 @@
+"""Storage codecs for StorageJson.
+
+External imports: orjson, jsonpickle (optional)
+"""
+
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+import orjson
+
+from .json_ext import DataclassDecoder
+
+try:
+    import jsonpickle
+except ImportError:
+    jsonpickle = None
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class StorageCodec:
+    """Storage codec.
+
+    Encodes a StorageJson object into data stored under DICT_KEY, and
+    decodes that data back into the attributes to set on the object.
+    """
+
+    DICT_KEY: str = ""
+
+    # ------------------------------------------------------------------
+    def encode(self, obj: Any) -> Any:
+        """Encode object."""
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------
+    def decode(self, obj_cls: type, data: Any) -> dict[str, Any] | None:
+        """Decode data to attributes, None if there is nothing to set."""
+        raise NotImplementedError
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class OrjsonCodec(StorageCodec):
+    """Schema codec.
+
+    The dataclass fields of the object are the schema. Only those are
+    stored, as plain json without class paths, and they are coerced back to
+    the declared types when read. The object class must be decorated with
+    @dataclass(init=False, eq=False) to declare its fields.
+    """
+
+    DICT_KEY: str = "orjson"
+
+    def __init__(self) -> None:
+        """Init."""
+        self._field_names: dict[type, tuple[str, ...]] = {}
+
+    # ------------------------------------------------------------------
+    def field_names(self, obj_cls: type) -> tuple[str, ...]:
+        """Return the cached field names of a class."""
+
+        if (names := self._field_names.get(obj_cls)) is None:
+            if not is_dataclass(obj_cls):
+                raise TypeError(f"{obj_cls.__name__} does not declare a schema")
+
+            names = self._field_names[obj_cls] = tuple(
+                field.name for field in fields(obj_cls)
+            )
+
+        return names
+
+    # ------------------------------------------------------------------
+    def encode(self, obj: Any) -> Any:
+        """Encode the schema fields.
+
+        Round tripped through orjson, so the stored data is plain json and
+        unsupported values fail here, not in the delayed store write.
+        """
+
+        return orjson.loads(
+            orjson.dumps(
+                {name: getattr(obj, name) for name in self.field_names(type(obj))},
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+        )
+
+    # ------------------------------------------------------------------
+    def decode(self, obj_cls: type, data: Any) -> dict[str, Any] | None:
+        """Decode the schema fields, unknown keys are ignored."""
+
+        if not isinstance(data, dict):
+            return None
+
+        self.field_names(obj_cls)
+        return DataclassDecoder.get(obj_cls).decode_fields(data)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class JsonPickleCodec(StorageCodec):
+    """jsonpickle codec, stores class paths.
+
+    Requires the optional jsonpickle package.
+    """
+
+    DICT_KEY: str = "jsonpickle"
+
+    def __init__(self) -> None:
+        """Init."""
+
+        if jsonpickle is None:
+            raise ImportError("jsonpickle is not installed")
+
+        jsonpickle.set_encoder_options("json", ensure_ascii=False)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def available() -> bool:
+        """Return True if jsonpickle is installed."""
+        return jsonpickle is not None
+
+    # ------------------------------------------------------------------
+    def encode(self, obj: Any) -> Any:
+        """Encode object."""
+        return jsonpickle.encode(obj, unpicklable=True)
+
+    # ------------------------------------------------------------------
+    def decode(self, obj_cls: type, data: Any) -> dict[str, Any] | None:
+        """Decode object."""
+
+        tmp_obj = jsonpickle.decode(data)
+
+        if not hasattr(tmp_obj, "__dict__"):
+            return None
+
+        return tmp_obj.__dict__
@@ -1,17 +1,17 @@
 """Json storage.
 
-External imports: jsonpickle
+External imports: orjson, jsonpickle (optional)
 """
 
 from collections.abc import Callable
 import inspect
-from typing import Any
-
-import jsonpickle
+from typing import Any, ClassVar
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
+from .storage_codec import JsonPickleCodec, OrjsonCodec, StorageCodec
+
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
@@ -41,6 +41,147 @@ class StoreMigrate(Store):
         return old_data
 
 
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class HiddenAttributeFilter:
+    """Strip hidden attributes, names ending with ___, before serialisation.
+
+    Which attribute names are persisted, and how values of a type are
+    walked, is decided once per class and cached. Nested objects are
+    projected into copies with only the persisted attributes, so the live
+    objects are never modified. Lists, tuples and dict values are walked,
+    including lists of lists. Dict and list subclasses are copied as their
+    own class, with both their items and attributes filtered. Objects with
+    their own __new__, __getstate__ or __reduce__ (like enums, OrderedDict,
+    other StorageJson objects and subclasses of other builtins) are left to
+    serialise themselves.
+    """
+
+    _PLAIN: ClassVar[int] = 0
+    _OBJECT: ClassVar[int] = 1
+    _LIST: ClassVar[int] = 2
+    _TUPLE: ClassVar[int] = 3
+    _DICT: ClassVar[int] = 4
+    _DICT_OBJECT: ClassVar[int] = 5
+    _LIST_OBJECT: ClassVar[int] = 6
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self._persisted: dict[type, dict[str, bool]] = {}
+        self._kinds: dict[type, int] = {
+            list: self._LIST,
+            tuple: self._TUPLE,
+            dict: self._DICT,
+        }
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def is_hidden(name: str) -> bool:
+        """Return True if an attribute name is hidden."""
+        return len(name) > 3 and name.endswith("___") and not name.startswith("__")
+
+    # ------------------------------------------------------------------
+    def _kind(self, value_cls: type) -> int:
+        """Return the cached way to walk values of a class."""
+
+        if (kind := self._kinds.get(value_cls)) is None:
+            kind = self._kinds[value_cls] = self._classify(value_cls)
+
+        return kind
+
+    # ------------------------------------------------------------------
+    def _classify(self, value_cls: type) -> int:
+        """Return the way to walk values of a class not seen before."""
+
+        if (
+            value_cls.__dictoffset__ == 0
+            or issubclass(value_cls, type)
+            or value_cls.__getstate__ is not object.__getstate__
+            or value_cls.__reduce_ex__ is not object.__reduce_ex__
+            or value_cls.__reduce__ is not object.__reduce__
+        ):
+            return self._PLAIN
+
+        if issubclass(value_cls, dict):
+            return self._DICT_OBJECT
+
+        if issubclass(value_cls, list):
+            return self._LIST_OBJECT
+
+        # Subclasses of other builtins hold state a copy can't carry over
+        if value_cls.__new__ is not object.__new__:
+            return self._PLAIN
+
+        return self._OBJECT
+
+    # ------------------------------------------------------------------
+    def attributes(self, obj_cls: type, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Return the persisted attributes, with their values filtered."""
+
+        if (persisted := self._persisted.get(obj_cls)) is None:
+            persisted = self._persisted[obj_cls] = {}
+
+        kinds: dict[type, int] = self._kinds
+        result: dict[str, Any] = {}
+
+        for name, value in attrs.items():
+            if (keep := persisted.get(name)) is None:
+                keep = persisted[name] = not self.is_hidden(name)
+
+            if not keep:
+                continue
+
+            # Plain values are the common case, skip the call for those
+            if kinds.get(type(value)) == self._PLAIN:
+                result[name] = value
+            else:
+                result[name] = self.value(value)
+
+        return result
+
+    # ------------------------------------------------------------------
+    def _items(self, items: Any) -> list[Any]:
+        """Return the filtered items of a container."""
+
+        kinds: dict[type, int] = self._kinds
+        plain: int = self._PLAIN
+        return [
+            item if kinds.get(type(item)) == plain else self.value(item)
+            for item in items
+        ]
+
+    # ------------------------------------------------------------------
+    def value(self, value: Any) -> Any:
+        """Return value with hidden attributes stripped from nested objects."""
+
+        kind: int = self._kind(type(value))
+
+        if kind == self._PLAIN:
+            return value
+
+        if kind == self._DICT:
+            return dict(zip(value, self._items(value.values()), strict=True))
+
+        if kind == self._LIST:
+            return self._items(value)
+
+        if kind == self._TUPLE:
+            return tuple(self._items(value))
+
+        value_cls: type = type(value)
+        copy: Any = value_cls.__new__(value_cls)
+
+        # Filled through the base class, overrides may expect more state
+        if kind == self._DICT_OBJECT:
+            dict.update(copy, zip(value, self._items(dict.values(value)), strict=True))
+        elif kind == self._LIST_OBJECT:
+            list.extend(copy, self._items(value))
+
+        copy.__dict__.update(self.attributes(value_cls, value.__dict__))
+        return copy
+
+
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
 class StorageJson:
@@ -48,9 +189,30 @@ class StorageJson:
 
     This class is used to store data in a json file.
 
-    External imports: jsonpickle
+    The codec defaults to the orjson schema codec, so a subclass must declare
+    its stored fields as a dataclass, or pass another codec. Data written by
+    jsonpickle is still read by other codecs if jsonpickle is installed, so a
+    subclass can switch codec and migrate on first write.
+
+    Attributes with names ending with ___ are hidden and not written,
+    unless write_hidden_attributes___ is set.
+
+    External imports: orjson, jsonpickle (optional)
     """
 
+    _INTERNAL_ATTRIBUTES: ClassVar[frozenset[str]] = frozenset(
+        {
+            "codec___",
+            "write_hidden_attributes___",
+            "hass___",
+            "store___",
+            "DICT_KEY___",
+            "base_class___",
+        }
+    )
+    _attribute_filter: ClassVar[HiddenAttributeFilter] = HiddenAttributeFilter()
+    _default_codec: ClassVar[StorageCodec] = OrjsonCodec()
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -58,10 +220,14 @@ class StorageJson:
         version: int = 1,
         minor_version: int = 1,
         async_migrate_func: Callable[[int, int, Any], Any] | None = None,
+        codec: StorageCodec | None = None,
     ) -> None:
         """Init."""
 
-        self.DICT_KEY___ = "jsonpickle"
+        self.codec___: StorageCodec = (
+            codec if codec is not None else self._default_codec
+        )
+        self.DICT_KEY___ = self.codec___.DICT_KEY
         self.write_hidden_attributes___: bool = False
         self.hass___ = hass
         self.store___ = StoreMigrate(
@@ -78,6 +244,7 @@ class StorageJson:
         """read_settings."""
 
         tmp_dict: dict = None
+        tmp_attrs: dict[str, Any] | None = None
 
         data = await self.store___.async_load()
 
@@ -86,45 +253,62 @@ class StorageJson:
 
         if type(data) is dict:
             if self.DICT_KEY___ in data:
-                jsonpickle.set_encoder_options("json", ensure_ascii=False)
-                tmp_obj = self.decode_data(data[self.DICT_KEY___])
+                tmp_attrs = self.decode_data(data[self.DICT_KEY___])
                 del data[self.DICT_KEY___]
 
+            elif JsonPickleCodec.DICT_KEY in data:
+                # Written by an older version with the jsonpickle codec
+                if JsonPickleCodec.available():
+                    tmp_attrs = JsonPickleCodec().decode(
+                        type(self), data[JsonPickleCodec.DICT_KEY]
+                    )
+                del data[JsonPickleCodec.DICT_KEY]
+
             if len(data) > 0:
                 tmp_dict = data
         else:
-            tmp_obj = self.decode_data(data)
+            tmp_attrs = self.decode_data(data)
 
-        if not self.base_class___:
-            if not hasattr(tmp_obj, "__dict__"):
-                return tmp_dict
-            self.__dict__.update(tmp_obj.__dict__)
+        if not self.base_class___ and tmp_attrs is not None:
+            self.__dict__.update(tmp_attrs)
 
         return tmp_dict
 
     # ------------------------------------------------------------------
-    def decode_data(self, data: Any):
-        """Decode data."""
-        return jsonpickle.decode(data)
+    def decode_data(self, data: Any) -> dict[str, Any] | None:
+        """Decode data to attributes."""
+        return self.codec___.decode(type(self), data)
 
     # ------------------------------------------------------------------
     async def async_write_settings(self, extra_data: dict = {}) -> None:
         """Write settings."""
 
-        jsonpickle.set_encoder_options("json", ensure_ascii=False)
+        await self.store___.async_save(self.settings_data(extra_data))
+
+    # ------------------------------------------------------------------
+    def delay_write_settings(self, delay: float = 0, extra_data: dict = {}) -> None:
+        """Write settings after delay.
+
+        Writes requested within the delay are coalesced into one, and the
+        settings are only encoded when actually written. Pending writes are
+        flushed when Home Assistant stops.
+        """
+
+        self.store___.async_delay_save(lambda: self.settings_data(extra_data), delay)
+
+    # ------------------------------------------------------------------
+    def settings_data(self, extra_data: dict = {}) -> dict:
+        """Return the data to write."""
 
         if self.base_class___:
-            await self.store___.async_save(extra_data)
+            return extra_data
 
-        else:
-            await self.store___.async_save(
-                {self.DICT_KEY___: self.encode_data(self), **extra_data}
-            )
+        return {self.DICT_KEY___: self.encode_data(self), **extra_data}
 
     # ------------------------------------------------------------------
     def encode_data(self, data: Any):
         """Encode data."""
-        return jsonpickle.encode(data, unpicklable=True)
+        return self.codec___.encode(data)
 
     # ------------------------------------------------------------------
     async def async_remove_settings(self) -> None:
@@ -134,33 +318,12 @@ class StorageJson:
     # ------------------------------------------------------------------
     def __getstate__(self) -> dict:
         """Get state."""
-        tmp_dict = self.__dict__.copy()
-        del tmp_dict["write_hidden_attributes___"]
-        del tmp_dict["hass___"]
-        del tmp_dict["store___"]
-        del tmp_dict["DICT_KEY___"]
-        del tmp_dict["base_class___"]
-
-        if self.write_hidden_attributes___ is False:
-            try:
-
-                def remove_hidden_attrib(obj) -> None:
-                    for key in list(obj):
-                        if len(key) > 2 and key[0:2] == "__":
-                            continue
-                        elif hasattr(obj[key], "__dict__"):  # noqa: RET507
-                            remove_hidden_attrib(obj[key].__dict__)
-
-                        # Remove hidden attributes
-                        elif len(key) > 3 and key[-3:] == "___":
-                            del obj[key]
-
-                        elif isinstance(obj[key], list):
-                            for item in obj[key]:
-                                if hasattr(item, "__dict__"):
-                                    remove_hidden_attrib(item.__dict__)
-
-                remove_hidden_attrib(tmp_dict)
-            except Exception:  # noqa: BLE001
-                pass
-        return tmp_dict
+
+        if self.write_hidden_attributes___:
+            return {
+                key: value
+                for key, value in self.__dict__.items()
+                if key not in self._INTERNAL_ATTRIBUTES
+            }
+
+        return self._attribute_filter.attributes(type(self), self.__dict__)
@@ -0,0 +1,268 @@
+"""Dynamic per issue entities for Hiper drift."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from hashlib import blake2b
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+
+from .const import LOGGER, IssueType
+from .issues_diff import issue_key
+
+if TYPE_CHECKING:
+    from .binary_sensor import HiperActiveIssueBinarySensor
+    from .component_api import ComponentApi, HiperIssues, IssueItem
+    from .issues_diff import IssueChangeSet
+
+EntityFactory = Callable[[IssueType, str, "IssueItem"], "HiperActiveIssueBinarySensor"]
+
+
+# ------------------------------------------------------------------
+def issue_unique_id_prefix(entry: ConfigEntry) -> str:
+    """Return the unique id prefix of the per issue entities of an entry."""
+    return f"{entry.entry_id}_issue_"
+
+
+# ------------------------------------------------------------------
+def issue_slug(key: Hashable) -> str:
+    """Return a unique id part for an issue key, stable between runs."""
+
+    if isinstance(key, int | str):
+        return str(key)
+
+    return blake2b(repr(key).encode(), digest_size=8).hexdigest()
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class IssueEntityManager:
+    """Keeps one entity per active issue of a config entry.
+
+    General issues, and regional issues of the entry's region matching its
+    filters, get an entity. The entities are reconciled against the change
+    set of each poll, so the work is proportional to the number of
+    changes, and new entities are added in one batch.
+
+    To keep entity registry and recorder churn bounded, a resolved issue's
+    entity turns off and is only removed after REMOVE_DELAY. If the issue
+    comes back before that, the entity is reused. At most MAX_ENTITIES are
+    kept.
+    """
+
+    REMOVE_DELAY: float = 30 * 60
+    MAX_ENTITIES: int = 50
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        component_api: ComponentApi,
+        async_add_entities: AddEntitiesCallback,
+        entity_factory: EntityFactory,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.entry: ConfigEntry = entry
+        self.component_api: ComponentApi = component_api
+        self.async_add_entities: AddEntitiesCallback = async_add_entities
+        self.entity_factory: EntityFactory = entity_factory
+
+        self.entities: dict[Hashable, HiperActiveIssueBinarySensor] = {}
+        # Resolved issues waiting for removal, by monotonic resolve time
+        self.resolved: dict[Hashable, float] = {}
+        self._unsub_sweep: CALLBACK_TYPE | None = None
+        self._registry_purged: bool = False
+
+        self.added_entities: int = 0
+        self.removed_entities: int = 0
+        self.reused_entities: int = 0
+        self.skipped_max_entities: int = 0
+
+    # ------------------------------------------------------------------
+    @callback
+    def reconcile(
+        self, issues: HiperIssues, change_set: IssueChangeSet | None = None
+    ) -> None:
+        """Reconcile the entities, fully if there is no change set."""
+
+        new_entities: list[HiperActiveIssueBinarySensor] = []
+
+        if change_set is None:
+            self._reconcile_all(issues, new_entities)
+        else:
+            for change in change_set.added + change_set.updated:
+                if self.component_api.is_relevant(change.issue_type, change.issue):
+                    self._activate(
+                        change.key, change.issue_type, change.issue, new_entities
+                    )
+                else:
+                    self._resolve(change.key, change.issue)
+
+            for change in change_set.resolved:
+                self._resolve(change.key, change.issue)
+
+        if new_entities:
+            self.added_entities += len(new_entities)
+            self.async_add_entities(new_entities)
+
+        self._schedule_sweep()
+
+    # ------------------------------------------------------------------
+    def _reconcile_all(
+        self,
+        issues: HiperIssues,
+        new_entities: list[HiperActiveIssueBinarySensor],
+    ) -> None:
+        """Reconcile against all active issues."""
+
+        active: dict[Hashable, tuple[IssueType, IssueItem]] = {
+            issue_key(issue): (IssueType.GENEREL, issue) for issue in issues.globals
+        }
+
+        for indexed_issue in issues.region_issues(self.component_api.region_num):
+            if self.component_api.is_match(
+                indexed_issue.get_normalized(self.component_api.match_case)
+            ):
+                active[issue_key(indexed_issue.issue)] = (
+                    IssueType.REGIONAL,
+                    indexed_issue.issue,
+                )
+
+        for key, (issue_type, issue) in active.items():
+            self._activate(key, issue_type, issue, new_entities)
+
+        for key, entity in list(self.entities.items()):
+            if key not in active:
+                self._resolve(key, entity.issue)
+
+        # Issues resolved while Home Assistant was stopped would otherwise
+        # stay in the registry
+        if not self._registry_purged:
+            self._registry_purged = True
+            async_purge_issue_entities(
+                self.hass,
+                self.entry,
+                {issue_slug(key) for key in active.keys() | self.entities.keys()},
+            )
+
+    # ------------------------------------------------------------------
+    def _activate(
+        self,
+        key: Hashable,
+        issue_type: IssueType,
+        issue: IssueItem,
+        new_entities: list[HiperActiveIssueBinarySensor],
+    ) -> None:
+        """Add or update the entity of an active issue."""
+
+        if (entity := self.entities.get(key)) is not None:
+            if self.resolved.pop(key, None) is not None:
+                self.reused_entities += 1
+
+            entity.set_issue(issue, True)
+            return
+
+        if len(self.entities) >= self.MAX_ENTITIES:
+            self.skipped_max_entities += 1
+            LOGGER.debug("Max %s issue entities reached", self.MAX_ENTITIES)
+            return
+
+        entity = self.entities[key] = self.entity_factory(
+            issue_type, issue_slug(key), issue
+        )
+        new_entities.append(entity)
+
+    # ------------------------------------------------------------------
+    def _resolve(self, key: Hashable, issue: IssueItem) -> None:
+        """Turn the entity of a resolved issue off, it is removed later."""
+
+        if (entity := self.entities.get(key)) is None or key in self.resolved:
+            return
+
+        entity.set_issue(issue, False)
+        self.resolved[key] = monotonic()
+
+    # ------------------------------------------------------------------
+    @callback
+    def _schedule_sweep(self) -> None:
+        """Schedule removal of resolved entities."""
+
+        if self._unsub_sweep is None and len(self.resolved) > 0:
+            self._unsub_sweep = async_call_later(
+                self.hass, self.REMOVE_DELAY, self._async_sweep
+            )
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_sweep(self, _now: Any) -> None:
+        """Remove the entities resolved for at least REMOVE_DELAY."""
+
+        self._unsub_sweep = None
+        now: float = monotonic()
+        registry: er.EntityRegistry = er.async_get(self.hass)
+
+        for key, resolved_at in list(self.resolved.items()):
+            if now - resolved_at < self.REMOVE_DELAY:
+                continue
+
+            del self.resolved[key]
+            entity: HiperActiveIssueBinarySensor = self.entities.pop(key)
+            self.removed_entities += 1
+
+            # Removing the registry entry also removes the entity
+            if entity.registry_entry is not None:
+                registry.async_remove(entity.entity_id)
+            else:
+                self.hass.async_create_task(entity.async_remove(force_remove=True))
+
+        self._schedule_sweep()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the scheduled removal."""
+
+        if self._unsub_sweep is not None:
+            self._unsub_sweep()
+            self._unsub_sweep = None
+
+    # ------------------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics."""
+        return {
+            "entities": len(self.entities),
+            "pending_removal": len(self.resolved),
+            "added_entities": self.added_entities,
+            "removed_entities": self.removed_entities,
+            "reused_entities": self.reused_entities,
+            "skipped_max_entities": self.skipped_max_entities,
+        }
+
+
+# ------------------------------------------------------------------
+@callback
+def async_purge_issue_entities(
+    hass: HomeAssistant, entry: ConfigEntry, keep_slugs: set[str] | None = None
+) -> None:
+    """Remove the registry entries of per issue entities, except keep_slugs.
+
+    All of them if keep_slugs is None, when per issue entities are off.
+    """
+
+    registry: er.EntityRegistry = er.async_get(hass)
+    prefix: str = issue_unique_id_prefix(entry)
+
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if registry_entry.unique_id.startswith(prefix) and (
+            keep_slugs is None
+            or registry_entry.unique_id.removeprefix(prefix) not in keep_slugs
+        ):
+            registry.async_remove(registry_entry.entity_id)
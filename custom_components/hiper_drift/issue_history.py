@@ -0,0 +1,550 @@
+"""Append only issue history for Hiper drift."""
+
+from __future__ import annotations
+
+from asyncio import Lock
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Hashable
+from contextlib import suppress
+from dataclasses import astuple, dataclass, replace
+from datetime import datetime, timedelta
+from hashlib import blake2b
+import mmap
+import os
+from struct import Struct
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER, IssueType
+
+if TYPE_CHECKING:
+    from .issues_diff import IssueChange, IssueChangeSet
+
+CHANGE_ADDED = "added"
+CHANGE_UPDATED = "updated"
+CHANGE_RESOLVED = "resolved"
+_CHANGE_CODES: dict[str, int] = {
+    CHANGE_ADDED: 0,
+    CHANGE_UPDATED: 1,
+    CHANGE_RESOLVED: 2,
+}
+
+# Region id of general issues in the index
+GENERAL_REGION_ID: int = -1
+
+# time, region id, change code, pad, key hash, log offset, record length
+_INDEX_ENTRY: Struct = Struct("<IhBxQQI")
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True, frozen=True)
+class HistoryIndexEntry:
+    """Sidecar index entry of one history record."""
+
+    time: int
+    region_id: int
+    change: int
+    key_hash: int
+    offset: int
+    length: int
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class IssueHistory:
+    """Append only on-disk history of issue changes.
+
+    Every added, updated and resolved issue is appended as a json line to a
+    log under .storage. A fixed size binary sidecar index holds the time,
+    region, change and issue key hash of each record, and is also kept in
+    memory. Range queries bisect the index by time and read only the
+    matching records from the memory mapped log. Outage counts are served
+    from the index alone.
+
+    Records are buffered in the event loop and written in batches in the
+    executor, and flushed when Home Assistant stops. When the log grows
+    past MAX_LOG_SIZE, or records are older than MAX_AGE, log and index are
+    compacted into new files.
+    """
+
+    MAX_LOG_SIZE: int = 4 * 1024 * 1024
+    MAX_AGE: timedelta = timedelta(days=400)
+    FLUSH_DELAY: float = 30
+    MAX_PENDING: int = 200
+    MAX_QUERY_RECORDS: int = 1000
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.log_path: str = hass.config.path(
+            STORAGE_DIR, f"{DOMAIN}.{name}.history.jsonl"
+        )
+        self.index_path: str = hass.config.path(
+            STORAGE_DIR, f"{DOMAIN}.{name}.history.idx"
+        )
+
+        self.entries: list[HistoryIndexEntry] = []
+        self._times: list[int] = []
+        self._key_hashes: set[int] = set()
+        self._log_size: int = 0
+        self._last_time: int = 0
+
+        self._pending: list[tuple[HistoryIndexEntry, bytes]] = []
+        self._unsub_flush: Callable[[], None] | None = None
+        self._unsub_final_write: CALLBACK_TYPE | None = None
+        self._lock: Lock = Lock()
+        self.loaded: bool = False
+
+        self.writes: int = 0
+        self.compactions: int = 0
+        self.index_rebuilds: int = 0
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def key_hash(key: Hashable) -> int:
+        """Return the 64 bit hash of an issue key, stable between runs."""
+        return int.from_bytes(
+            blake2b(repr(key).encode(), digest_size=8).digest(), "little"
+        )
+
+    # ------------------------------------------------------------------
+    async def async_load(self) -> None:
+        """Load the index, rebuilding it from the log if it does not match."""
+
+        async with self._lock:
+            if self.loaded:
+                return
+
+            entries, log_size, rebuilt = await self.hass.async_add_executor_job(
+                self._load
+            )
+            self._set_entries(entries, log_size)
+            self.index_rebuilds += rebuilt
+            self.loaded = True
+
+            self._unsub_final_write = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+            )
+
+    # ------------------------------------------------------------------
+    def _set_entries(self, entries: list[HistoryIndexEntry], log_size: int) -> None:
+        """Replace the in memory index."""
+
+        self.entries = entries
+        self._times = [entry.time for entry in entries]
+        self._key_hashes = {entry.key_hash for entry in entries}
+        self._log_size = log_size
+        self._last_time = max(self._last_time, self._times[-1] if entries else 0)
+
+    # ------------------------------------------------------------------
+    def _load(self) -> tuple[list[HistoryIndexEntry], int, bool]:
+        """Read the index and the log size. Runs in the executor."""
+
+        try:
+            log_size: int = os.path.getsize(self.log_path)
+        except FileNotFoundError:
+            return [], 0, False
+
+        entries: list[HistoryIndexEntry] = []
+
+        try:
+            with open(self.index_path, "rb") as index_file:
+                data: bytes = index_file.read()
+
+            if len(data) % _INDEX_ENTRY.size == 0:
+                entries = [
+                    HistoryIndexEntry(*values)
+                    for values in _INDEX_ENTRY.iter_unpack(data)
+                ]
+        except FileNotFoundError:
+            pass
+
+        # A crash between the log and index writes, or during compaction,
+        # leaves them out of step
+        if (entries[-1].offset + entries[-1].length if entries else 0) == log_size:
+            return entries, log_size, False
+
+        LOGGER.warning("Rebuilding issue history index %s", self.index_path)
+        return *self._rebuild_index(), True
+
+    # ------------------------------------------------------------------
+    def _rebuild_index(self) -> tuple[list[HistoryIndexEntry], int]:
+        """Rebuild the index from the log. Runs in the executor.
+
+        Invalid records are dropped from the log, and a partially written
+        last record is truncated. Returns the entries and the log size.
+        """
+
+        entries: list[HistoryIndexEntry] = []
+        lines: list[bytes] = []
+        offset: int = 0
+
+        with open(self.log_path, "rb") as log_file:
+            for line in log_file:
+                if not line.endswith(b"\n"):
+                    break
+
+                try:
+                    entries.append(
+                        self._index_entry(orjson.loads(line), offset, len(line))
+                    )
+                except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+                    LOGGER.warning("Dropping invalid issue history record")
+                    continue
+
+                lines.append(line)
+                offset += len(line)
+
+        with open(self.log_path + ".tmp", "wb") as log_file:
+            log_file.write(b"".join(lines))
+
+        os.replace(self.log_path + ".tmp", self.log_path)
+        self._write_index(self.index_path, entries, "wb")
+        return entries, offset
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _index_entry(
+        record: dict[str, Any], offset: int, length: int
+    ) -> HistoryIndexEntry:
+        """Return the index entry of a record."""
+
+        return HistoryIndexEntry(
+            record["ts"],
+            record["region_id"]
+            if record["issue_type"] != IssueType.GENEREL
+            else GENERAL_REGION_ID,
+            _CHANGE_CODES[record["change"]],
+            record["key_hash"],
+            offset,
+            length,
+        )
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _write_index(path: str, entries: list[HistoryIndexEntry], mode: str) -> None:
+        """Write index entries. Runs in the executor."""
+
+        with open(path, mode) as index_file:
+            index_file.write(
+                b"".join(_INDEX_ENTRY.pack(*astuple(entry)) for entry in entries)
+            )
+
+    # ------------------------------------------------------------------
+    def record(self, change_set: IssueChangeSet) -> None:
+        """Buffer the changes of a poll, they are written in batches.
+
+        The first diff after a start reports every active issue as added,
+        those already in the history are not recorded again.
+        """
+
+        if not self.loaded or not change_set:
+            return
+
+        now: int = max(int(dt_util.utcnow().timestamp()), self._last_time)
+        self._last_time = now
+
+        for change_type, changes in (
+            (CHANGE_ADDED, change_set.added),
+            (CHANGE_UPDATED, change_set.updated),
+            (CHANGE_RESOLVED, change_set.resolved),
+        ):
+            for change in changes:
+                key_hash: int = self.key_hash(change.key)
+
+                if change_set.initial and key_hash in self._key_hashes:
+                    continue
+
+                self._key_hashes.add(key_hash)
+                data: dict[str, Any] = self._record_data(
+                    now, change_type, key_hash, change
+                )
+                line: bytes = orjson.dumps(data) + b"\n"
+                self._pending.append((self._index_entry(data, 0, len(line)), line))
+
+        if len(self._pending) >= self.MAX_PENDING:
+            self._async_schedule_flush(0)
+        elif len(self._pending) > 0:
+            self._async_schedule_flush(self.FLUSH_DELAY)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _record_data(
+        now: int, change_type: str, key_hash: int, change: IssueChange
+    ) -> dict[str, Any]:
+        """Return the record of a change."""
+        return {
+            "ts": now,
+            "time": dt_util.utc_from_timestamp(now).isoformat(),
+            "change": change_type,
+            "key_hash": key_hash,
+            "issue_type": str(change.issue_type),
+            "region_id": change.issue.region_id or 0,
+            "subject": change.issue.subject,
+            "area": change.issue.area,
+            "status": change.issue.status,
+            "created_at": str(change.issue.created_dtm or ""),
+            "updated_at": str(change.issue.updated_at or ""),
+            "finished_at": str(change.issue.finished_at or ""),
+            "changed_fields": list(change.changed_fields),
+        }
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_schedule_flush(self, delay: float) -> None:
+        """Schedule a flush, unless an earlier one is already scheduled."""
+
+        if self._unsub_flush is not None:
+            if delay > 0:
+                return
+
+            self._unsub_flush()
+
+        self._unsub_flush = async_call_later(self.hass, delay, self._async_flush_later)
+
+    # ------------------------------------------------------------------
+    async def _async_flush_later(self, _now: datetime) -> None:
+        """Scheduled flush."""
+
+        self._unsub_flush = None
+        await self.async_flush()
+
+    # ------------------------------------------------------------------
+    async def async_flush(self) -> None:
+        """Write the buffered records, and compact if needed."""
+
+        async with self._lock:
+            if len(self._pending) == 0:
+                return
+
+            pending, self._pending = self._pending, []
+
+            try:
+                entries = await self.hass.async_add_executor_job(self._append, pending)
+            except OSError as err:
+                LOGGER.error("Writing issue history failed: %s", err)
+                return
+
+            self.writes += 1
+            self._set_entries(
+                self.entries + entries, entries[-1].offset + entries[-1].length
+            )
+
+            if self._needs_compaction():
+                self._set_entries(
+                    *await self.hass.async_add_executor_job(
+                        self._compact, self.entries, self._compaction_cutoff()
+                    )
+                )
+                self.compactions += 1
+
+    # ------------------------------------------------------------------
+    def _append(
+        self, pending: list[tuple[HistoryIndexEntry, bytes]]
+    ) -> list[HistoryIndexEntry]:
+        """Append records to the log and the index. Runs in the executor.
+
+        The offsets start at the size of the log on disk. If either write
+        fails, both files are truncated back, so log and index stay in step.
+        """
+
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+
+        log_size: int = self._file_size(self.log_path)
+        index_size: int = self._file_size(self.index_path)
+        entries: list[HistoryIndexEntry] = []
+        offset: int = log_size
+
+        for entry, _line in pending:
+            entries.append(replace(entry, offset=offset))
+            offset += entry.length
+
+        try:
+            with open(self.log_path, "ab") as log_file:
+                log_file.write(b"".join(line for _, line in pending))
+
+            self._write_index(self.index_path, entries, "ab")
+        except OSError:
+            # If this fails too, the mismatch is detected and rebuilt on load
+            with suppress(OSError):
+                os.truncate(self.log_path, log_size)
+            with suppress(OSError):
+                os.truncate(self.index_path, index_size)
+            raise
+
+        return entries
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """Return the size of a file, 0 if it does not exist."""
+
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    # ------------------------------------------------------------------
+    def _compaction_cutoff(self) -> int:
+        """Return the oldest time to keep."""
+        return int((dt_util.utcnow() - self.MAX_AGE).timestamp())
+
+    # ------------------------------------------------------------------
+    def _needs_compaction(self) -> bool:
+        """Return True if the log is too large or has expired records."""
+
+        return self._log_size > self.MAX_LOG_SIZE or (
+            len(self._times) > 0 and self._times[0] < self._compaction_cutoff()
+        )
+
+    # ------------------------------------------------------------------
+    def _compact(
+        self, entries: list[HistoryIndexEntry], cutoff: int
+    ) -> tuple[list[HistoryIndexEntry], int]:
+        """Rewrite log and index without expired and the oldest records.
+
+        Keeps records within MAX_AGE, and at most three quarters of
+        MAX_LOG_SIZE, so compaction does not run again on the next write.
+        Runs in the executor, returns the entries and the log size.
+        """
+
+        first: int = bisect_left([entry.time for entry in entries], cutoff)
+        size: int = 0
+        keep_size: int = self.MAX_LOG_SIZE * 3 // 4
+
+        for pos in range(len(entries) - 1, first - 1, -1):
+            if size + entries[pos].length > keep_size:
+                first = pos + 1
+                break
+
+            size += entries[pos].length
+
+        new_entries: list[HistoryIndexEntry] = []
+        offset: int = 0
+
+        with (
+            open(self.log_path, "rb") as log_file,
+            open(self.log_path + ".tmp", "wb") as new_log_file,
+            mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log_map,
+        ):
+            for entry in entries[first:]:
+                new_log_file.write(log_map[entry.offset : entry.offset + entry.length])
+                new_entries.append(replace(entry, offset=offset))
+                offset += entry.length
+
+        self._write_index(self.index_path + ".tmp", new_entries, "wb")
+
+        # The log first, a stale index is detected and rebuilt on load
+        os.replace(self.log_path + ".tmp", self.log_path)
+        os.replace(self.index_path + ".tmp", self.index_path)
+        return new_entries, offset
+
+    # ------------------------------------------------------------------
+    def _select(
+        self, start: datetime, end: datetime, region_id: int | None
+    ) -> list[HistoryIndexEntry]:
+        """Return the index entries in a time range, for a region if given."""
+
+        entries: list[HistoryIndexEntry] = self.entries[
+            bisect_left(self._times, int(start.timestamp())) : bisect_right(
+                self._times, int(end.timestamp())
+            )
+        ]
+
+        if region_id is None:
+            return entries
+
+        return [entry for entry in entries if entry.region_id == region_id]
+
+    # ------------------------------------------------------------------
+    async def async_count_outages(
+        self, start: datetime, end: datetime, region_id: int | None = None
+    ) -> int:
+        """Return the number of issues added in a time range.
+
+        Served from the index, no records are read.
+        """
+
+        await self.async_flush()
+
+        return len(
+            {
+                entry.key_hash
+                for entry in self._select(start, end, region_id)
+                if entry.change == _CHANGE_CODES[CHANGE_ADDED]
+            }
+        )
+
+    # ------------------------------------------------------------------
+    async def async_query(
+        self, start: datetime, end: datetime, region_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the records in a time range, newest MAX_QUERY_RECORDS."""
+
+        await self.async_flush()
+
+        async with self._lock:
+            entries: list[HistoryIndexEntry] = self._select(start, end, region_id)[
+                -self.MAX_QUERY_RECORDS :
+            ]
+
+            if len(entries) == 0:
+                return []
+
+            return await self.hass.async_add_executor_job(self._read, entries)
+
+    # ------------------------------------------------------------------
+    def _read(self, entries: list[HistoryIndexEntry]) -> list[dict[str, Any]]:
+        """Read records from the memory mapped log. Runs in the executor."""
+
+        with (
+            open(self.log_path, "rb") as log_file,
+            mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log_map,
+        ):
+            return [
+                orjson.loads(log_map[entry.offset : entry.offset + entry.length])
+                for entry in entries
+            ]
+
+    # ------------------------------------------------------------------
+    async def async_close(self) -> None:
+        """Cancel the scheduled flush and write the buffered records."""
+
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+
+        await self.async_flush()
+
+    # ------------------------------------------------------------------
+    async def _async_final_write(self, _event: Event) -> None:
+        """Write the buffered records when Home Assistant stops."""
+
+        # A listen_once listener is removed when it fires
+        self._unsub_final_write = None
+        await self.async_close()
+
+    # ------------------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics."""
+        return {
+            "records": len(self.entries),
+            "log_size": self._log_size,
+            "pending": len(self._pending),
+            "writes": self.writes,
+            "compactions": self.compactions,
+            "index_rebuilds": self.index_rebuilds,
+        }
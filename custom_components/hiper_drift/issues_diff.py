@@ -0,0 +1,205 @@
+"""Issue diff engine for Hiper drift."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from .component_api import HiperIssues, IssueItem, issue_match_text
+from .const import IssueType
+
+# Derived fields, not part of the feed
+_IGNORE_FIELDS: frozenset[str] = frozenset({"text", "markdown"})
+
+
+# ------------------------------------------------------------------
+def issue_key(issue: IssueItem) -> Hashable:
+    """Return the stable identity of an issue.
+
+    The feed id when present, otherwise region and creation time, which do
+    not change when the issue is edited.
+    """
+
+    if issue.id is not None:
+        return issue.id
+
+    if issue.created_dtm:
+        return (issue.region_id, str(issue.created_dtm))
+
+    return (issue.region_id, issue.subject)
+
+
+# ------------------------------------------------------------------
+def issue_fingerprint(issue: IssueItem) -> int:
+    """Return a cheap fingerprint of the content of an issue.
+
+    Catches edits to the subject, area, eta, status, region or messages that
+    the feed publishes without a new updated_at. The display flags
+    is_pinned and is_unfolded are left out.
+    """
+
+    return hash(
+        (
+            issue_match_text(issue),
+            issue.eta,
+            issue.status,
+            issue.finished_at,
+            issue.region_id,
+            tuple(
+                (message.created_at, message.message)
+                for message in issue.messages or ()
+            ),
+        )
+    )
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class IssueChange:
+    """Change of one issue."""
+
+    key: Hashable
+    issue_type: IssueType
+    issue: IssueItem
+    changed_fields: tuple[str, ...] = ()
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class IssueChangeSet:
+    """Changes between two polls."""
+
+    added: list[IssueChange] = field(default_factory=list)
+    updated: list[IssueChange] = field(default_factory=list)
+    resolved: list[IssueChange] = field(default_factory=list)
+    initial: bool = False
+
+    general_changed: bool = False
+    regions_changed: set[int] = field(default_factory=set)
+
+    # ------------------------------------------------------------------
+    def __bool__(self) -> bool:
+        """Return True if there are any changes."""
+        return len(self.added) + len(self.updated) + len(self.resolved) > 0
+
+    # ------------------------------------------------------------------
+    def record(self, changes: list[IssueChange], change: IssueChange) -> None:
+        """Record a change and track which sensors it touches."""
+
+        changes.append(change)
+        self.touch(change.issue_type, change.issue)
+
+    # ------------------------------------------------------------------
+    def touch(self, issue_type: IssueType, issue: IssueItem) -> None:
+        """Track that the sensor showing an issue must be checked again."""
+
+        if issue_type == IssueType.GENEREL:
+            self.general_changed = True
+        else:
+            self.regions_changed.add(issue.region_id)
+
+    # ------------------------------------------------------------------
+    def summary(self) -> dict[str, Any]:
+        """Return summary."""
+        return {
+            "initial": self.initial,
+            "added": len(self.added),
+            "updated": len(self.updated),
+            "resolved": len(self.resolved),
+        }
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class IssueDiffEngine:
+    """Incremental issue diff engine.
+
+    Keeps the previous snapshot indexed by issue identity. Each issue is
+    compared by its updated_at and content fingerprint only, field by field
+    comparison is done for the issues that actually changed.
+
+    The walk is linear in the number of issues, but it only runs for a
+    changed payload: the hub skips unchanged payloads by their hash before
+    parsing. Building the change set is linear in the number of changes.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self.snapshot: dict[Hashable, tuple[IssueType, IssueItem, int]] = {}
+        self.last_change_set: IssueChangeSet = IssueChangeSet(initial=True)
+
+    # ------------------------------------------------------------------
+    def reset(self) -> None:
+        """Forget the snapshot, the next diff reports every issue as added."""
+        self.snapshot = {}
+
+    # ------------------------------------------------------------------
+    def diff(self, issues: HiperIssues) -> IssueChangeSet:
+        """Diff issues against the previous snapshot, which is then replaced."""
+
+        change_set: IssueChangeSet = IssueChangeSet(initial=len(self.snapshot) == 0)
+        new_snapshot: dict[Hashable, tuple[IssueType, IssueItem, int]] = {}
+
+        for issue_type, tmp_issues in (
+            (IssueType.GENEREL, issues.globals),
+            (IssueType.REGIONAL, issues.regionals),
+        ):
+            for issue in tmp_issues:
+                key: Hashable = issue_key(issue)
+                fingerprint: int = issue_fingerprint(issue)
+                new_snapshot[key] = (issue_type, issue, fingerprint)
+                old: tuple[IssueType, IssueItem, int] | None = self.snapshot.get(key)
+
+                if old is None:
+                    change_set.record(
+                        change_set.added, IssueChange(key, issue_type, issue)
+                    )
+                elif (
+                    old[2] != fingerprint
+                    or old[1].updated_at != issue.updated_at
+                    or old[0] != issue_type
+                ):
+                    change_set.record(
+                        change_set.updated,
+                        IssueChange(
+                            key,
+                            issue_type,
+                            issue,
+                            self._changed_fields(old[1], issue),
+                        ),
+                    )
+                    # The sensor that showed it before, if it moved
+                    change_set.touch(old[0], old[1])
+
+        # Some old issues are gone, only then look them up
+        if len(new_snapshot) < len(self.snapshot) + len(change_set.added):
+            finisheds: dict[Hashable, IssueItem] = {
+                issue_key(issue): issue for issue in issues.finisheds
+            }
+
+            for key, (issue_type, issue, _fingerprint) in self.snapshot.items():
+                if key not in new_snapshot:
+                    change_set.record(
+                        change_set.resolved,
+                        IssueChange(key, issue_type, finisheds.get(key, issue)),
+                    )
+
+        self.snapshot = new_snapshot
+        self.last_change_set = change_set
+        return change_set
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _changed_fields(old: IssueItem, new: IssueItem) -> tuple[str, ...]:
+        """Return names of changed fields."""
+
+        return tuple(
+            tmp_field.name
+            for tmp_field in fields(IssueItem)
+            if tmp_field.name not in _IGNORE_FIELDS
+            and getattr(old, tmp_field.name) != getattr(new, tmp_field.name)
+        )
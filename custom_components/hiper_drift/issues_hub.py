@@ -0,0 +1,518 @@
+"""Shared issues hub for Hiper drift."""
+
+from __future__ import annotations
+
+from asyncio import Lock, timeout
+from datetime import datetime, timedelta
+from hashlib import blake2b
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import hdrs
+from aiohttp.client import ClientResponse
+import voluptuous as vol
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
+
+from .component_api import HiperIssues
+from .const import (
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DOMAIN,
+    EVENT_ISSUE_CHANGED,
+    LOGGER,
+)
+from .fetch_session import FetchSession
+from .hass_util import CircuitBreaker, CircuitOpenException, handle_retries
+from .issue_history import IssueHistory
+from .issues_diff import IssueChange, IssueChangeSet, IssueDiffEngine
+from .issues_snapshot import IssuesSnapshot
+from .poll_scheduler import PollScheduler
+
+if TYPE_CHECKING:
+    from .component_api import ComponentApi
+
+ATTR_REGION = "region"
+ATTR_START = "start"
+ATTR_END = "end"
+
+HISTORY_SERVICE_SCHEMA: vol.Schema = vol.Schema(
+    {
+        vol.Optional(ATTR_REGION): vol.All(vol.Coerce(int), vol.Range(min=1, max=3)),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class PayloadTooLargeException(Exception):
+    """Payload too large exception."""
+
+
+# ------------------------------------------------------------------
+def async_get_issues_hub(hass: HomeAssistant, url: str) -> IssuesHub:
+    """Return the shared issues hub for a feed url, creating it if needed."""
+
+    hubs: dict[str, IssuesHub] = hass.data.setdefault(DOMAIN, {})
+
+    if url not in hubs:
+        hubs[url] = IssuesHub(hass, url)
+
+    return hubs[url]
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class IssuesHub:
+    """Shared fetch/parse hub for one issues feed.
+
+    Runs one http request and one parse per poll and fans the parsed issues
+    out to every subscribed ComponentApi (one per config entry).
+    """
+
+    ISSUES_URL: str = "https://drift-api.hiper.dk/issues"
+    MAX_PAYLOAD_SIZE: int = 4 * 1024 * 1024
+    READ_CHUNK_SIZE: int = 64 * 1024
+    CIRCUIT_BREAKER: CircuitBreaker = CircuitBreaker(
+        failure_threshold=3, reset_timeout=10 * 60
+    )
+
+    def __init__(self, hass: HomeAssistant, url: str = ISSUES_URL) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.url: str = url
+        self.fetch_session: FetchSession = FetchSession(hass)
+        self.subscribers: dict[str, ComponentApi] = {}
+
+        self.issues: HiperIssues = HiperIssues()
+        self.issues_loaded: bool = False
+        self.diff_engine: IssueDiffEngine = IssueDiffEngine()
+
+        feed_name: str = blake2b(url.encode(), digest_size=4).hexdigest()
+        self.history: IssueHistory = IssueHistory(hass, feed_name)
+        self.snapshot: IssuesSnapshot = IssuesSnapshot(hass, feed_name)
+        self.snapshot_restored: bool = False
+
+        self.started: bool = False
+        self._start_lock: Lock = Lock()
+        self._unsub_at_started: CALLBACK_TYPE | None = None
+
+        self.request_timeout: int = 5
+
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        self.payload_hash: bytes | None = None
+        self.cache_hits_not_modified: int = 0
+        self.cache_hits_unchanged: int = 0
+        self.cache_misses: int = 0
+
+        self.poll_scheduler: PollScheduler = PollScheduler(
+            timedelta(minutes=DEFAULT_POLL_INTERVAL_MIN),
+            timedelta(minutes=DEFAULT_POLL_INTERVAL_MAX),
+        )
+
+        self.coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
+            hass,
+            LOGGER,
+            config_entry=None,
+            name=DOMAIN,
+            update_method=self.async_update,
+            update_interval=self.poll_scheduler.interval,
+            always_update=False,
+        )
+
+        """Setup the actions for the Hiper integration."""
+        hass.services.async_register(DOMAIN, "update", self.async_update_service)
+        hass.services.async_register(
+            DOMAIN, "markasread", self.async_mark_as_read_service
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "history",
+            self.async_history_service,
+            schema=HISTORY_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    # ------------------------------------------------------------------
+    async def async_subscribe(self, component_api: ComponentApi) -> None:
+        """Subscribe a config entry.
+
+        Costs no extra network or parse work, the already parsed issues are
+        evaluated for the new subscriber.
+        """
+
+        self.subscribers[component_api.entry.entry_id] = component_api
+        self.update_poll_bounds()
+
+        if self.issues_loaded:
+            await component_api.async_check_hiper(self.issues)
+            self.coordinator.async_update_listeners()
+
+    # ------------------------------------------------------------------
+    async def async_unsubscribe(self, entry_id: str) -> None:
+        """Unsubscribe a config entry and release the hub when unused."""
+
+        self.subscribers.pop(entry_id, None)
+
+        if len(self.subscribers) > 0:
+            self.update_poll_bounds()
+            return
+
+        self.hass.data.get(DOMAIN, {}).pop(self.url, None)
+        self.hass.services.async_remove(DOMAIN, "update")
+        self.hass.services.async_remove(DOMAIN, "markasread")
+        self.hass.services.async_remove(DOMAIN, "history")
+
+        if self._unsub_at_started is not None:
+            self._unsub_at_started()
+            self._unsub_at_started = None
+
+        await self.coordinator.async_shutdown()
+        # A new hub must not restore a stale snapshot after a reload
+        await self.snapshot.async_flush()
+        await self.history.async_close()
+        await self.fetch_session.async_close()
+
+    # ------------------------------------------------------------------
+    def update_poll_bounds(self) -> None:
+        """Use the tightest bounds of all subscribers.
+
+        If the pending poll interval is outside the new bounds, a refresh is
+        requested in the background. The coordinator schedules the poll after
+        it within the new bounds.
+        """
+
+        if not self.poll_scheduler.set_bounds(
+            min(api.poll_interval_min for api in self.subscribers.values()),
+            min(api.poll_interval_max for api in self.subscribers.values()),
+        ):
+            return
+
+        self.coordinator.update_interval = self.poll_scheduler.interval
+
+        if self.started:
+            self.hass.async_create_background_task(
+                self.coordinator.async_request_refresh(), f"{DOMAIN} poll bounds"
+            )
+
+    # ------------------------------------------------------------------
+    async def async_start(self) -> None:
+        """Restore the last known issues and refresh in the background.
+
+        Setup, and the Home Assistant startup waiting for it, is not blocked
+        on the feed. The first refresh runs once Home Assistant has started.
+        """
+
+        async with self._start_lock:
+            if self.started:
+                return
+
+            self.started = True
+            await self.history.async_load()
+            await self.async_restore_snapshot()
+            self._unsub_at_started = async_at_started(self.hass, self._async_at_started)
+
+    # ------------------------------------------------------------------
+    async def async_restore_snapshot(self) -> None:
+        """Load the issues and fetch validators of the last snapshot.
+
+        The restored issues are the diff baseline, so the first refresh
+        reports the changes made while Home Assistant was stopped.
+        """
+
+        if not await self.snapshot.async_load() or not self.issues.restore(
+            self.snapshot.issues
+        ):
+            return
+
+        self.diff_engine.diff(self.issues)
+        self.etag = self.snapshot.etag
+        self.last_modified = self.snapshot.last_modified
+        self.payload_hash = (
+            bytes.fromhex(self.snapshot.payload_hash)
+            if self.snapshot.payload_hash
+            else None
+        )
+        self.issues_loaded = True
+        self.snapshot_restored = True
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_at_started(self, hass: HomeAssistant) -> None:
+        """Run the first refresh in the background."""
+
+        self._unsub_at_started = None
+        hass.async_create_background_task(
+            self.coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
+    # ------------------------------------------------------------------
+    async def async_mark_as_read_service(self, call: ServiceCall) -> None:
+        """Hiper service interface."""
+
+        for component_api in list(self.subscribers.values()):
+            await component_api.async_mark_as_read()
+
+        self.coordinator.async_update_listeners()
+        await self.coordinator.async_request_refresh()
+
+    # ------------------------------------------------------------------
+    async def async_update_service(self, call: ServiceCall) -> None:
+        """Hiper service interface."""
+
+        for component_api in list(self.subscribers.values()):
+            await component_api.async_reset()
+
+        self.reset_payload_cache()
+        self.diff_engine.reset()
+
+        await self.async_update()
+        self.coordinator.async_update_listeners()
+        await self.coordinator.async_request_refresh()
+
+    # ------------------------------------------------------------------
+    async def async_history_service(self, call: ServiceCall) -> ServiceResponse:
+        """Hiper service interface.
+
+        Returns the outage count and the recorded changes in a period, by
+        default the current quarter.
+        """
+
+        end: datetime = self._as_aware(call.data.get(ATTR_END)) or dt_util.now()
+        start: datetime = self._as_aware(call.data.get(ATTR_START)) or end.replace(
+            month=(end.month - 1) // 3 * 3 + 1,
+            day=1,
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        region_id: int | None = call.data.get(ATTR_REGION)
+
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "region": region_id,
+            "outages": await self.history.async_count_outages(start, end, region_id),
+            "changes": await self.history.async_query(start, end, region_id),
+        }
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _as_aware(value: datetime | None) -> datetime | None:
+        """Return value in local time if it has no time zone."""
+
+        if value is None or value.tzinfo is not None:
+            return value
+
+        return value.replace(tzinfo=dt_util.get_default_time_zone())
+
+    # ------------------------------------------------------------------
+    async def async_update(self) -> bytes | None:
+        """Fetch, parse and fan out to subscribers.
+
+        Returns the hash of the latest payload, so the coordinator can skip
+        notifying listeners when nothing has changed.
+        """
+
+        issues_changed: bool = False
+
+        try:
+            fetched: tuple[bytearray, bytes] | None = await self._async_get_issues()
+        except CircuitOpenException as err:
+            raise UpdateFailed(f"{self.url} is unavailable: {err}") from err
+
+        if fetched is not None:
+            payload, payload_hash = fetched
+
+            if not self.issues.reload(payload):
+                # Not remembered as seen, the next poll fetches and parses again
+                self.etag = None
+                self.last_modified = None
+                raise UpdateFailed(f"Invalid issues payload from {self.url}")
+
+            self.payload_hash = payload_hash
+            self.snapshot.delay_save(
+                self.issues.snapshot_records(),
+                self.etag,
+                self.last_modified,
+                self.payload_hash,
+            )
+            change_set: IssueChangeSet = self.diff_engine.diff(self.issues)
+            # All subscribers are checked fully the first time
+            tmp_change_set: IssueChangeSet | None = (
+                change_set if self.issues_loaded else None
+            )
+            self.issues_loaded = True
+
+            for component_api in list(self.subscribers.values()):
+                issues_changed |= await component_api.async_check_hiper(
+                    self.issues, tmp_change_set
+                )
+
+            self.fire_change_events(change_set)
+            self.history.record(change_set)
+
+        self.coordinator.update_interval = self.poll_scheduler.next_interval(
+            any(
+                api.state.is_on_general or api.state.is_on_regional
+                for api in self.subscribers.values()
+            ),
+            issues_changed,
+        )
+
+        return self.payload_hash
+
+    # ------------------------------------------------------
+    def fire_change_events(self, change_set: IssueChangeSet) -> None:
+        """Fire an event per changed issue, not for the initial snapshot."""
+
+        if change_set.initial:
+            return
+
+        for change_type, changes in (
+            ("added", change_set.added),
+            ("updated", change_set.updated),
+            ("resolved", change_set.resolved),
+        ):
+            for change in changes:
+                self.hass.bus.async_fire(
+                    EVENT_ISSUE_CHANGED, self._event_data(change_type, change)
+                )
+
+    # ------------------------------------------------------
+    @staticmethod
+    def _event_data(change_type: str, change: IssueChange) -> dict[str, Any]:
+        """Return event data for a change."""
+        return {
+            "change": change_type,
+            "issue_type": str(change.issue_type),
+            "region_id": change.issue.region_id,
+            "subject": change.issue.subject,
+            "area": change.issue.area,
+            "updated_at": str(change.issue.updated_at),
+            "finished_at": str(change.issue.finished_at or ""),
+            "changed_fields": list(change.changed_fields),
+        }
+
+    # ------------------------------------------------------
+    def reset_payload_cache(self) -> None:
+        """Forget validators and payload hash, forcing a full fetch and parse."""
+        self.etag = None
+        self.last_modified = None
+        self.payload_hash = None
+
+    # ------------------------------------------------------
+    def fetch_diagnostics(self) -> dict[str, Any]:
+        """Return fetch cache diagnostics."""
+        return {
+            "url": self.url,
+            "subscribers": len(self.subscribers),
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "payload_hash": self.payload_hash.hex() if self.payload_hash else None,
+            "cache_hits_not_modified": self.cache_hits_not_modified,
+            "cache_hits_unchanged": self.cache_hits_unchanged,
+            "cache_misses": self.cache_misses,
+            "last_change_set": self.diff_engine.last_change_set.summary(),
+            "issue_history": self.history.diagnostics(),
+            "snapshot_restored": self.snapshot_restored,
+            "snapshot_saved_at": self.snapshot.saved_at,
+        }
+
+    # ------------------------------------------------------
+    @handle_retries(
+        retries=5,
+        retry_delay=1,
+        backoff_factor=2,
+        max_retry_delay=10,
+        jitter=True,
+        deadline=20,
+        circuit_breaker=CIRCUIT_BREAKER,
+        stop_on_exceptions=[PayloadTooLargeException],
+    )
+    async def _async_get_issues(self) -> tuple[bytearray, bytes] | None:
+        """Get issues.
+
+        Returns the payload and its hash, or None when the payload is
+        unchanged since the last fetch.
+        """
+        headers: dict[str, str] = {}
+
+        if self.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = self.etag
+
+        if self.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = self.last_modified
+
+        async with timeout(self.request_timeout):
+            response = await self.fetch_session.session.get(self.url, headers=headers)
+
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                response.release()
+                self.cache_hits_not_modified += 1
+                return None
+
+            response.raise_for_status()
+            payload, payload_hash = await self._async_read_payload(response)
+
+        self.etag = response.headers.get(hdrs.ETAG)
+        self.last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+
+        if payload_hash == self.payload_hash:
+            self.cache_hits_unchanged += 1
+            return None
+
+        self.cache_misses += 1
+        return payload, payload_hash
+
+    # ------------------------------------------------------
+    async def _async_read_payload(
+        self, response: ClientResponse
+    ) -> tuple[bytearray, bytes]:
+        """Stream the response body into a buffer and hash it on the way.
+
+        Raises PayloadTooLargeException if the body exceeds MAX_PAYLOAD_SIZE.
+        """
+
+        if (
+            response.content_length is not None
+            and response.content_length > self.MAX_PAYLOAD_SIZE
+        ):
+            response.close()
+            raise PayloadTooLargeException(
+                f"Payload of {response.content_length} bytes is too large"
+            )
+
+        payload: bytearray = bytearray()
+        payload_hash = blake2b(digest_size=16)
+
+        async for chunk in response.content.iter_chunked(self.READ_CHUNK_SIZE):
+            if len(payload) + len(chunk) > self.MAX_PAYLOAD_SIZE:
+                response.close()
+                raise PayloadTooLargeException(
+                    f"Payload exceeds {self.MAX_PAYLOAD_SIZE} bytes"
+                )
+
+            payload += chunk
+            payload_hash.update(chunk)
+
+        return payload, payload_hash.digest()
@@ -0,0 +1,85 @@
+"""Persisted last known issues for Hiper drift."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .hass_util import OrjsonCodec, StorageJson
+
+_CODEC: OrjsonCodec = OrjsonCodec()
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(init=False, eq=False)
+class IssuesSnapshot(StorageJson):
+    """Last known active issues and the fetch validators of their payload.
+
+    Restored at setup, so the entities get their state from the last known
+    issues before the first network refresh. The issues are stored as
+    decoded records without finished issues and derived text, not as the
+    raw payload. The validators make the first refresh a conditional
+    request, which skips the parse when the feed has not changed. Saves are
+    delayed, the issues only change when the feed does, and flushed when
+    the hub is released.
+    """
+
+    SAVE_DELAY: ClassVar[int] = 60
+
+    issues: dict[str, list[dict[str, Any]]] | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    payload_hash: str | None = None
+    saved_at: str | None = None
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Init."""
+
+        super().__init__(hass, f"{DOMAIN}.{name}.snapshot", codec=_CODEC)
+
+        self.issues = None
+        self.etag = None
+        self.last_modified = None
+        self.payload_hash = None
+        self.saved_at = None
+        self.save_pending___: bool = False
+
+    # ------------------------------------------------------------------
+    async def async_load(self) -> bool:
+        """Load the snapshot, returns True if there are issues."""
+
+        await self.async_read_settings()
+        return self.issues is not None
+
+    # ------------------------------------------------------------------
+    def delay_save(
+        self,
+        issues: dict[str, list[dict[str, Any]]],
+        etag: str | None,
+        last_modified: str | None,
+        payload_hash: bytes | None,
+    ) -> None:
+        """Save new issues after SAVE_DELAY."""
+
+        self.issues = issues
+        self.etag = etag
+        self.last_modified = last_modified
+        self.payload_hash = payload_hash.hex() if payload_hash else None
+        self.saved_at = dt_util.utcnow().isoformat()
+        self.save_pending___ = True
+        self.delay_write_settings(self.SAVE_DELAY)
+
+    # ------------------------------------------------------------------
+    async def async_flush(self) -> None:
+        """Write a delayed save now, which also cancels the delayed write."""
+
+        if not self.save_pending___:
+            return
+
+        self.save_pending___ = False
+        await self.async_write_settings()
@@ -0,0 +1,239 @@
+"""Boolean match expressions for Hiper drift."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from re import Pattern, compile
+from typing import Any
+
+from .text_normalize import NormalizedText, normalize_word
+from .word_matcher import WordMatcher
+
+Evaluator = Callable[[NormalizedText], bool]
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class MatchExpressionException(Exception):
+    """Invalid match expression."""
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class MatchExpression:
+    """Boolean match expression.
+
+    Terms are words or "quoted phrases", combined with AND, OR, NOT and
+    parentheses. Adjacent terms without an operator are AND'ed, and NOT binds
+    tighter than AND, which binds tighter than OR. Example:
+
+        (Odense OR "Nørre Aaby") NOT Middelfart
+
+    Terms are matched by WordMatcher, so Danish spellings fold alike. The
+    expression is parsed once into an evaluator. Results are memoized per
+    folded issue text, so unchanged issues are not evaluated again between
+    polls.
+    """
+
+    MAX_CACHE_SIZE: int = 1024
+
+    _TOKEN_RE: Pattern[str] = compile(r'\s*(?:([()])|"([^"]*)("?)|([^\s()"]+))')
+    _OPERATORS: frozenset[str] = frozenset({"AND", "OR", "NOT"})
+
+    def __init__(
+        self,
+        expression: str,
+        use_word_boundaries: bool = True,
+        case_sensitive: bool = False,
+    ) -> None:
+        """Init.
+
+        Raises MatchExpressionException if the expression is invalid.
+        """
+
+        self.expression: str = expression
+        self.terms: list[str] = []
+        self._tokens: list[tuple[str, str]] = self._tokenize(expression)
+        self._pos: int = 0
+
+        evaluator: Evaluator = self._parse_or()
+
+        if self._pos < len(self._tokens):
+            raise MatchExpressionException(f"Unexpected '{self._tokens[self._pos][1]}'")
+
+        self._evaluator: Evaluator = evaluator
+        self._matcher: WordMatcher = WordMatcher(
+            self.terms, use_word_boundaries, case_sensitive
+        )
+        self._normalized_terms: list[str] = [
+            self._matcher.normalize_word(term) for term in self.terms
+        ]
+        self._cache: dict[str, bool] = {}
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def compile(
+        cls,
+        expression: str | None,
+        use_word_boundaries: bool = True,
+        case_sensitive: bool = False,
+    ) -> MatchExpression | None:
+        """Return a compiled expression, or None if the expression is blank.
+
+        Raises MatchExpressionException if the expression is invalid.
+        """
+
+        if expression is None or expression.strip() == "":
+            return None
+
+        return cls(expression, use_word_boundaries, case_sensitive)
+
+    # ------------------------------------------------------------------
+    def _tokenize(self, expression: str) -> list[tuple[str, str]]:
+        """Split the expression into (kind, value) tokens."""
+
+        tokens: list[tuple[str, str]] = []
+        pos: int = 0
+
+        while pos < len(expression.rstrip()):
+            if (token := self._TOKEN_RE.match(expression, pos)) is None:
+                raise MatchExpressionException(f"Invalid expression at {pos}")
+
+            paren, phrase, phrase_end, word = token.groups()
+            pos = token.end()
+
+            if paren is not None:
+                tokens.append((paren, paren))
+            elif phrase is not None:
+                if phrase_end == "":
+                    raise MatchExpressionException("Missing closing quote")
+
+                if normalize_word(phrase) == "":
+                    raise MatchExpressionException("Empty phrase")
+
+                tokens.append(("term", phrase))
+            elif word.upper() in self._OPERATORS:
+                tokens.append((word.upper(), word))
+            elif normalize_word(word) == "":
+                raise MatchExpressionException(f"No letters or digits in '{word}'")
+            else:
+                tokens.append(("term", word))
+
+        if len(tokens) == 0:
+            raise MatchExpressionException("Empty expression")
+
+        return tokens
+
+    # ------------------------------------------------------------------
+    def _peek(self) -> str | None:
+        """Return the kind of the next token."""
+        return self._tokens[self._pos][0] if self._pos < len(self._tokens) else None
+
+    # ------------------------------------------------------------------
+    def _parse_or(self) -> Evaluator:
+        """or := and (OR and)*."""
+
+        operands: list[Evaluator] = [self._parse_and()]
+
+        while self._peek() == "OR":
+            self._pos += 1
+            operands.append(self._parse_and())
+
+        if len(operands) == 1:
+            return operands[0]
+
+        return lambda text: any(operand(text) for operand in operands)
+
+    # ------------------------------------------------------------------
+    def _parse_and(self) -> Evaluator:
+        """and := not ([AND] not)*."""
+
+        operands: list[Evaluator] = [self._parse_not()]
+
+        while self._peek() in ("AND", "NOT", "term", "("):
+            if self._peek() == "AND":
+                self._pos += 1
+
+            operands.append(self._parse_not())
+
+        if len(operands) == 1:
+            return operands[0]
+
+        return lambda text: all(operand(text) for operand in operands)
+
+    # ------------------------------------------------------------------
+    def _parse_not(self) -> Evaluator:
+        """not := NOT not | atom."""
+
+        if self._peek() == "NOT":
+            self._pos += 1
+            operand: Evaluator = self._parse_not()
+            return lambda text: not operand(text)
+
+        return self._parse_atom()
+
+    # ------------------------------------------------------------------
+    def _parse_atom(self) -> Evaluator:
+        """atom := term | ( or )."""
+
+        kind: str | None = self._peek()
+
+        if kind == "term":
+            index: int = len(self.terms)
+            self.terms.append(self._tokens[self._pos][1])
+            self._pos += 1
+            # The matcher and the normalized terms are created after parsing
+            return lambda text: self._matcher.contains(
+                text, self._normalized_terms[index]
+            )
+
+        if kind == "(":
+            self._pos += 1
+            evaluator: Evaluator = self._parse_or()
+
+            if self._peek() != ")":
+                raise MatchExpressionException("Missing closing parenthesis")
+
+            self._pos += 1
+            return evaluator
+
+        if kind is None:
+            raise MatchExpressionException("Unexpected end of expression")
+
+        raise MatchExpressionException(f"Unexpected '{self._tokens[self._pos][1]}'")
+
+    # ------------------------------------------------------------------
+    def evaluate(self, text: str | NormalizedText) -> bool:
+        """Return True if text matches the expression."""
+
+        text = self._matcher.normalize(text)
+
+        if (result := self._cache.get(text.text)) is not None:
+            self.cache_hits += 1
+            return result
+
+        self.cache_misses += 1
+
+        if len(self._cache) >= self.MAX_CACHE_SIZE:
+            self._cache.clear()
+
+        result = self._cache[text.text] = self._evaluator(text)
+        return result
+
+    # ------------------------------------------------------------------
+    def find(self, text: str | NormalizedText) -> list[str]:
+        """Return the terms found in text."""
+        return self._matcher.find(text)
+
+    # ------------------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics."""
+        return {
+            "expression": self.expression,
+            "terms": self.terms,
+            "cache_size": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
@@ -0,0 +1,123 @@
+"""Adaptive poll scheduler for Hiper drift."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from enum import StrEnum
+from random import uniform
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class PollReason(StrEnum):
+    """Reason for the current poll interval."""
+
+    STARTUP = "startup"
+    CHANGED = "changed"
+    RECENTLY_CHANGED = "recently_changed"
+    ACTIVE = "active"
+    QUIET = "quiet"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class PollScheduler:
+    """Adaptive poll scheduler.
+
+    Polls at the minimum interval while an issue is active or has recently
+    changed, and backs off exponentially towards the maximum interval while
+    things are quiet. A random jitter is applied to every interval, so many
+    installs do not poll in lockstep.
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta,
+        max_interval: timedelta,
+        recent_window: timedelta = timedelta(hours=1),
+        jitter: float = 0.1,
+    ) -> None:
+        """Init."""
+
+        self.min_interval: timedelta = min_interval
+        self.max_interval: timedelta = max(max_interval, min_interval)
+        self.recent_window: timedelta = recent_window
+        self.jitter: float = jitter
+
+        self.last_change: datetime | None = None
+        self.quiet_polls: int = 0
+        self.reason: PollReason = PollReason.STARTUP
+        self.interval: timedelta = self._apply_jitter(self.min_interval)
+
+    # ------------------------------------------------------------------
+    def set_bounds(self, min_interval: timedelta, max_interval: timedelta) -> bool:
+        """Set min/max bounds and clamp the current interval to them.
+
+        Returns True if the current interval changed.
+        """
+
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+
+        tmp_interval: timedelta = min(
+            max(self.interval, self.min_interval), self.max_interval
+        )
+
+        if tmp_interval == self.interval:
+            return False
+
+        self.interval = tmp_interval
+        return True
+
+    # ------------------------------------------------------------------
+    def _apply_jitter(self, interval: timedelta) -> timedelta:
+        """Apply random jitter and clamp to bounds."""
+
+        tmp_interval: timedelta = interval * uniform(1 - self.jitter, 1 + self.jitter)
+        return min(max(tmp_interval, self.min_interval), self.max_interval)
+
+    # ------------------------------------------------------------------
+    def next_interval(self, active: bool, changed: bool) -> timedelta:
+        """Calculate the next poll interval."""
+
+        now: datetime = dt_util.utcnow()
+
+        if changed:
+            self.last_change = now
+            self.reason = PollReason.CHANGED
+        elif active:
+            self.reason = PollReason.ACTIVE
+        elif (
+            self.last_change is not None and now - self.last_change < self.recent_window
+        ):
+            self.reason = PollReason.RECENTLY_CHANGED
+        else:
+            self.reason = PollReason.QUIET
+
+        if self.reason == PollReason.QUIET:
+            self.quiet_polls += 1
+            tmp_interval: timedelta = min(
+                self.min_interval * (2 ** min(self.quiet_polls, 16)),
+                self.max_interval,
+            )
+        else:
+            self.quiet_polls = 0
+            tmp_interval = self.min_interval
+
+        self.interval = self._apply_jitter(tmp_interval)
+        return self.interval
+
+    # ------------------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Return scheduler diagnostics."""
+        return {
+            "interval_seconds": round(self.interval.total_seconds(), 1),
+            "reason": str(self.reason),
+            "min_interval_seconds": self.min_interval.total_seconds(),
+            "max_interval_seconds": self.max_interval.total_seconds(),
+            "quiet_polls": self.quiet_polls,
+            "last_change": self.last_change.isoformat() if self.last_change else None,
+        }
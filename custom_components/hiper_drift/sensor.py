@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import Any
+
 from homeassistant.components.sensor import (  # SensorDeviceClass,; SensorEntityDescription,
     SensorEntity,
 )
@@ -10,10 +13,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import CommonConfigEntry
-from .component_api import ComponentApi, IssueItem
 from .const import TRANSLATION_KEY, IssueType
 from .entity import ComponentEntity
-from .hass_util import object_to_state_attr_dict
 
 
 # ------------------------------------------------------
@@ -49,14 +50,11 @@ class HiperIssueSensor(ComponentEntity, SensorEntity):
         """Hiper issue sensor."""
         super().__init__(entry.runtime_data.coordinator, entry)
         self.hass: HomeAssistant = hass
-
-        self.component_api: ComponentApi = entry.runtime_data.component_api
         self.issue_type: IssueType = issue_type
         self._name = str(issue_type)
-        self._unique_id = str(issue_type)
+        self._unique_id = f"{entry.entry_id}_{issue_type}"
 
         self.translation_key = TRANSLATION_KEY
-        self.dummy_attr = object_to_state_attr_dict(IssueItem())
 
     # ------------------------------------------------------
     @property
@@ -71,7 +69,7 @@ class HiperIssueSensor(ComponentEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        """Native value.
+        """Native value, cached per issue version.
 
         Returns:
             str | None: Native value
@@ -79,33 +77,24 @@ class HiperIssueSensor(ComponentEntity, SensorEntity):
         """
 
         if self.issue_type == IssueType.REGIONAL:
-            if self.component_api.latest_issue_regional is None:
-                return None
-            return self.component_api.latest_issue_regional.text[:255]
+            return self.issue_value(self.component_api.latest_issue_regional)
 
-        if self.component_api.latest_issue_general is None:
-            return None
-        return self.component_api.latest_issue_general.text[:255]
+        return self.issue_value(self.component_api.latest_issue_general)
 
     # ------------------------------------------------------
     @property
-    def extra_state_attributes(self) -> dict:
-        """Extra state attributes.
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Extra state attributes, cached per issue version.
 
         Returns:
-            dict: Extra state attributes
+            Mapping[str, Any]: Extra state attributes
 
         """
 
         if self.issue_type == IssueType.REGIONAL:
-            if self.component_api.latest_issue_regional is None:
-                return self.dummy_attr
-            return object_to_state_attr_dict(self.component_api.latest_issue_regional)
-
-        if self.component_api.latest_issue_general is None:
-            return self.dummy_attr
+            return self.issue_attributes(self.component_api.latest_issue_regional)
 
-        return object_to_state_attr_dict(self.component_api.latest_issue_general)
+        return self.issue_attributes(self.component_api.latest_issue_general)
 
     # ------------------------------------------------------
     @property
@@ -134,10 +123,3 @@ class HiperIssueSensor(ComponentEntity, SensorEntity):
     async def async_update(self) -> None:
         """Update the entity. Only used by the generic entity update service."""
         await self.coordinator.async_request_refresh()
-
-    # ------------------------------------------------------
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
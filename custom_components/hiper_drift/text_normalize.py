@@ -0,0 +1,85 @@
+"""Danish aware text normalisation for Hiper drift."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from re import Pattern, compile
+from unicodedata import normalize
+
+# Ascii spellings first, then the letters, so Aabenraa and Åbenrå both fold
+# to abenra. Chained str.replace is several times faster than str.translate
+# with multi character values or a regex substitution.
+_DANISH_FOLDS: tuple[tuple[str, str], ...] = (
+    ("aa", "a"),
+    ("ae", "a"),
+    ("oe", "o"),
+    ("æ", "a"),
+    ("ø", "o"),
+    ("å", "a"),
+)
+_DANISH_FOLDS_CASED: tuple[tuple[str, str], ...] = (
+    ("Aa", "A"),
+    ("AA", "A"),
+    ("Ae", "A"),
+    ("AE", "A"),
+    ("Oe", "O"),
+    ("OE", "O"),
+    ("Æ", "A"),
+    ("Ø", "O"),
+    ("Å", "A"),
+    *_DANISH_FOLDS,
+)
+_COMBINING_RE: Pattern[str] = compile(r"[\u0300-\u036f]")
+_TOKEN_RE: Pattern[str] = compile(r"\w+")
+
+
+# ------------------------------------------------------------------
+def normalize_tokens(text: str, case_sensitive: bool = False) -> list[str]:
+    """Return the Danish folded word tokens of text.
+
+    Case folding (unless case sensitive), æ/ø/å and the aa/ae/oe spellings
+    folded to a/o, other diacritics removed. København, Koebenhavn and
+    Kobenhavn all fold to kobenhavn.
+    """
+
+    if case_sensitive:
+        folds: tuple[tuple[str, str], ...] = _DANISH_FOLDS_CASED
+    else:
+        text = text.casefold()
+        folds = _DANISH_FOLDS
+
+    for old, new in folds:
+        text = text.replace(old, new)
+
+    if not text.isascii():
+        text = _COMBINING_RE.sub("", normalize("NFKD", text))
+
+    return _TOKEN_RE.findall(text)
+
+
+# ------------------------------------------------------------------
+def normalize_word(word: str, case_sensitive: bool = False) -> str:
+    """Return a match word or phrase folded like normalize_tokens."""
+    return " ".join(normalize_tokens(word, case_sensitive))
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True, frozen=True)
+class NormalizedText:
+    """Folded text, as a token set and as space separated tokens.
+
+    The text is padded with a space at both ends, so a phrase can be
+    looked up as a whole word sequence with a plain substring search.
+    """
+
+    text: str
+    tokens: frozenset[str]
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def create(cls, text: str, case_sensitive: bool = False) -> NormalizedText:
+        """Normalize text."""
+
+        tokens: list[str] = normalize_tokens(text, case_sensitive)
+        return cls(f" {' '.join(tokens)} ", frozenset(tokens))
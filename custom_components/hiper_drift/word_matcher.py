@@ -0,0 +1,102 @@
+"""Multi word matcher for Hiper drift."""
+
+from __future__ import annotations
+
+from .text_normalize import NormalizedText, normalize_word
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class WordMatcher:
+    """Match if ALL words in a list are present in a text.
+
+    Words and texts are Danish folded (see normalize_tokens), so Åbenrå
+    matches Aabenraa. Whole words are looked up in the token set of the
+    text, phrases and partial words with a substring search in the folded
+    text. Matching stops at the first missing word.
+
+    - words: A list of words to match, words without letters or digits are
+      ignored.
+    - use_word_boundaries: If True, only matches whole words.
+    - case_sensitive: If False, matches regardless of letter case.
+    """
+
+    def __init__(
+        self,
+        words: list[str],
+        use_word_boundaries: bool = True,
+        case_sensitive: bool = False,
+    ) -> None:
+        """Init."""
+
+        self.use_word_boundaries: bool = use_word_boundaries
+        self.case_sensitive: bool = case_sensitive
+        self.words: list[str] = [
+            word for word in words if self.normalize_word(word) != ""
+        ]
+
+        # Duplicate words only have to be found once
+        self._patterns: list[str] = list(
+            dict.fromkeys(self.normalize_word(word) for word in self.words)
+        )
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def compile(
+        cls,
+        words: list[str] | None,
+        use_word_boundaries: bool = True,
+        case_sensitive: bool = False,
+    ) -> WordMatcher | None:
+        """Return a matcher, or None if there is no match list."""
+
+        if not words:
+            return None
+
+        return cls(words, use_word_boundaries, case_sensitive)
+
+    # ------------------------------------------------------------------
+    def normalize(self, text: str | NormalizedText) -> NormalizedText:
+        """Normalize a text, unless already normalized."""
+
+        if isinstance(text, NormalizedText):
+            return text
+
+        return NormalizedText.create(text, self.case_sensitive)
+
+    # ------------------------------------------------------------------
+    def normalize_word(self, word: str) -> str:
+        """Normalize a match word or phrase."""
+        return normalize_word(word, self.case_sensitive)
+
+    # ------------------------------------------------------------------
+    def contains(self, text: NormalizedText, pattern: str) -> bool:
+        """Return True if text contains pattern, as whole words if required.
+
+        The pattern must already be normalized.
+        """
+
+        if not self.use_word_boundaries:
+            return pattern in text.text
+
+        if " " not in pattern:
+            return pattern in text.tokens
+
+        return f" {pattern} " in text.text
+
+    # ------------------------------------------------------------------
+    def find(self, text: str | NormalizedText) -> list[str]:
+        """Return the words found in text, in match list order."""
+
+        text = self.normalize(text)
+        found: set[str] = {
+            pattern for pattern in self._patterns if self.contains(text, pattern)
+        }
+        return [word for word in self.words if self.normalize_word(word) in found]
+
+    # ------------------------------------------------------------------
+    def match(self, text: str | NormalizedText) -> bool:
+        """Return True if all words are present in text."""
+
+        text = self.normalize(text)
+        return all(self.contains(text, pattern) for pattern in self._patterns)
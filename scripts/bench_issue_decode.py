@@ -0,0 +1,138 @@
+"""Benchmark of DataclassDecoder against DictToObject on parsed issues.
+
+Decodes the regional issues of a synthetic payload into slotted IssueItem
+records and into DictToObject instances, and compares decode time, memory
+per issue and the time of an attribute scan like the one in
+async_check_regional.
+
+json_ext.py is loaded directly so Home Assistant does not have to be
+installed.
+
+Usage: python scripts/bench_issue_decode.py
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import perf_counter
+import tracemalloc
+
+import orjson
+
+from bench_json_ext import DATETIME_FIELDS, load_json_ext, payload
+
+
+# ------------------------------------------------------------------
+# Copies of the records in component_api, which needs Home Assistant
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class MessageItem:
+    """message item."""
+
+    created_at: str | datetime | None = ""
+    message: str | None = ""
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class IssueItem:
+    """Issue item."""
+
+    subject: str | None = ""
+    created_dtm: str | datetime | None = ""
+    area: str | None = ""
+    eta: str | datetime | None = ""
+    region: str | None = ""
+    region_id: int | None = 0
+    is_unfolded: bool | None = False
+    is_pinned: bool | None = False
+    updated_at: str | datetime | None = ""
+    finished_at: str | datetime | None = ""
+    status: str | None = ""
+    messages: list[MessageItem] | None = field(default_factory=list)
+    id: int | str | None = None
+
+    text: str | None = ""
+    markdown: str | None = ""
+
+
+# ------------------------------------------------------------------
+def timed_ms(func, count: int, rounds: int = 5) -> float:
+    """Return the mean time of func in ms, of the fastest round."""
+
+    best: float = float("inf")
+
+    for _ in range(rounds):
+        start: float = perf_counter()
+
+        for _ in range(count):
+            func()
+
+        best = min(best, perf_counter() - start)
+
+    return best / count * 1000
+
+
+# ------------------------------------------------------------------
+def allocated_bytes(func) -> tuple[object, int]:
+    """Return the result of func and the memory it still holds."""
+
+    tracemalloc.start()
+    result = func()
+    allocated: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, allocated
+
+
+# ------------------------------------------------------------------
+def scan(records: list) -> int:
+    """Attribute scan like async_check_regional."""
+
+    found: int = 0
+
+    for record in records:
+        if record.region_id == 3 and record.is_pinned is False:
+            found += len(record.subject) + len(record.area)
+
+    return found
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    json_ext = load_json_ext()
+    decoder = json_ext.DataclassDecoder.get(IssueItem)
+    dict_to_object_cls = json_ext.DictToObject
+
+    print("per payload, regional issues")
+    print("  issues  decode ms  bytes/issue  scan ns/issue   record")
+
+    for count in (100, 1000, 5000):
+        parsed: dict = orjson.loads(payload(count))
+        json_ext.JsonExt().decode_datetimes(parsed, DATETIME_FIELDS)
+        items: list[dict] = parsed["regional"]
+        repeat: int = max(2, 5000 // count)
+
+        cases: list[tuple[str, object]] = [
+            (
+                "DictToObject",
+                lambda items=items: [dict_to_object_cls(i) for i in items],
+            ),
+            ("DataclassDecoder", lambda items=items: decoder.decode_list(items)),
+        ]
+
+        for name, decode in cases:
+            records, allocated = allocated_bytes(decode)
+            assert scan(records) == scan(decoder.decode_list(items)), "result differs"
+
+            decode_ms: float = timed_ms(decode, repeat)
+            scan_ms: float = timed_ms(lambda records=records: scan(records), repeat)
+            print(
+                f"  {count:6d}  {decode_ms:9.2f}  {allocated / count:11.0f}"
+                f"  {scan_ms * 1e6 / count:13.0f}   {name}"
+            )
+
+
+if __name__ == "__main__":
+    main()
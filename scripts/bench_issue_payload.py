@@ -0,0 +1,134 @@
+"""Benchmark of reading and parsing the issues response, 10 KB to 10 MB.
+
+Compares the former path, response.text() and json.loads with a datetime
+object_hook, with the streamed path: 64 KB chunks into a bounded bytearray,
+hashed on the way and parsed as bytes by JsonExt. The response is simulated
+by feeding byte chunks, so aiohttp and Home Assistant are not needed.
+Reports the mean time and the peak memory allocated by each path.
+
+Usage: python scripts/bench_issue_payload.py
+"""
+
+from hashlib import blake2b
+import json
+from time import perf_counter
+import tracemalloc
+
+from bench_json_ext import DATETIME_FIELDS, StdlibJsonExt, load_json_ext, payload
+
+# Same limits as IssuesHub
+MAX_PAYLOAD_SIZE: int = 4 * 1024 * 1024
+READ_CHUNK_SIZE: int = 64 * 1024
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class PayloadTooLargeException(Exception):
+    """Payload too large exception."""
+
+
+# ------------------------------------------------------------------
+def iter_chunked(body: bytes, chunk_size: int = READ_CHUNK_SIZE):
+    """Yield the body in chunks, like StreamReader.iter_chunked."""
+
+    for pos in range(0, len(body), chunk_size):
+        yield body[pos : pos + chunk_size]
+
+
+# ------------------------------------------------------------------
+def read_text(body: bytes) -> tuple[str, bytes]:
+    """The former response.text() path, hashed after decoding."""
+
+    text: str = b"".join(iter_chunked(body)).decode("utf-8")
+    return text, blake2b(text.encode(), digest_size=16).digest()
+
+
+# ------------------------------------------------------------------
+def read_payload(body: bytes) -> tuple[bytearray, bytes]:
+    """The loop of IssuesHub._async_read_payload."""
+
+    payload_buffer: bytearray = bytearray()
+    payload_hash = blake2b(digest_size=16)
+
+    for chunk in iter_chunked(body):
+        if len(payload_buffer) + len(chunk) > MAX_PAYLOAD_SIZE:
+            raise PayloadTooLargeException(f"Payload exceeds {MAX_PAYLOAD_SIZE} bytes")
+
+        payload_buffer += chunk
+        payload_hash.update(chunk)
+
+    return payload_buffer, payload_hash.digest()
+
+
+# ------------------------------------------------------------------
+def measure(func, count: int) -> tuple[float, float]:
+    """Return the mean time in ms and the peak memory in MB of func."""
+
+    start: float = perf_counter()
+
+    for _ in range(count):
+        func()
+
+    elapsed: float = (perf_counter() - start) / count * 1000
+
+    tracemalloc.start()
+    func()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return elapsed, peak / 1024 / 1024
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    reference: StdlibJsonExt = StdlibJsonExt()
+    json_ext = load_json_ext().JsonExt()
+
+    # ----------------------------------------
+    def former(body: bytes) -> dict:
+        text, _payload_hash = read_text(body)
+        return json.loads(text, object_hook=reference._decoder)
+
+    # ----------------------------------------
+    def streamed(body: bytes) -> dict:
+        payload_buffer, _payload_hash = read_payload(body)
+        return json_ext.json_str_to_dict(
+            payload_buffer, datetime_fields=DATETIME_FIELDS
+        )
+
+    print("ms and peak MB per response, read + hash + parse")
+    print("      size   former ms  peak MB   streamed ms  peak MB")
+
+    for count in (7, 70, 700, 7000):
+        body: bytes = payload(count)
+        repeat: int = max(1, 5_000_000 // len(body))
+        former_ms, former_mb = measure(lambda body=body: former(body), repeat)
+
+        try:
+            assert former(body) == streamed(body), "output differs"
+        except PayloadTooLargeException:
+            start: float = perf_counter()
+
+            try:
+                read_payload(body)
+            except PayloadTooLargeException:
+                pass
+
+            print(
+                f"  {len(body) / 1000:6.0f} KB  {former_ms:9.2f}  {former_mb:7.1f}"
+                f"   rejected after {(perf_counter() - start) * 1000:.2f} ms"
+                f" at {MAX_PAYLOAD_SIZE // 1024 // 1024} MB"
+            )
+            continue
+
+        streamed_ms, streamed_mb = measure(lambda body=body: streamed(body), repeat)
+        print(
+            f"  {len(body) / 1000:6.0f} KB  {former_ms:9.2f}  {former_mb:7.1f}"
+            f"   {streamed_ms:11.2f}  {streamed_mb:7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
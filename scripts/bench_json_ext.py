@@ -0,0 +1,288 @@
+"""Benchmarks of JsonExt on synthetic issue payloads.
+
+Compares the orjson parse with datetime conversion afterwards against the
+former stdlib json.loads with a datetime object_hook, and the datetime
+detection in decode_datetimes against running the ISO8601 regex on every
+string. Checks that the output is identical.
+
+Only needs orjson, json_ext.py is loaded directly so Home Assistant does not
+have to be installed.
+
+Usage: python scripts/bench_json_ext.py
+"""
+
+from contextlib import suppress
+from datetime import datetime
+from functools import partial
+import importlib.util
+import json
+from pathlib import Path
+import random
+from re import compile
+from time import perf_counter
+
+import orjson
+
+JSON_EXT_PATH: Path = (
+    Path(__file__).parent.parent
+    / "custom_components"
+    / "hiper_drift"
+    / "hass_util"
+    / "json_ext.py"
+)
+
+TOWNS: list[str] = [
+    "Aabenraa",
+    "København",
+    "Odense",
+    "Århus",
+    "Ålborg",
+    "Esbjerg",
+    "Randers",
+    "Kolding",
+    "Horsens",
+    "Vejle",
+    "Roskilde",
+    "Herning",
+    "Silkeborg",
+    "Næstved",
+    "Fredericia",
+    "Viborg",
+    "Køge",
+    "Holstebro",
+    "Taastrup",
+    "Slagelse",
+]
+MAP_KEYS: dict[str, str] = {
+    "global": "globals",
+    "regional": "regionals",
+    "finished": "finisheds",
+}
+DATETIME_FIELDS: set[str] = {
+    "created_dtm",
+    "created_at",
+    "updated_at",
+    "finished_at",
+    "eta",
+}
+
+
+# ------------------------------------------------------------------
+def load_json_ext():
+    """Load json_ext.py without the hass_util package."""
+
+    spec = importlib.util.spec_from_file_location("json_ext", JSON_EXT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ------------------------------------------------------------------
+def issue(issue_id: int, rnd: random.Random) -> dict:
+    """Return a synthetic issue."""
+
+    timestamp: str = (
+        f"2025-0{rnd.randint(1, 9)}-1{rnd.randint(0, 9)}T1{rnd.randint(0, 9)}:"
+        f"{rnd.randint(10, 59)}:{rnd.randint(10, 59)}.000000Z"
+    )
+    return {
+        "id": issue_id,
+        "subject": f"Nedbrud på fiberforbindelse {issue_id} i {rnd.choice(TOWNS)}",
+        "created_dtm": timestamp,
+        "area": ", ".join(rnd.sample(TOWNS, 8))
+        + " og omegn - berørte kunder kan opleve ustabil forbindelse",
+        "eta": "I løbet af dagen",
+        "region": "Jylland",
+        "region_id": rnd.randint(1, 3),
+        "is_unfolded": bool(issue_id % 2),
+        "is_pinned": False,
+        "updated_at": timestamp,
+        "finished_at": None,
+        "status": "Under udbedring",
+        "messages": [
+            {
+                "created_at": timestamp,
+                "message": "Vores teknikere arbejder på sagen og vi forventer "
+                "snart en løsning. " * 2,
+            }
+            for _ in range(2)
+        ],
+    }
+
+
+# ------------------------------------------------------------------
+def payload(regional_count: int, seed: int = 1) -> bytes:
+    """Return a synthetic issues feed payload."""
+
+    rnd: random.Random = random.Random(seed)
+    return json.dumps(
+        {
+            "global": [issue(i, rnd) for i in range(max(1, regional_count // 20))],
+            "regional": [issue(i, rnd) for i in range(regional_count)],
+            "finished": [issue(i, rnd) for i in range(regional_count // 2)],
+        },
+        ensure_ascii=False,
+    ).encode()
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class StdlibJsonExt:
+    """The former json.loads with object_hook path, as reference."""
+
+    _match_iso8601 = compile(
+        r"^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-(3[01]|0[1-9]|[12][0-9])T(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])?$"
+    ).match
+
+    # ------------------------------------------------------------------
+    def _decoder(self, obj: dict) -> dict:
+        for key, value in obj.items():
+            if isinstance(value, str) and self._match_iso8601(value) is not None:
+                with suppress(ValueError, AttributeError, TypeError):
+                    obj[key] = datetime.fromisoformat(value)
+
+        return obj
+
+    # ------------------------------------------------------------------
+    def decode_datetimes(self, data) -> None:
+        """Run the regex on every string value of all nested dicts."""
+
+        stack: list = [data]
+
+        while stack:
+            obj = stack.pop()
+
+            if isinstance(obj, dict):
+                self._decoder(obj)
+                stack.extend(
+                    value for value in obj.values() if isinstance(value, dict | list)
+                )
+            elif isinstance(obj, list):
+                stack.extend(obj)
+
+    # ------------------------------------------------------------------
+    def change_nested_keys(self, data, map_keys: dict):
+        """Change nested keys, exact keys only."""
+
+        if isinstance(data, dict):
+            return {
+                map_keys.get(key, key): self.change_nested_keys(value, map_keys)
+                for key, value in data.items()
+            }
+
+        if isinstance(data, list):
+            return [self.change_nested_keys(item, map_keys) for item in data]
+
+        return data
+
+    # ------------------------------------------------------------------
+    def json_str_to_dict(self, json_str: bytes, map_keys: dict) -> dict:
+        """Json str to dict."""
+        return self.change_nested_keys(
+            json.loads(json_str, object_hook=self._decoder), map_keys
+        )
+
+
+# ------------------------------------------------------------------
+def timed_ms(func, data_size: int) -> float:
+    """Return the mean time of func in ms."""
+
+    count: int = max(3, 4_000_000 // data_size)
+    start: float = perf_counter()
+
+    for _ in range(count):
+        func()
+
+    return (perf_counter() - start) / count * 1000
+
+
+# ------------------------------------------------------------------
+def bench_json_str_to_dict(json_ext) -> None:
+    """Benchmark json_str_to_dict."""
+
+    reference: StdlibJsonExt = StdlibJsonExt()
+    new = json_ext.JsonExt()
+
+    print("json_str_to_dict, ms per payload")
+    print("  issues     size  stdlib+hook  orjson+walk  orjson+fields")
+
+    for count in (20, 100, 1000):
+        data: bytes = payload(count)
+
+        assert (
+            reference.json_str_to_dict(data, MAP_KEYS)
+            == new.json_str_to_dict(data, MAP_KEYS)
+            == new.json_str_to_dict(data, MAP_KEYS, DATETIME_FIELDS)
+        ), "output differs"
+
+        times: list[float] = [
+            timed_ms(partial(reference.json_str_to_dict, data, MAP_KEYS), len(data)),
+            timed_ms(partial(new.json_str_to_dict, data, MAP_KEYS), len(data)),
+            timed_ms(
+                partial(new.json_str_to_dict, data, MAP_KEYS, DATETIME_FIELDS),
+                len(data),
+            ),
+        ]
+        print(
+            f"  {count:6d} {len(data) / 1000:6.0f} KB"
+            f"  {times[0]:11.2f}  {times[1]:11.2f}  {times[2]:13.2f}"
+        )
+
+
+# ------------------------------------------------------------------
+def bench_decode_datetimes(json_ext) -> None:
+    """Benchmark decode_datetimes on already parsed data."""
+
+    data: bytes = payload(1000)
+    reference: StdlibJsonExt = StdlibJsonExt()
+    new_cls = json_ext.JsonExt
+
+    expected = orjson.loads(data)
+    reference.decode_datetimes(expected)
+
+    for datetime_fields in (None, DATETIME_FIELDS):
+        result = orjson.loads(data)
+        new_cls().decode_datetimes(result, datetime_fields)
+        assert result == expected, "output differs"
+
+    # ----------------------------------------
+    def cold(parsed) -> None:
+        new_cls._datetime_cache.clear()
+        new_cls().decode_datetimes(parsed)
+
+    cases: list[tuple[str, object]] = [
+        ("regex on every string", reference.decode_datetimes),
+        ("shape check, cold cache", cold),
+        ("shape check, warm cache", lambda parsed: new_cls().decode_datetimes(parsed)),
+        (
+            "warm cache + datetime_fields",
+            lambda parsed: new_cls().decode_datetimes(parsed, DATETIME_FIELDS),
+        ),
+    ]
+
+    print(f"decode_datetimes, 1000 issues, {len(data) / 1000:.0f} KB")
+
+    for name, func in cases:
+        total: float = 0.0
+
+        for _ in range(10):
+            parsed = orjson.loads(data)
+            start: float = perf_counter()
+            func(parsed)
+            total += perf_counter() - start
+
+        print(f"  {name:30s} {total / 10 * 1000:7.2f} ms")
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmarks."""
+
+    json_ext = load_json_ext()
+    bench_json_str_to_dict(json_ext)
+    print()
+    bench_decode_datetimes(json_ext)
+
+
+if __name__ == "__main__":
+    main()
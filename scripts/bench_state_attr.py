@@ -0,0 +1,187 @@
+"""Benchmark of StateAttrConverter against the former object_to_state_attr_dict.
+
+Converts objects with 10 to 200 attributes, plain objects with a __dict__
+and slotted dataclasses, with every 5th attribute excluded. The former
+function scanned the exclude list and rebuilt the display key for every
+attribute on every call, and the slot names on every call for slotted
+objects. Checks that both return the same dict, then shows the nesting
+and the max_items and max_depth limits of the converter.
+
+state_attr.py is loaded directly so Home Assistant does not have to be
+installed.
+
+Usage: python scripts/bench_state_attr.py
+"""
+
+from dataclasses import dataclass, field, make_dataclass
+from functools import partial
+import importlib.util
+from pathlib import Path
+import sys
+from time import perf_counter
+import types
+
+HASS_UTIL_PATH: Path = (
+    Path(__file__).parent.parent / "custom_components" / "hiper_drift" / "hass_util"
+)
+
+
+# ------------------------------------------------------------------
+def load_state_attr() -> types.ModuleType:
+    """Load state_attr.py without the hass_util package."""
+
+    package: types.ModuleType = types.ModuleType("hass_util")
+    package.__path__ = [str(HASS_UTIL_PATH)]
+    sys.modules["hass_util"] = package
+
+    spec = importlib.util.spec_from_file_location(
+        "hass_util.state_attr", HASS_UTIL_PATH / "state_attr.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["hass_util.state_attr"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ------------------------------------------------------------------
+# The former implementation, for reference
+# ------------------------------------------------------------------
+def former_get_slots(cls: type) -> list[str]:
+    """Return slot names of a class and its bases."""
+
+    return [
+        slot
+        for tmp_cls in reversed(cls.__mro__)
+        for slot in getattr(tmp_cls, "__slots__", ())
+        if slot not in ("__dict__", "__weakref__")
+    ]
+
+
+# ------------------------------------------------------------------
+def former_object_to_state_attr_dict(
+    obj: object, exclude_list: list, exlude_underscore_attrs: bool = True
+) -> dict:
+    """Convert object to hass state attribute dict."""
+    state_attr_dict: dict = {}
+
+    if obj is None:
+        return state_attr_dict
+
+    if hasattr(obj, "__dict__"):
+        tmp_items = obj.__dict__.items()
+    else:
+        tmp_items = ((key, getattr(obj, key)) for key in former_get_slots(type(obj)))
+
+    for key, value in tmp_items:
+        if key in exclude_list:
+            continue
+
+        if exlude_underscore_attrs and key.startswith("_"):
+            continue
+
+        state_attr_dict[key.lower().replace("_", " ")] = value
+
+    return state_attr_dict
+
+
+# ------------------------------------------------------------------
+def plain_class(size: int) -> type:
+    """Return a class with size attributes in its __dict__ and a private one."""
+
+    # ----------------------------------------
+    def init(self) -> None:
+        for index in range(size):
+            setattr(self, f"Attr_Name_{index}", index)
+
+        self._private = True
+
+    return type(f"Plain{size}", (), {"__init__": init})
+
+
+# ------------------------------------------------------------------
+def slots_class(size: int) -> type:
+    """Return a slotted dataclass with size fields."""
+
+    return make_dataclass(
+        f"Slots{size}",
+        [(f"attr_name_{index}", int, field(default=index)) for index in range(size)],
+        slots=True,
+    )
+
+
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class MessageItem:
+    """Message item."""
+
+    created_at: str = "2026-10-18T10:00:00+00:00"
+    message: str = "Vi arbejder på sagen"
+
+
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class NestedItem:
+    """Issue like object with a long list and a deep dict."""
+
+    subject: str = "Nedbrud i Århus"
+    messages: list[MessageItem] = field(
+        default_factory=lambda: [MessageItem() for _ in range(150)]
+    )
+    meta: dict = field(default_factory=lambda: {"a": {"b": {"c": {"d": {"e": 1}}}}})
+
+
+# ------------------------------------------------------------------
+def timed_us(func, count: int, rounds: int = 5) -> float:
+    """Return the mean time of func in µs, of the fastest round."""
+
+    best: float = float("inf")
+
+    for _ in range(rounds):
+        start: float = perf_counter()
+
+        for _ in range(count):
+            func()
+
+        best = min(best, perf_counter() - start)
+
+    return best / count * 1e6
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    state_attr = load_state_attr()
+
+    print("µs per object")
+    print("  attrs  kind    former µs  converter µs  speedup")
+
+    for size in (10, 50, 200):
+        for kind, cls in (("dict", plain_class(size)), ("slots", slots_class(size))):
+            obj = cls()
+            exclude_list: list[str] = [
+                name
+                for index in range(0, size, 5)
+                for name in (f"Attr_Name_{index}", f"attr_name_{index}")
+            ]
+            former = partial(former_object_to_state_attr_dict, obj, exclude_list)
+            converter = partial(state_attr.object_to_state_attr_dict, obj, exclude_list)
+            assert former() == converter(), "result differs"
+
+            repeat: int = max(1000, 100000 // size)
+            former_us: float = timed_us(former, repeat)
+            converter_us: float = timed_us(converter, repeat)
+            print(
+                f"  {size:5d}  {kind:5s}  {former_us:11.2f}  {converter_us:12.2f}"
+                f"  {former_us / converter_us:6.1f}x"
+            )
+
+    nested: dict = state_attr.object_to_state_attr_dict(NestedItem())
+    print()
+    print(f"messages kept of 150: {len(nested['messages'])}")
+    print(f"first message: {nested['messages'][0]}")
+    print(f"meta past max_depth: {nested['meta']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark of the StorageJson codecs, OrjsonCodec against JsonPickleCodec.
+
+Writes and reads a state object with a list and a dict of n entries each,
+the way StorageJson and the Home Assistant Store do it: the codec encodes
+the object and the data is dumped to json, and on read the json is loaded
+and the codec decodes it into attributes. Checks that both codecs restore
+the same values.
+
+storage_codec.py and json_ext.py are loaded directly so Home Assistant does
+not have to be installed. Needs orjson and jsonpickle.
+
+Usage: python scripts/bench_storage_codec.py
+"""
+
+from dataclasses import dataclass, field
+import importlib.util
+from pathlib import Path
+import sys
+from time import perf_counter
+import types
+
+import orjson
+
+HASS_UTIL_PATH: Path = (
+    Path(__file__).parent.parent / "custom_components" / "hiper_drift" / "hass_util"
+)
+
+
+# ------------------------------------------------------------------
+def load_codec_module() -> types.ModuleType:
+    """Load storage_codec.py and json_ext.py without the hass_util package."""
+
+    package: types.ModuleType = types.ModuleType("hass_util")
+    package.__path__ = [str(HASS_UTIL_PATH)]
+    sys.modules["hass_util"] = package
+
+    for name in ("json_ext", "storage_codec"):
+        spec = importlib.util.spec_from_file_location(
+            f"hass_util.{name}", HASS_UTIL_PATH / f"{name}.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[f"hass_util.{name}"] = module
+        spec.loader.exec_module(module)
+
+    return sys.modules["hass_util.storage_codec"]
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(eq=False)
+class LargeState:
+    """State object with a schema, like the StorageJson subclasses."""
+
+    names: list[str] = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+    updated_at: str = ""
+    is_on: bool = False
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def create(cls, size: int) -> "LargeState":
+        """Return a state object with size list and dict entries."""
+
+        return cls(
+            names=[f"Nedbrud {index} i Århus og omegn" for index in range(size)],
+            counts={f"region {index}": index for index in range(size)},
+            updated_at="2026-10-18T10:00:00+00:00",
+            is_on=True,
+        )
+
+
+# ------------------------------------------------------------------
+def timed_ms(func, count: int, rounds: int = 5) -> float:
+    """Return the mean time of func in ms, of the fastest round."""
+
+    best: float = float("inf")
+
+    for _ in range(rounds):
+        start: float = perf_counter()
+
+        for _ in range(count):
+            func()
+
+        best = min(best, perf_counter() - start)
+
+    return best / count * 1000
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    storage_codec = load_codec_module()
+
+    if not storage_codec.JsonPickleCodec.available():
+        sys.exit("jsonpickle is not installed")
+
+    print("ms per write and read, bytes written")
+    print("   entries  codec        write ms   read ms     bytes")
+
+    for size in (100, 1000, 10000):
+        state: LargeState = LargeState.create(size)
+        repeat: int = max(2, 20000 // size)
+
+        for codec in (storage_codec.JsonPickleCodec(), storage_codec.OrjsonCodec()):
+            raw: bytes = orjson.dumps(codec.encode(state))
+
+            # ----------------------------------------
+            def write(codec=codec, state=state) -> bytes:
+                return orjson.dumps(codec.encode(state))
+
+            # ----------------------------------------
+            def read(codec=codec, raw=raw) -> dict | None:
+                return codec.decode(LargeState, orjson.loads(raw))
+
+            restored: dict | None = read()
+            assert restored is not None, "nothing restored"
+            assert {name: restored[name] for name in vars(state)} == vars(state), (
+                "restored values differ"
+            )
+
+            print(
+                f"  {size:8d}  {codec.DICT_KEY:10s}  {timed_ms(write, repeat):8.2f}"
+                f"  {timed_ms(read, repeat):8.2f}  {len(raw):8d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark of WordMatcher against the former lookahead regex.
+
+All words but the last are present in the text, so neither side can stop
+early. Timed both on raw text and on text normalized once up front, which
+is how issues are matched after a reload.
+
+word_matcher.py and text_normalize.py are loaded directly so Home Assistant
+does not have to be installed.
+
+Usage: python scripts/bench_word_matcher.py
+"""
+
+from functools import partial
+import importlib.util
+from pathlib import Path
+import random
+from re import IGNORECASE, Pattern, compile, escape
+import sys
+from time import perf_counter
+import types
+
+COMPONENT_PATH: Path = (
+    Path(__file__).parent.parent / "custom_components" / "hiper_drift"
+)
+
+
+# ------------------------------------------------------------------
+def load_matcher_modules() -> types.ModuleType:
+    """Load word_matcher.py and its sibling without the integration package."""
+
+    package: types.ModuleType = types.ModuleType("hiper_drift")
+    package.__path__ = [str(COMPONENT_PATH)]
+    sys.modules["hiper_drift"] = package
+
+    for name in ("text_normalize", "word_matcher"):
+        spec = importlib.util.spec_from_file_location(
+            f"hiper_drift.{name}", COMPONENT_PATH / f"{name}.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[f"hiper_drift.{name}"] = module
+        spec.loader.exec_module(module)
+
+    return sys.modules["hiper_drift.word_matcher"]
+
+
+# ------------------------------------------------------------------
+def compile_all_words_regex(
+    words: list[str],
+    use_word_boundaries: bool = True,
+    case_sensitive: bool = False,
+) -> Pattern[str]:
+    """The former ComponentApi.compile_all_words_regex, as reference."""
+
+    lookaheads: list[str] = [
+        rf"(?=.*\b{escape(word)}\b)"
+        if use_word_boundaries
+        else rf"(?=.*{escape(word)})"
+        for word in words
+        if word.strip() != ""
+    ]
+    flags: int = 0 if case_sensitive else IGNORECASE
+    return compile("^" + "".join(lookaheads) + ".*", flags)
+
+
+# ------------------------------------------------------------------
+def timed_us(func, count: int) -> float:
+    """Return the mean time of func in us."""
+
+    start: float = perf_counter()
+
+    for _ in range(count):
+        func()
+
+    return (perf_counter() - start) / count * 1_000_000
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    word_matcher = load_matcher_modules()
+    normalized_text_cls = sys.modules["hiper_drift.text_normalize"].NormalizedText
+
+    rnd: random.Random = random.Random(5)
+    streets: list[str] = [
+        f"{rnd.choice(['Nørre', 'Søndre', 'Vester', 'Øster', 'Lille', 'Store'])}"
+        f"{rnd.choice(['gade', 'vej', 'allé', 'stræde'])}{index}"
+        for index in range(200)
+    ]
+
+    print("us per match")
+    print("  words  chars    regex  matcher  normalized")
+
+    for word_count in (1, 5, 20, 50):
+        words: list[str] = rnd.sample(streets, word_count)
+
+        for length in (100, 1000, 5000):
+            parts: list[str] = []
+
+            while len(" ".join(parts)) < length:
+                parts.append(rnd.choice(streets))
+
+            text: str = " ".join(parts + words[:-1])
+            regex: Pattern[str] = compile_all_words_regex(words)
+            matcher = word_matcher.WordMatcher(words)
+            normalized = normalized_text_cls.create(text)
+
+            assert (
+                (regex.match(text) is not None)
+                == matcher.match(text)
+                == matcher.match(normalized)
+            ), "result differs"
+
+            count: int = max(5, 20000 // (word_count * length // 50 + 1))
+            print(
+                f"  {word_count:5d} {len(text):6d}"
+                f" {timed_us(partial(regex.match, text), count):8.1f}"
+                f" {timed_us(partial(matcher.match, text), count):8.1f}"
+                f" {timed_us(partial(matcher.match, normalized), count):11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Correctness suite for the Danish aware word matching.
+
+Town and place names, single words and prefixed phrases like "Nørre Aaby",
+are matched against issue texts in many spellings: upper/lower case,
+ae/æ, oe/o/ø, aa/a/å and decomposed unicode. Every spelling must match,
+and a name must not match inside a longer word.
+
+The folds are lossy, so distinct names can fold to the same text. Those
+collisions are listed, both among the names below and for known word
+pairs, with whether the matcher accepts one for the other.
+
+The bundled town_names.txt holds 349 real names: larger towns, islands
+and Copenhagen districts. It is not the full DAGI/DAWA gazetteer. With the
+prefixes that gives about 3,100 names and 23,000 spellings. Pass a file
+with one name per line, like a DAWA town name export, to run the suite on
+that instead.
+
+word_matcher.py and text_normalize.py are loaded directly so Home Assistant
+does not have to be installed. Exits with 1 if a spelling is missed.
+
+Usage: python scripts/check_town_names.py [town names file]
+"""
+
+import importlib.util
+from pathlib import Path
+import sys
+import types
+import unicodedata
+
+COMPONENT_PATH: Path = (
+    Path(__file__).parent.parent / "custom_components" / "hiper_drift"
+)
+
+TOWN_NAMES_PATH: Path = Path(__file__).with_name("town_names.txt")
+PREFIXES: tuple[str, ...] = (
+    "Nørre",
+    "Sønder",
+    "Øster",
+    "Vester",
+    "Store",
+    "Lille",
+    "Ny",
+    "Gammel",
+)
+
+# Distinct words the folds make equal
+KNOWN_COLLISIONS: tuple[tuple[str, str], ...] = (
+    ("Kær", "Kar"),
+    ("Michael", "Michal"),
+    ("Israel", "Isral"),
+    ("Bøg", "Bog"),
+    ("Sø", "So"),
+    ("Mølle", "Molle"),
+    ("Aero", "Ærø"),
+)
+
+
+# ------------------------------------------------------------------
+def load_matcher_modules() -> tuple[types.ModuleType, types.ModuleType]:
+    """Load word_matcher.py and its sibling without the integration package."""
+
+    package: types.ModuleType = types.ModuleType("hiper_drift")
+    package.__path__ = [str(COMPONENT_PATH)]
+    sys.modules["hiper_drift"] = package
+
+    for name in ("text_normalize", "word_matcher"):
+        spec = importlib.util.spec_from_file_location(
+            f"hiper_drift.{name}", COMPONENT_PATH / f"{name}.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[f"hiper_drift.{name}"] = module
+        spec.loader.exec_module(module)
+
+    return sys.modules["hiper_drift.text_normalize"], sys.modules[
+        "hiper_drift.word_matcher"
+    ]
+
+
+# ------------------------------------------------------------------
+def spellings(name: str) -> set[str]:
+    """Return the spellings of a name that must match it."""
+
+    result: set[str] = {name, name.upper(), name.lower()}
+    # The ascii spellings of the letters
+    replacements: list[tuple[str, tuple[str, ...]]] = [
+        ("æ", ("ae", "æ")),
+        ("ø", ("oe", "o", "ø")),
+        ("å", ("aa", "a", "å")),
+    ]
+
+    for ae in replacements[0][1]:
+        for oe in replacements[1][1]:
+            for aa in replacements[2][1]:
+                spelling: str = name
+                for letter, value in (("æ", ae), ("ø", oe), ("å", aa)):
+                    spelling = spelling.replace(letter, value).replace(
+                        letter.upper(), value.capitalize()
+                    )
+                result |= {spelling, spelling.lower(), spelling.upper()}
+
+    # Aa spelled with the letter
+    result.add(name.replace("aa", "å").replace("Aa", "Å"))
+    result.add(unicodedata.normalize("NFD", name))
+    return result
+
+
+# ------------------------------------------------------------------
+def load_towns(path: Path) -> list[str]:
+    """Return the distinct names in a file, one per line."""
+
+    with path.open(encoding="utf-8") as names_file:
+        return sorted({line.strip() for line in names_file if line.strip()})
+
+
+# ------------------------------------------------------------------
+def main() -> int:
+    """Run the suite."""
+
+    text_normalize, word_matcher = load_matcher_modules()
+    towns: list[str] = load_towns(
+        Path(sys.argv[1]) if len(sys.argv) > 1 else TOWN_NAMES_PATH
+    )
+    names: list[str] = towns + [
+        f"{prefix} {town}" for prefix in PREFIXES for town in towns
+    ]
+
+    checked: int = 0
+    misses: list[tuple[str, str]] = []
+    partial_hits: list[str] = []
+
+    for name in names:
+        matcher = word_matcher.WordMatcher([name])
+
+        for spelling in spellings(name):
+            checked += 1
+
+            if not matcher.match(f"Nedbrud i {spelling}, og omegn"):
+                misses.append((name, spelling))
+
+        if matcher.match(f"Nedbrud på {name}vej 3"):
+            partial_hits.append(name)
+
+    print(f"{len(names)} names, {checked} spellings, {len(misses)} missed")
+
+    for name, spelling in misses[:20]:
+        print(f"  missed: {name!r} as {spelling!r}")
+
+    print(f"{len(partial_hits)} names matched inside a longer word")
+
+    for name in partial_hits[:20]:
+        print(f"  partial: {name!r}")
+
+    folded: dict[str, list[str]] = {}
+
+    for town in towns:
+        folded.setdefault(text_normalize.normalize_word(town), []).append(town)
+
+    collisions: list[list[str]] = [group for group in folded.values() if len(group) > 1]
+    print(f"{len(collisions)} groups of names folding to the same text:")
+
+    for group in collisions:
+        print(f"  {' = '.join(group)}")
+
+    print("Known distinct words the matcher accepts for each other:")
+
+    for word, other in KNOWN_COLLISIONS:
+        accepted: bool = word_matcher.WordMatcher([word]).match(f"Nedbrud i {other}")
+        print(
+            f"  {word!r} matches {other!r}: {'yes' if accepted else 'no'}"
+            f" ({text_normalize.normalize_word(word)!r},"
+            f" {text_normalize.normalize_word(other)!r})"
+        )
+
+    return 1 if misses or partial_hits else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())